@@ -0,0 +1,11 @@
+"""Helpers shared by the benchmarks, which are run as scripts from this directory."""
+import time
+
+
+def timeit(label: str, func, count: int, unit: str = 'obj', width: int = 24) -> float:
+    """Run `func` once, print its duration and the rate of its `count` items. Return the duration in seconds."""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<{width}} {elapsed:8.3f}s {count / elapsed:>14,.0f} {unit}/s")
+    return elapsed
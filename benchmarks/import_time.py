@@ -0,0 +1,64 @@
+"""
+    Import time of `models` for typical statements, measured in fresh interpreters with `python -X importtime`.
+        python benchmarks/import_time.py [runs]
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = [
+    "import models",
+    "from models import Model",
+    "from models import Field, Model, datatypes as dt; dt.VARCHAR, dt.BIGINT",
+    "from models import Server",
+    "from models import *"
+]
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Cumulative microseconds of the top level imports of `statement`, by module name."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=ROOT,
+        env={**os.environ, 'PYTHONPATH': ROOT},
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    times = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or line.endswith('| imported package'):
+            continue
+
+        _, cumulative, name = line[len('import time:'):].split('|')
+
+        # nested imports are indented under their importer, which already counts them.
+        if not name.startswith('  ') and cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def main(runs: int = 10) -> None:
+    startup = set(_import_times('pass'))
+
+    for statement in STATEMENTS:
+        best = None
+        modules = None
+
+        for _ in range(runs):
+            times = {name: value for name, value in _import_times(statement).items() if name not in startup}
+            total = sum(times.values())
+
+            if best is None or total < best:
+                best = total
+                modules = times
+
+        print(f"{statement:<74} {best / 1000:8.2f}ms {len(modules):>4} top level imports")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,56 @@
+"""
+    Compare the generated `to_json` / `from_json` methods with the reflective stdlib approach.
+        python benchmarks/json_codecs.py [count]
+"""
+import json
+import sys
+from datetime import datetime
+
+from models import Field, Model, PythonOptions, Server
+from models import datatypes as dt
+
+from _util import timeit
+
+MODEL = Model('Measure', [
+    Field('id', dt.BIGINT(20)),
+    Field('sensor', dt.VARCHAR(64)),
+    Field('active', dt.BOOLEAN),
+    Field('value', dt.DOUBLE(16, 4)),
+    Field('count', dt.INTEGER(11)),
+    Field('taken', dt.DATETIME(0))
+])
+
+
+def _stdlib_dumps(obj) -> str:
+    data = dict(obj.__dict__)
+    data['taken'] = data['taken'].isoformat()
+    return json.dumps(data)
+
+
+def _stdlib_loads(cls, text: str):
+    data = json.loads(text)
+    data['taken'] = datetime.fromisoformat(data['taken'])
+    return cls(**data)
+
+
+def main(count: int = 1_000_000) -> None:
+    namespace = {}
+    exec(str(Server.model_class(MODEL, PythonOptions(json=True))), namespace)
+    cls = namespace[MODEL.name]
+
+    now = datetime(2020, 1, 1, 12, 30)
+    objects = [cls(index, f"sensor-{index % 100}", bool(index & 1), index / 7, index % 1000, now)
+               for index in range(count)]
+
+    texts = []
+    reference = timeit("stdlib json.dumps", lambda: texts.extend(map(_stdlib_dumps, objects)), count)
+    generated = timeit("generated to_json", lambda: list(map(cls.to_json, objects)), count)
+    print(f"{'encode speedup':<24} {reference / generated:8.2f}x")
+
+    reference = timeit("stdlib json.loads", lambda: [_stdlib_loads(cls, text) for text in texts], count)
+    generated = timeit("generated from_json", lambda: list(map(cls.from_json, texts)), count)
+    print(f"{'decode speedup':<24} {reference / generated:8.2f}x")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,49 @@
+"""
+    Compare the generation of models sharing a few shapes with and without the `Templates` of the serializers.
+        python benchmarks/templates.py [count]
+"""
+import sys
+
+from models import (Field, JavascriptOptions, JavascriptSerializer, Model, PythonOptions, PythonSerializer,
+                    SQLSerializer, Templates)
+from models import datatypes as dt
+
+from _util import timeit
+
+SHAPES = [
+    [dt.BIGINT(20), dt.VARCHAR(64), dt.BOOLEAN, dt.DATETIME(0)],
+    [dt.BIGINT(20), dt.BIGINT(20), dt.INTEGER(11), dt.DECIMAL(10, 2), dt.DATETIME(0)],
+    [dt.BIGINT(20), dt.VARCHAR(255), dt.TEXT(1000), dt.DATE, dt.DATETIME(0), dt.DATETIME(0)],
+    [dt.INTEGER(11), dt.ENUM(['draft', 'active', 'archived']), dt.SET(['read', 'write', 'admin']), dt.DOUBLE(16, 4)],
+    [dt.BIGINT(20), dt.CHAR(2), dt.VARCHAR(32), dt.SMALLINT(6), dt.BLOB(1024)]
+]
+
+SERIALIZERS = [
+    ('python', PythonSerializer(PythonOptions())),
+    ('python json + table', PythonSerializer(PythonOptions(json=True, table=True, enum_classes=True))),
+    ('javascript json', JavascriptSerializer(JavascriptOptions(json=True, enum_classes=True))),
+    ('sql', SQLSerializer())
+]
+
+
+def _model(index: int) -> Model:
+    shape = SHAPES[index % len(SHAPES)]
+    name = ''.join(chr(ord('A') + int(digit)) + 'x' for digit in str(index))
+    return Model(name, [Field(f'field_{position}_{index % 10}', datatype) for position, datatype in enumerate(shape)])
+
+
+def main(count: int = 5_000) -> None:
+    models = [_model(index) for index in range(count)]
+
+    for label, serializer in SERIALIZERS:
+        Templates.enabled = False
+        reference = timeit(f"{label} (trees)", lambda: list(map(serializer.serialize, models)), count, 'models', 32)
+        Templates.enabled = True
+        Templates.clear()
+        templated = timeit(f"{label} (templates)", lambda: list(map(serializer.serialize, models)), count,
+                           'models', 32)
+        print(f"{'speedup':<32} {reference / templated:8.2f}x")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -1,3 +1,78 @@
-from .core import *
-from .datatypes import *
-from .serializers import *
+"""
+    The submodules are imported on the first access to one of their names (PEP 562), e.g. `from models import Model`
+    doesn't import the serializers nor the langs.
+"""
+from importlib import import_module
+
+from . import datatypes
+
+# for the type checkers only, importing typing would cost more than the lazy imports save.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .core import *
+    from .datatypes import *
+    from .serializers import *
+    from .analysis import *
+    from .schema import *
+    from .drift import *
+    from .synthetic import *
+    from .bulk import *
+    from .writers import *
+    from .aio import *
+
+_EXPORTS = {
+    '.core': [
+        'Field', 'Model'
+    ],
+    '.datatypes': datatypes.__all__,
+    '.serializers': [
+        'Serializer', 'PythonOptions', 'PythonSerializer', 'JavascriptOptions', 'JavascriptSerializer', 'SQLSerializer',
+        'Server', 'Client', 'Database', 'Templates', 'Compiler', 'Case'
+    ],
+    '.analysis': [
+        'StorageOptions', 'SizeEstimate', 'StorageReport', 'Storage'
+    ],
+    '.schema': [
+        'Schema'
+    ],
+    '.drift': [
+        'ColumnInfo', 'TableInfo', 'DriftReport', 'Drift'
+    ],
+    '.synthetic': [
+        'Synthetic'
+    ],
+    '.bulk': [
+        'CsvOptions', 'CsvCodec'
+    ],
+    '.writers': [
+        'write_atomic', 'FileWriter'
+    ],
+    '.aio': [
+        'generate'
+    ]
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+# submodules imported on their first access as attributes, e.g. `models.serializers` after `import models`.
+_SUBMODULES = {module[1:] for module in _EXPORTS} | {'langs'}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        # the import binds the submodule in the package globals.
+        return import_module('.' + name, __name__)
+
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
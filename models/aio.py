@@ -0,0 +1,55 @@
+import asyncio
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import AsyncIterator, Iterable, Optional
+
+from .core import Model
+from .serializers import Compiler
+
+__all__ = [
+    'generate'
+]
+
+
+async def generate(models: Iterable[Model], target: str, compiler: Compiler = Compiler(), batch_size: int = 64,
+                   executor: Optional[Executor] = None) -> AsyncIterator[str]:
+    """
+        Asynchronous `Compiler.render` : the code of `models` for `target` ('python', 'javascript' or 'sql') is yielded
+        by chunks of `batch_size` models, each batch being rendered by a thread of `executor` so that the event loop
+        keeps serving the other tasks meanwhile. A batch is rendered once the previous chunk was consumed, which
+        bounds the memory used by slow consumers.
+        Cancelling the consuming task or closing the iterator stops the generation, a batch being rendered is then
+        completed in the background but not yielded.
+            async for chunk in generate(models, 'python', Compiler(PythonOptions(json=True))):
+                await stream.write(chunk.encode())
+        `executor` must run the batches in threads, a single thread executor is used for the generation by default.
+    """
+    own_executor = executor is None
+
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='models.generate')
+
+    # the batches run one after the other in this context, where the datatype mappings of the run are shared.
+    context = copy_context()
+    chunks = compiler.render(models, target, batch_size)
+    future: Optional[Future] = None
+
+    try:
+        while True:
+            future = executor.submit(context.run, next, chunks, None)
+            chunk = await asyncio.wrap_future(future)
+
+            if chunk is None:
+                return
+
+            yield chunk
+
+    finally:
+        # a generator can't be closed while it runs, it's closed once the batch being rendered is completed.
+        if future is not None and not future.done():
+            future.add_done_callback(lambda _: context.run(chunks.close))
+        else:
+            context.run(chunks.close)
+
+        if own_executor:
+            executor.shutdown(wait=False)
@@ -0,0 +1,278 @@
+from dataclasses import dataclass, field as dataclass_field
+from math import ceil
+from typing import Iterable, Optional
+
+from models import datatypes as dt
+from .core import Field, Model
+
+__all__ = [
+    'StorageOptions',
+    'SizeEstimate',
+    'StorageReport',
+    'Storage'
+]
+
+# bytes of the leftover digits of a DECIMAL part, full groups of 9 digits taking 4 bytes.
+_DECIMAL_LEFTOVER_BYTES = (0, 1, 1, 2, 2, 3, 3, 4, 4, 4)
+
+
+def _decimal_digits_bytes(digits: int) -> int:
+    return digits // 9 * 4 + _DECIMAL_LEFTOVER_BYTES[digits % 9]
+
+
+def _fsp_bytes(datatype) -> int:
+    return (datatype.fsp + 1) // 2
+
+
+@dataclass(frozen=True)
+class StorageOptions:
+    """
+        Assumptions of the `Storage` estimates.
+            charset_bytes : maximum bytes per character of the text columns, 4 for utf8mb4.
+            fill : average fill ratio of the variable length columns, relative to their maximum length.
+            text_bytes : assumed average length of the MEDIUM / LONG TEXT and BLOB values, which have no useful maximum.
+    """
+    charset_bytes: int = 4
+    fill: float = 0.5
+    text_bytes: int = 1024
+
+
+@dataclass
+class SizeEstimate:
+    minimum: int
+    maximum: int
+    average: float
+
+    def __add__(self, other: 'SizeEstimate') -> 'SizeEstimate':
+        return SizeEstimate(self.minimum + other.minimum, self.maximum + other.maximum, self.average + other.average)
+
+
+@dataclass
+class StorageReport:
+    model: Model
+    fields: dict[str, SizeEstimate]
+    row: SizeEstimate
+    row_limit_bytes: int
+    rows: int = 0
+    storage_bytes: int = 0
+    warnings: list[str] = dataclass_field(default_factory=list)
+
+
+class Storage:
+    """
+        Row size and table storage estimates of MySQL (InnoDB) tables, from the parameters of the datatypes.
+        Sizes are in bytes, the MySQL storage requirements being found at :
+            https://dev.mysql.com/doc/refman/8.0/en/storage-requirements.html
+    """
+    ROW_LIMIT = 65535
+    KEY_LIMIT = 3072
+    # record header, transaction id and roll pointer of each InnoDB record.
+    ROW_OVERHEAD = 5 + 6 + 7
+    # InnoDB leaves 1/16 of the clustered index pages free.
+    PAGE_FILL = 15 / 16
+
+    @classmethod
+    def _variable(cls, length: int, options: StorageOptions) -> SizeEstimate:
+        """Column of at most `length` bytes, prefixed with its length."""
+        prefix = 1 if length < 256 else 2
+        return SizeEstimate(prefix, prefix + length, prefix + length * options.fill)
+
+    @classmethod
+    def _lob(cls, prefix: int, length: int, average: float) -> SizeEstimate:
+        return SizeEstimate(prefix, prefix + length, prefix + min(length, average))
+
+    @classmethod
+    def field_size(cls, datatype: dt.DataType, options: StorageOptions = StorageOptions()) -> SizeEstimate:
+        """Stored bytes of a value of `datatype`."""
+        if datatype is dt.BOOLEAN or datatype is dt.YEAR:
+            size = 1
+
+        elif datatype is dt.DATE:
+            size = 3
+
+        elif datatype is dt.TINYBLOB:
+            return cls._lob(1, 255, 255 * options.fill)
+
+        elif datatype is dt.TINYTEXT:
+            return cls._lob(1, 255, 255 * options.fill)
+
+        elif datatype in (dt.MEDIUMBLOB, dt.MEDIUMTEXT):
+            return cls._lob(3, 16_777_215, options.text_bytes)
+
+        elif datatype in (dt.LONGBLOB, dt.LONGTEXT):
+            return cls._lob(4, 4_294_967_295, options.text_bytes)
+
+        elif isinstance(datatype, dt.BIT):
+            size = (datatype.size + 7) // 8
+
+        elif isinstance(datatype, dt.TINYINT):
+            size = 1
+
+        elif isinstance(datatype, dt.SMALLINT):
+            size = 2
+
+        elif isinstance(datatype, dt.MEDIUMINT):
+            size = 3
+
+        elif isinstance(datatype, dt.INTEGER):
+            size = 4
+
+        elif isinstance(datatype, (dt.BIGINT, dt.DOUBLE)):
+            size = 8
+
+        elif isinstance(datatype, dt.FLOAT):
+            size = 4
+
+        elif isinstance(datatype, dt.DECIMAL):
+            size = _decimal_digits_bytes(datatype.size - datatype.d) + _decimal_digits_bytes(datatype.d)
+
+        elif isinstance(datatype, dt.TIME):
+            size = 3 + _fsp_bytes(datatype)
+
+        elif isinstance(datatype, dt.DATETIME):
+            size = 5 + _fsp_bytes(datatype)
+
+        elif isinstance(datatype, dt.TIMESTAMP):
+            size = 4 + _fsp_bytes(datatype)
+
+        elif isinstance(datatype, dt.BINARY):
+            size = datatype.size
+
+        elif isinstance(datatype, dt.CHAR):
+            # multibyte charsets store CHAR(M) in M to M * charset_bytes bytes.
+            return SizeEstimate(
+                datatype.size,
+                datatype.size * options.charset_bytes,
+                datatype.size + datatype.size * (options.charset_bytes - 1) * options.fill
+            )
+
+        elif isinstance(datatype, dt.VARBINARY):
+            return cls._variable(datatype.size, options)
+
+        elif isinstance(datatype, dt.VARCHAR):
+            return cls._variable(datatype.size * options.charset_bytes, options)
+
+        elif isinstance(datatype, dt.BLOB):
+            return cls._lob(2, datatype.size, datatype.size * options.fill)
+
+        elif isinstance(datatype, dt.TEXT):
+            return cls._lob(2, datatype.size, datatype.size * options.fill)
+
+        elif isinstance(datatype, dt.ENUM):
+            size = 1 if len(datatype.values) < 256 else 2
+
+        elif isinstance(datatype, dt.SET):
+            size = (len(datatype.values) + 7) // 8
+            size = 8 if size > 4 else size
+
+        else:
+            raise Exception(f"Storage size not found for {datatype.__class__.__name__!r}!")
+
+        return SizeEstimate(size, size, size)
+
+    @classmethod
+    def row_limit_size(cls, datatype: dt.DataType, options: StorageOptions = StorageOptions()) -> int:
+        """Bytes of `datatype` counted against the MySQL row size limit, BLOB and TEXT columns only counting a pointer."""
+        if datatype in (dt.TINYBLOB, dt.TINYTEXT):
+            return 9
+
+        elif isinstance(datatype, (dt.BLOB, dt.TEXT)):
+            return 10
+
+        elif datatype in (dt.MEDIUMBLOB, dt.MEDIUMTEXT):
+            return 11
+
+        elif datatype in (dt.LONGBLOB, dt.LONGTEXT):
+            return 12
+
+        return cls.field_size(datatype, options).maximum
+
+    @classmethod
+    def key_length(cls, datatype: dt.DataType, options: StorageOptions = StorageOptions()) -> Optional[int]:
+        """Bytes of `datatype` in an index key, None for the BLOB and TEXT columns which require a prefix length."""
+        if datatype in (dt.TINYBLOB, dt.TINYTEXT, dt.MEDIUMBLOB, dt.MEDIUMTEXT, dt.LONGBLOB, dt.LONGTEXT) or \
+                isinstance(datatype, (dt.BLOB, dt.TEXT)):
+            return None
+
+        elif isinstance(datatype, dt.VARCHAR):
+            return datatype.size * options.charset_bytes
+
+        elif isinstance(datatype, dt.VARBINARY):
+            return datatype.size
+
+        return cls.field_size(datatype, options).maximum
+
+    @classmethod
+    def row_size(cls, model: Model, options: StorageOptions = StorageOptions()) -> SizeEstimate:
+        size = SizeEstimate(0, 0, 0)
+
+        for field in model.fields:
+            size += cls.field_size(field.datatype, options)
+
+        return size
+
+    @classmethod
+    def table_size(cls, model: Model, rows: int, options: StorageOptions = StorageOptions()) -> int:
+        """Estimated bytes of the clustered index of `rows` average rows of `model`."""
+        return ceil(rows * (cls.row_size(model, options).average + cls.ROW_OVERHEAD) / cls.PAGE_FILL)
+
+    @classmethod
+    def _key_warnings(cls, model: Model, index: list[str], options: StorageOptions) -> list[str]:
+        fields: dict[str, Field] = {field.name: field for field in model.fields}
+        warnings: list[str] = []
+        length = 0
+
+        for name in index:
+            assert name in fields, f"{model.name!r} has no field {name!r} to index!"
+            key_length = cls.key_length(fields[name].datatype, options)
+
+            if key_length is None:
+                warnings.append(f"{model.name}: index ({', '.join(index)}) needs a prefix length for {name!r}.")
+            else:
+                length += key_length
+
+        if length > cls.KEY_LIMIT:
+            warnings.append(
+                f"{model.name}: index ({', '.join(index)}) key length of {length:,} bytes "
+                f"exceeds {cls.KEY_LIMIT:,} bytes."
+            )
+
+        return warnings
+
+    @classmethod
+    def analyze(cls, model: Model, rows: int = 0, indexes: Iterable[list[str]] = (),
+                options: StorageOptions = StorageOptions()) -> StorageReport:
+        """Row size and storage estimates of `model`, with warnings on the row and index key limits."""
+        fields = {field.name: cls.field_size(field.datatype, options) for field in model.fields}
+        row_limit_bytes = sum(cls.row_limit_size(field.datatype, options) for field in model.fields)
+        report = StorageReport(
+            model=model,
+            fields=fields,
+            row=cls.row_size(model, options),
+            row_limit_bytes=row_limit_bytes,
+            rows=rows,
+            storage_bytes=cls.table_size(model, rows, options)
+        )
+
+        if row_limit_bytes > cls.ROW_LIMIT:
+            report.warnings.append(
+                f"{model.name}: row size of {row_limit_bytes:,} bytes exceeds the {cls.ROW_LIMIT:,} bytes MySQL limit."
+            )
+
+        for index in indexes:
+            report.warnings.extend(cls._key_warnings(model, index, options))
+
+        return report
+
+    @classmethod
+    def analyze_schema(cls, models: list[Model], rows: Optional[dict[str, int]] = None,
+                       indexes: Optional[dict[str, list[list[str]]]] = None,
+                       options: StorageOptions = StorageOptions()) -> list[StorageReport]:
+        """Reports of all the `models`, `rows` and `indexes` being keyed by model name."""
+        rows = rows or {}
+        indexes = indexes or {}
+
+        return [
+            cls.analyze(model, rows.get(model.name, 0), indexes.get(model.name, ()), options)
+            for model in models
+        ]
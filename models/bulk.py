@@ -0,0 +1,225 @@
+import csv
+import re
+from dataclasses import dataclass
+from datetime import timedelta
+from decimal import Decimal
+from itertools import islice
+from typing import Callable, Iterable, Iterator, TextIO
+
+from models import datatypes as dt
+from models.langs import sql
+from .core import Model
+from .serializers import Database, _format_time, _is_blob, _is_text
+
+__all__ = [
+    'CsvOptions',
+    'CsvCodec'
+]
+
+# backslash sequences of MySQL, other escaped characters standing for themselves.
+_UNESCAPES = {'0': '\0', 'b': '\b', 'n': '\n', 'r': '\r', 't': '\t', 'Z': '\x1a'}
+_ESCAPED = re.compile(r'\\(.)', re.DOTALL)
+
+
+def _time_text(value) -> str:
+    if isinstance(value, timedelta):
+        return _format_time(value // timedelta(seconds=1))
+
+    return str(value)
+
+
+def _unescape(text: str) -> str:
+    if '\\' not in text:
+        return text
+
+    return _ESCAPED.sub(lambda match: _UNESCAPES.get(match[1], match[1]), text)
+
+
+@dataclass(frozen=True)
+class CsvOptions:
+    """
+        Format of the CSV files of `CsvCodec`, lines end with '\n' and the texts are always enclosed with '"'.
+            delimiter : separator of the fields.
+            null : unquoted field of the NULL values, '\\N' or 'NULL' for MySQL depending on `escape`.
+            escape : escape the backslashes of the texts, as read by LOAD DATA with its default ESCAPED BY '\\'.
+                The sqlite3 shell reads the texts verbatim and requires escape=False, the texts equal to `null` being
+                then read back as NULL.
+            header : first line of column names.
+    """
+    delimiter: str = ','
+    null: str = '\\N'
+    escape: bool = True
+    header: bool = True
+
+
+class CsvCodec:
+    """
+        Streaming CSV encoder and decoder of the raw rows of a model, as bound to and read from the database cursors.
+        The values are formatted per datatype :
+            - numbers as is, BOOLEAN as 0 / 1 and BIT as its integer,
+            - texts (CHAR, VARCHAR, TEXT, ENUM, SET) enclosed with '"', the quotes being doubled,
+            - dates and times in their ISO format,
+            - BINARY and BLOB values in hexadecimal, unhexed by the `load_data_command` column mapping.
+        Decoded rows hold int, float, Decimal, str and bytes values, dates and times staying ISO strings.
+        Rows are processed by chunks of `chunk_size` so that the memory used doesn't depend on the size of the file.
+    """
+
+    def __init__(self, model: Model, options: CsvOptions = CsvOptions()):
+        self.model = model
+        self.options = options
+        self.columns = [field.name for field in model.fields]
+        self._encoders = [self._encoder(field.datatype) for field in model.fields]
+        self._decoders = [self._decoder(field.datatype) for field in model.fields]
+
+    def _encoder(self, datatype: dt.DataType) -> Callable[[object], str]:
+        if datatype is dt.BOOLEAN:
+            return lambda value: '1' if value else '0'
+
+        elif datatype is dt.DATE or datatype is dt.YEAR:
+            return str
+
+        elif _is_text(datatype):
+            if self.options.escape:
+                return lambda value: '"' + value.replace('\\', '\\\\').replace('"', '""') + '"'
+            return lambda value: '"' + value.replace('"', '""') + '"'
+
+        elif _is_blob(datatype):
+            return bytes.hex
+
+        elif isinstance(datatype, (dt.BIT, dt.TINYINT, dt.SMALLINT, dt.MEDIUMINT, dt.INTEGER, dt.BIGINT)):
+            return str
+
+        elif isinstance(datatype, (dt.FLOAT, dt.DOUBLE, dt.DECIMAL)):
+            return str
+
+        elif isinstance(datatype, (dt.DATETIME, dt.TIMESTAMP)):
+            return str
+
+        elif isinstance(datatype, dt.TIME):
+            return _time_text
+
+        else:
+            raise Exception(f"CSV encoding not found for {datatype.__class__.__name__!r}!")
+
+    def _decoder(self, datatype: dt.DataType) -> Callable[[str], object]:
+        if datatype is dt.BOOLEAN or datatype is dt.YEAR:
+            return int
+
+        elif datatype is dt.DATE:
+            return str
+
+        elif _is_text(datatype):
+            return _unescape if self.options.escape else str
+
+        elif _is_blob(datatype):
+            return bytes.fromhex
+
+        elif isinstance(datatype, (dt.BIT, dt.TINYINT, dt.SMALLINT, dt.MEDIUMINT, dt.INTEGER, dt.BIGINT)):
+            return int
+
+        elif isinstance(datatype, (dt.FLOAT, dt.DOUBLE)):
+            return float
+
+        elif isinstance(datatype, dt.DECIMAL):
+            return Decimal
+
+        elif isinstance(datatype, (dt.DATETIME, dt.TIMESTAMP, dt.TIME)):
+            return str
+
+        else:
+            raise Exception(f"CSV decoding not found for {datatype.__class__.__name__!r}!")
+
+    def write(self, rows: Iterable[tuple], stream: TextIO, chunk_size: int = 1 << 14) -> int:
+        """Write the header then `rows`, with one `stream.write` per chunk. Return the number of rows."""
+        delimiter = self.options.delimiter
+        null = self.options.null
+        encoders = self._encoders
+        rows = iter(rows)
+        count = 0
+
+        if self.options.header:
+            stream.write(delimiter.join(self.columns) + '\n')
+
+        while True:
+            lines = [
+                delimiter.join([null if value is None else encoder(value) for encoder, value in zip(encoders, row)])
+                for row in islice(rows, chunk_size)
+            ]
+
+            if not lines:
+                return count
+
+            lines.append('')
+            stream.write('\n'.join(lines))
+            count += len(lines) - 1
+
+    def read_chunks(self, stream: TextIO, chunk_size: int = 1 << 14) -> Iterator[list[tuple]]:
+        """Decoded rows of `stream`, opened with newline='', by lists of at most `chunk_size` rows."""
+        null = self.options.null
+        decoders = self._decoders
+        reader = csv.reader(stream, delimiter=self.options.delimiter, quotechar='"', doublequote=True, strict=True)
+
+        if self.options.header:
+            header = next(reader, None)
+            assert header == self.columns, f"CSV columns {header!r} don't match the fields of {self.model.name!r}!"
+
+        while True:
+            chunk = [
+                tuple([None if value == null else decoder(value) for decoder, value in zip(decoders, row)])
+                for row in islice(reader, chunk_size)
+            ]
+
+            if not chunk:
+                return
+
+            yield chunk
+
+    def read(self, stream: TextIO, chunk_size: int = 1 << 14) -> Iterator[tuple]:
+        for chunk in self.read_chunks(stream, chunk_size):
+            yield from chunk
+
+    def load_data_command(self, path: str, cfg_local: bool = False) -> sql.LoadData:
+        """MySQL LOAD DATA statement of a file written by `write`, unhexing the blobs through '@variables'."""
+        assert self.options.null == ('\\N' if self.options.escape else 'NULL'), \
+            "LOAD DATA reads the NULL values as \\N when escaping, else as NULL!"
+        columns = []
+        assignments = []
+
+        for field in self.model.fields:
+            if _is_blob(field.datatype):
+                variable = sql.Symbols.AT + field.name
+                columns.append(variable)
+                assignments.append((field.name, sql.Expression(f"UNHEX({variable})")))
+
+            elif isinstance(field.datatype, dt.BIT):
+                variable = sql.Symbols.AT + field.name
+                columns.append(variable)
+                assignments.append((field.name, sql.Expression(f"CAST({variable} AS UNSIGNED)")))
+
+            else:
+                columns.append(field.name)
+
+        return sql.LoadData(
+            path=path,
+            name=Database.table_name(self.model),
+            columns=columns,
+            assignments=assignments,
+            cfg_local=cfg_local,
+            cfg_delimiter=self.options.delimiter,
+            cfg_escape='\\' if self.options.escape else '',
+            cfg_ignore_lines=1 if self.options.header else 0
+        )
+
+    def import_command(self, path: str) -> sql.Import:
+        """
+            sqlite3 shell `.import` of a file written by `write`, into the table of `Database.model_command`.
+            The shell has no NULL marker nor hexadecimal decoding : NULL values and blobs are imported as texts.
+        """
+        assert not self.options.escape, "The sqlite3 shell reads the texts verbatim, use CsvOptions(escape=False)!"
+        assert self.options.delimiter == ',', "The sqlite3 shell reads the CSV files with ',' delimiters!"
+
+        return sql.Import(
+            path=path,
+            name=Database.table_name(self.model),
+            cfg_skip=1 if self.options.header else 0
+        )
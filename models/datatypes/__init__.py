@@ -1,4 +1,52 @@
-from .abc import *
-from .numeric_data_types import *
-from .string_data_types import *
-from .time_data_types import *
+"""
+    The datatype modules are imported on the first access to one of their names (PEP 562).
+"""
+from importlib import import_module
+
+# for the type checkers only, see `models.TYPE_CHECKING`.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .abc import *
+    from .numeric_data_types import *
+    from .string_data_types import *
+    from .time_data_types import *
+
+_EXPORTS = {
+    '.abc': [
+        'DataType'
+    ],
+    '.numeric_data_types': [
+        'NumericDataType', 'BIT', 'BOOLEAN', 'TINYINT', 'SMALLINT', 'MEDIUMINT', 'INTEGER', 'BIGINT', 'FLOAT', 'DOUBLE',
+        'DECIMAL', 'BOOL', 'INT', 'DEC'
+    ],
+    '.string_data_types': [
+        'StringDataType', 'CHAR', 'VARCHAR', 'BINARY', 'VARBINARY', 'BLOB', 'TINYBLOB', 'MEDIUMBLOB', 'LONGBLOB', 'TEXT',
+        'TINYTEXT', 'MEDIUMTEXT', 'LONGTEXT', 'ENUM', 'SET'
+    ],
+    '.time_data_types': [
+        'TimeDataType', 'DATE', 'DATETIME', 'TIMESTAMP', 'TIME', 'YEAR'
+    ]
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+_SUBMODULES = {module[1:] for module in _EXPORTS}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return import_module('.' + name, __name__)
+
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from .abc import DataType
 
@@ -142,8 +143,8 @@ class FLOAT(NumericDataType):
         If p is from 25 to 53, the data type becomes DOUBLE()
 
     """
-    size: int
-    d: int
+    size: Optional[int] = None
+    d: Optional[int] = None
 
 
 @dataclass
@@ -152,10 +153,11 @@ class DOUBLE(NumericDataType):
         DOUBLE(size, d)
             A normal-size floating point number.
             The total number of digits is specified in size.
-            The number of digits after the decimal point is specified in the d parameter
+            The number of digits after the decimal point is specified in the d parameter.
+            Without size and d, values are stored to the limits permitted by the hardware
     """
-    size: int
-    d: int
+    size: Optional[int] = None
+    d: Optional[int] = None
 
 
 @dataclass
@@ -175,7 +177,7 @@ class DECIMAL(NumericDataType):
 
     def __post_init__(self):
         assert 0 <= self.size <= 65
-        assert 0 <= d <= 30
+        assert 0 <= self.d <= 30
 
 
 BOOL = BOOLEAN
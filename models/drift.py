@@ -0,0 +1,145 @@
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from .core import Model
+from .serializers import Database
+
+__all__ = [
+    'ColumnInfo',
+    'TableInfo',
+    'DriftReport',
+    'Drift'
+]
+
+# one query per kind of information for all the tables, through the table-valued pragma functions.
+_TABLES_QUERY = "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\'"
+_COLUMNS_QUERY = f"""
+SELECT t.name, c.name, c.type, c."notnull", c.pk
+FROM ({_TABLES_QUERY}) AS t JOIN pragma_table_info(t.name) AS c
+ORDER BY t.name, c.cid
+"""
+_INDEXES_QUERY = f"""
+SELECT t.name, i.name, i."unique"
+FROM ({_TABLES_QUERY}) AS t JOIN pragma_index_list(t.name) AS i
+"""
+_FOREIGN_KEYS_QUERY = f"""
+SELECT t.name, f."from", f."table", f."to"
+FROM ({_TABLES_QUERY}) AS t JOIN pragma_foreign_key_list(t.name) AS f
+ORDER BY t.name, f.id, f.seq
+"""
+
+
+def _normalize_type(text: str) -> str:
+    return "".join(text.split()).upper()
+
+
+@dataclass
+class ColumnInfo:
+    name: str
+    type: str
+    not_null: bool = False
+    primary_key: int = 0
+
+
+@dataclass
+class TableInfo:
+    name: str
+    columns: dict[str, ColumnInfo] = field(default_factory=dict)
+    indexes: dict[str, bool] = field(default_factory=dict)
+    foreign_keys: list[tuple[str, str, str]] = field(default_factory=list)
+
+
+@dataclass
+class DriftReport:
+    missing_tables: list[str] = field(default_factory=list)
+    extra_tables: list[str] = field(default_factory=list)
+    missing_columns: dict[str, list[str]] = field(default_factory=dict)
+    extra_columns: dict[str, list[str]] = field(default_factory=dict)
+    # table -> [(column, expected type, actual type), ...]
+    mismatched_types: dict[str, list[tuple[str, str, str]]] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing_tables or self.extra_tables or self.missing_columns or self.extra_columns or
+                    self.mismatched_types)
+
+    def messages(self) -> list[str]:
+        messages = [f"missing table {name!r}" for name in self.missing_tables]
+        messages.extend(f"extra table {name!r}" for name in self.extra_tables)
+
+        for table, columns in self.missing_columns.items():
+            messages.extend(f"missing column {table}.{column}" for column in columns)
+
+        for table, columns in self.extra_columns.items():
+            messages.extend(f"extra column {table}.{column}" for column in columns)
+
+        for table, mismatches in self.mismatched_types.items():
+            messages.extend(
+                f"column {table}.{column} is {actual!r} instead of {expected!r}"
+                for column, expected, actual in mismatches
+            )
+
+        return messages
+
+
+class Drift:
+    """Differences between a live SQLite database and the tables of `Database.model_commands`."""
+
+    @classmethod
+    def introspect(cls, connection: sqlite3.Connection) -> dict[str, TableInfo]:
+        """Columns, indexes and foreign keys of all the tables, read in three queries whatever the number of tables."""
+        tables: dict[str, TableInfo] = {}
+
+        for (name,) in connection.execute(_TABLES_QUERY):
+            tables[name] = TableInfo(name)
+
+        for table, name, type_, not_null, primary_key in connection.execute(_COLUMNS_QUERY):
+            tables[table].columns[name] = ColumnInfo(name, type_, bool(not_null), primary_key)
+
+        for table, name, unique in connection.execute(_INDEXES_QUERY):
+            tables[table].indexes[name] = bool(unique)
+
+        for table, column, foreign_table, foreign_column in connection.execute(_FOREIGN_KEYS_QUERY):
+            tables[table].foreign_keys.append((column, foreign_table, foreign_column))
+
+        return tables
+
+    @classmethod
+    def check(cls, connection: sqlite3.Connection, models: Iterable[Model], extra_tables: bool = True) -> DriftReport:
+        """Compare the database with `models`, the tables which aren't modeled being reported if `extra_tables`."""
+        tables = cls.introspect(connection)
+        report = DriftReport()
+        expected_names = set()
+
+        for model in models:
+            command = Database.model_command(model)
+            expected_names.add(command.name)
+            table = tables.get(command.name)
+
+            if table is None:
+                report.missing_tables.append(command.name)
+                continue
+
+            expected_columns = {column.name: str(column.datatype) for column in command.columns}
+            missing = [name for name in expected_columns if name not in table.columns]
+            extra = [name for name in table.columns if name not in expected_columns]
+            mismatched = [
+                (name, expected, table.columns[name].type)
+                for name, expected in expected_columns.items()
+                if name in table.columns and _normalize_type(expected) != _normalize_type(table.columns[name].type)
+            ]
+
+            if missing:
+                report.missing_columns[command.name] = missing
+
+            if extra:
+                report.extra_columns[command.name] = extra
+
+            if mismatched:
+                report.mismatched_types[command.name] = mismatched
+
+        if extra_tables:
+            report.extra_tables = [name for name in tables if name not in expected_names]
+
+        return report
@@ -1,12 +1,197 @@
-from abc import ABC, abstractmethod
+import threading
+from abc import ABC, ABCMeta, abstractmethod
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Iterator, Optional, Union
 
-__all__ = ['Code']
+__all__ = ['Code', 'Interner']
 
+_INTERNER: ContextVar[Optional['Interner']] = ContextVar('_INTERNER', default=None)
+
+# node class -> (tokens, memoized tokens) of the classes defining `tokens`.
+_TOKENS: dict[type, tuple[Callable, Callable]] = {}
+
+# number of active interners, the hooks being installed only while there is one so that the nodes built and rendered
+# outside of them don't pay for it.
+_ACTIVE = 0
+_LOCK = threading.Lock()
+
+# number of tokens joined and encoded at once when rendering bytes, which bounds the intermediate texts.
+_CHUNK_TOKENS = 1 << 12
+
+
+def _key(value):
+    """Hashable key of a node field, the child nodes being already interned and compared by identity."""
+    cls = type(value)
+
+    if cls is str or value is None:
+        return value
+
+    elif isinstance(cls, _CodeMeta):
+        return id(value)
+
+    elif cls is tuple:
+        return tuple, *map(_key, value)
+
+    # 1, 1.0 and True, or 0.0 and -0.0, are equal but rendered differently.
+    elif cls is float:
+        return float, repr(value)
+
+    return cls, value
+
+
+def _interning_call(cls, *args, **kwargs):
+    node = type.__call__(cls, *args, **kwargs)
+    interner = _INTERNER.get()
+
+    if interner is None:
+        return node
+
+    try:
+        return interner.nodes.setdefault((cls, *map(_key, node.__dict__.values())), node)
+    except TypeError:  # unhashable field value.
+        return node
+
+
+def _memoized(tokens):
+    @wraps(tokens)
+    def wrapper(self) -> list[str]:
+        interner = _INTERNER.get()
+
+        if interner is None:
+            return tokens(self)
+
+        item = interner.tokens.get(id(self))
+
+        if item is None or item[0] is not self:
+            item = interner.tokens[id(self)] = (self, tokens(self))
+
+        return item[1]
+
+    return wrapper
+
+
+def _install(hooks: bool) -> None:
+    if hooks:
+        _CodeMeta.__call__ = _interning_call
+    else:
+        del _CodeMeta.__call__
+
+    for cls, (tokens, memoized) in _TOKENS.items():
+        cls.tokens = memoized if hooks else tokens
+
+
+def _encoded_chunks(tokens: list[str]) -> Iterator[bytes]:
+    # a join then an encode per chunk run in C, encoding each token in python is an order of magnitude slower.
+    for start in range(0, len(tokens), _CHUNK_TOKENS):
+        yield "".join(tokens[start:start + _CHUNK_TOKENS]).encode()
+
+
+def _frozen_lists(names: tuple[str, ...], post_init: Optional[Callable]):
+    def __post_init__(self):
+        for name in names:
+            value = self.__dict__[name]
+            if type(value) is list:
+                self.__dict__[name] = tuple(value)
+
+        if post_init is not None:
+            post_init(self)
+
+    return __post_init__
+
+
+class Interner:
+    """
+        Hash-consing of the nodes built in its context : a node equal to an already built one is replaced by it, so
+        that the equal subtrees are shared, and the tokens of each node are computed once then reused.
+        The token lists are shared and must not be mutated.
+        Interning costs more than it saves on code made of small distinct subtrees, it's left to the callers :
+            with Interner():
+                Compiler().compile(models, python=stream)
+    """
+
+    def __init__(self):
+        # (class, field keys) -> node
+        self.nodes: dict[tuple, Code] = {}
+        # node id -> (node, tokens), the node being kept alive with its tokens.
+        self.tokens: dict[int, tuple[Code, list[str]]] = {}
+        self._token = None
+
+    def __enter__(self) -> 'Interner':
+        global _ACTIVE
+
+        with _LOCK:
+            _ACTIVE += 1
+            if _ACTIVE == 1:
+                _install(True)
+
+        self._token = _INTERNER.set(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        global _ACTIVE
+        _INTERNER.reset(self._token)
+        self._token = None
+
+        with _LOCK:
+            _ACTIVE -= 1
+            if _ACTIVE == 0:
+                _install(False)
+
+
+class _CodeMeta(ABCMeta):
+    """Metaclass of the nodes, whose `__call__` interns the new nodes while an `Interner` is active."""
+
+
+class Code(ABC, metaclass=_CodeMeta):
+    """
+        Immutable node of code, the subclasses being frozen dataclasses whose `list` fields are stored as tuples so
+        that the nodes are hashable.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        lists = tuple(
+            name
+            for name, annotation in cls.__dict__.get('__annotations__', {}).items()
+            if str(annotation).startswith('list[')
+        )
+
+        if lists:
+            cls.__post_init__ = _frozen_lists(lists, getattr(cls, '__post_init__', None))
+
+        tokens = cls.__dict__.get('tokens')
+
+        if tokens is not None and not getattr(tokens, '__isabstractmethod__', False):
+            with _LOCK:
+                _TOKENS[cls] = (tokens, _memoized(tokens))
+                if _ACTIVE:
+                    cls.tokens = _TOKENS[cls][1]
 
-class Code(ABC):
     @abstractmethod
     def tokens(self) -> list[str]:
         """"""
 
     def __str__(self):
         return "".join(self.tokens())
+
+    def render_bytes(self) -> bytes:
+        """UTF-8 encoded code, without building the text of the whole code."""
+        return b"".join(_encoded_chunks(self.tokens()))
+
+    def write_into(self, buffer: Union[bytearray, memoryview], offset: int = 0) -> int:
+        """
+            Write the UTF-8 encoded code into `buffer` from `offset` and return the number of bytes written.
+            A bytearray grows as needed, a memoryview must be large enough.
+        """
+        assert 0 <= offset <= len(buffer), f"Offset {offset} out of the buffer of {len(buffer)} bytes!"
+        end = offset
+
+        for chunk in _encoded_chunks(self.tokens()):
+            if isinstance(buffer, memoryview):
+                assert end + len(chunk) <= len(buffer), f"The code doesn't fit the buffer of {len(buffer)} bytes!"
+
+            buffer[end:end + len(chunk)] = chunk
+            end += len(chunk)
+
+        return end - offset
@@ -1,11 +1,19 @@
 from abc import ABC
 from dataclasses import dataclass
+from typing import Union
 
 from .base import Code
 
 
 class Keywords:
     CLASS = "class"
+    STATIC = "static"
+    RETURN = "return"
+    NEW = "new"
+    CONST = "const"
+    IF = "if"
+    GET = "get"
+    SET = "set"
 
 
 class Symbols:
@@ -20,6 +28,12 @@ class Symbols:
     COMMA = ","
     EQUAL = "="
     DOT = "."
+    LB = "["
+    RB = "]"
+    QMARK = "?"
+    ARROW = "=>"
+    QUOTE = "'"
+    BIGINT = "n"
 
 
 class Statement(Code, ABC):
@@ -34,7 +48,7 @@ class Object(Expression, ABC):
     ...
 
 
-@dataclass
+@dataclass(frozen=True)
 class Block(Code):
     statements: list[Statement]
 
@@ -54,7 +68,7 @@ class Block(Code):
         return tokens
 
 
-@dataclass
+@dataclass(frozen=True)
 class Var(Object):
     name: str
 
@@ -67,7 +81,50 @@ class Var(Object):
         ]
 
 
-@dataclass
+_ESCAPES = {
+    ord("\\"): "\\\\",
+    ord("'"): "\\'",
+    ord("\n"): "\\n",
+    ord("\r"): "\\r",
+    ord("\u2028"): "\\u2028",
+    ord("\u2029"): "\\u2029"
+}
+
+
+@dataclass(frozen=True)
+class Str(Object):
+    value: str
+
+    def tokens(self) -> list[str]:
+        return [
+            Symbols.QUOTE,
+            self.value.translate(_ESCAPES),
+            Symbols.QUOTE
+        ]
+
+
+@dataclass(frozen=True)
+class Num(Object):
+    value: Union[int, float]
+
+    def tokens(self) -> list[str]:
+        return [
+            repr(self.value)
+        ]
+
+
+@dataclass(frozen=True)
+class BigNum(Object):
+    value: int
+
+    def tokens(self) -> list[str]:
+        return [
+            repr(self.value),
+            Symbols.BIGINT
+        ]
+
+
+@dataclass(frozen=True)
 class Args(Code):
     args: list[Var]
 
@@ -82,14 +139,244 @@ class Args(Code):
         return tokens
 
 
-@dataclass
+@dataclass(frozen=True)
+class Call(Object, Statement):
+    func: Object
+    args: Args
+
+    def tokens(self) -> list[str]:
+        return [
+            *self.func.tokens(),
+            Symbols.LP,
+            *self.args.tokens(),
+            Symbols.RP
+        ]
+
+
+@dataclass(frozen=True)
+class New(Object):
+    cls: Object
+    args: Args
+
+    def tokens(self) -> list[str]:
+        return [
+            Keywords.NEW,
+            Symbols.SPACE,
+            *self.cls.tokens(),
+            Symbols.LP,
+            *self.args.tokens(),
+            Symbols.RP
+        ]
+
+
+@dataclass(frozen=True)
+class Arrow(Object):
+    args: Args
+    body: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            Symbols.LP,
+            *self.args.tokens(),
+            Symbols.RP,
+            Symbols.SPACE,
+            Symbols.ARROW,
+            Symbols.SPACE,
+            *self.body.tokens()
+        ]
+
+
+@dataclass(frozen=True)
+class BinOp(Expression):
+    left: Expression
+    op: str
+    right: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            *self.left.tokens(),
+            Symbols.SPACE,
+            self.op,
+            Symbols.SPACE,
+            *self.right.tokens()
+        ]
+
+
+@dataclass(frozen=True)
+class Conditional(Expression):
+    test: Expression
+    body: Expression
+    orelse: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            Symbols.LP,
+            *self.test.tokens(),
+            Symbols.SPACE,
+            Symbols.QMARK,
+            Symbols.SPACE,
+            *self.body.tokens(),
+            Symbols.SPACE,
+            Symbols.COLON,
+            Symbols.SPACE,
+            *self.orelse.tokens(),
+            Symbols.RP
+        ]
+
+
+@dataclass(frozen=True)
+class Return(Statement):
+    value: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            Keywords.RETURN,
+            Symbols.SPACE,
+            *self.value.tokens()
+        ]
+
+
+@dataclass(frozen=True)
+class Const(Statement):
+    name: Var
+    value: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            Keywords.CONST,
+            Symbols.SPACE,
+            *self.name.tokens(),
+            Symbols.SPACE,
+            Symbols.EQUAL,
+            Symbols.SPACE,
+            *self.value.tokens()
+        ]
+
+
+@dataclass(frozen=True)
+class Obj(Object):
+    items: list[tuple[str, Expression]]
+
+    def tokens(self) -> list[str]:
+        tokens = [Symbols.LS]
+        for index, (key, value) in enumerate(self.items):
+            if index:
+                tokens.append(Symbols.COMMA)
+            tokens.append(Symbols.SPACE)
+            if key == "__proto__":
+                # a literal '__proto__' key would set the prototype instead of defining a property.
+                tokens.extend([Symbols.LB, *Str(key).tokens(), Symbols.RB])
+            elif key.isidentifier():
+                tokens.extend(Var(key).tokens())
+            else:
+                tokens.extend(Str(key).tokens())
+            tokens.append(Symbols.COLON)
+            tokens.append(Symbols.SPACE)
+            tokens.extend(value.tokens())
+
+        if self.items:
+            tokens.append(Symbols.SPACE)
+
+        tokens.append(Symbols.RS)
+        return tokens
+
+
+@dataclass(frozen=True)
+class If(Statement):
+    test: Expression
+    block: Block
+
+    def tokens(self) -> list[str]:
+        return [
+            Keywords.IF,
+            Symbols.SPACE,
+            Symbols.LP,
+            *self.test.tokens(),
+            Symbols.RP,
+            Symbols.SPACE,
+            Symbols.LS,
+            *self.block.tokens(),
+            Symbols.NEWLINE,
+            Symbols.RS
+        ]
+
+
+@dataclass(frozen=True)
+class ClassField(Statement):
+    name: str
+    value: Expression
+    static: bool = False
+
+    def tokens(self) -> list[str]:
+        tokens = []
+
+        if self.static:
+            tokens.extend([
+                Keywords.STATIC,
+                Symbols.SPACE
+            ])
+
+        return [
+            *tokens,
+            self.name,
+            Symbols.SPACE,
+            Symbols.EQUAL,
+            Symbols.SPACE,
+            *self.value.tokens()
+        ]
+
+
+@dataclass(frozen=True)
+class Array(Object):
+    items: list[Expression]
+
+    def tokens(self) -> list[str]:
+        tokens = [Symbols.LB]
+        for index, item in enumerate(self.items):
+            if index:
+                tokens.append(Symbols.COMMA)
+                tokens.append(Symbols.SPACE)
+            tokens.extend(item.tokens())
+
+        tokens.append(Symbols.RB)
+        return tokens
+
+
+@dataclass(frozen=True)
 class Method(Statement):
     name: str
     args: Args
     block: Block
+    static: bool = False
+    getter: bool = False
+    setter: bool = False
+
+    def __post_init__(self):
+        assert not (self.getter and self.setter), "A method can't be a getter and a setter"
 
     def tokens(self) -> list[str]:
+        tokens = []
+
+        if self.static:
+            tokens.extend([
+                Keywords.STATIC,
+                Symbols.SPACE
+            ])
+
+        if self.getter:
+            tokens.extend([
+                Keywords.GET,
+                Symbols.SPACE
+            ])
+
+        elif self.setter:
+            tokens.extend([
+                Keywords.SET,
+                Symbols.SPACE
+            ])
+
         return [
+            *tokens,
             self.name,
             Symbols.LP,
             *self.args.tokens(),
@@ -102,7 +389,7 @@ class Method(Statement):
         ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Class(Statement):
     name: str
     block: Block
@@ -120,7 +407,7 @@ class Class(Statement):
         ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Assign(Statement):
     obj: Object
     val: Expression
@@ -135,7 +422,7 @@ class Assign(Statement):
         ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Getattr(Object):
     obj: Object
     key: Var
@@ -148,4 +435,38 @@ class Getattr(Object):
         ]
 
 
+@dataclass(frozen=True)
+class Getitem(Object):
+    obj: Object
+    key: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            *self.obj.tokens(),
+            Symbols.LB,
+            *self.key.tokens(),
+            Symbols.RB
+        ]
+
+
+@dataclass(frozen=True)
+class Module(Code):
+    statements: list[Statement]
+
+    def tokens(self) -> list[str]:
+        tokens = []
+
+        for index, statement in enumerate(self.statements):
+            if index:
+                tokens.append(Symbols.NEWLINE)
+                tokens.append(Symbols.NEWLINE)
+
+            tokens.extend(statement.tokens())
+
+        return tokens
+
+
 THIS = Var('this')
+JSON = Var('JSON')
+OBJECT = Var('Object')
+DATE = Var('Date')
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import ast
+import os
 from abc import ABC
 from dataclasses import dataclass
 from typing import Union, Optional
 
 from .base import Code
+from ..writers import FileWriter, write_atomic
 
 __all__ = [
     'Keywords',
@@ -15,15 +18,47 @@ __all__ = [
     'Def',
     'Var',
     'Str',
+    'Int',
+    'Tuple',
+    'Dict',
+    'Typed',
     'Args',
+    'Keyword',
+    'Call',
+    'Assign',
+    'Getattr',
+    'Getitem',
+    'BinOp',
+    'Paren',
+    'IfExp',
+    'ListComp',
+    'Return',
+    'Raise',
+    'If',
+    'For',
+    'AugAssign',
+    'Decorator',
     'ImportFrom',
+    'Import',
     'Module',
+    'Package',
     'PASS',
     'CLS',
     'SELF',
+    'OBJECT',
+    'CLASSMETHOD',
+    'PROPERTY',
     'DATACLASS',
     'DATE',
-    'DATETIME'
+    'DATETIME',
+    'TIMEDELTA',
+    'DECIMAL',
+    'JSON_LOADS',
+    'ENCODE_BASESTRING',
+    'B64ENCODE',
+    'B64DECODE',
+    'ARRAY',
+    'IMPORT_MODULE'
 ]
 
 
@@ -33,6 +68,12 @@ class Keywords:
     DEF = "def"
     IMPORT = "import"
     FROM = "from"
+    RETURN = "return"
+    RAISE = "raise"
+    IF = "if"
+    ELSE = "else"
+    FOR = "for"
+    IN = "in"
 
 
 class Symbols:
@@ -46,6 +87,11 @@ class Symbols:
     EQUAL = "="
     DOT = "."
     AT = "@"
+    LS = "["
+    RS = "]"
+    LB = "{"
+    RB = "}"
+    ARROW = "->"
 
 
 class Statement(Code, ABC):
@@ -60,14 +106,17 @@ class Object(Expression, ABC):
     ...
 
 
-@dataclass
+@dataclass(frozen=True)
 class Block(Code):
     statements: list[Statement]
 
     def tokens(self) -> list[str]:
         tokens = []
 
-        for statement in self.statements:
+        for index, statement in enumerate(self.statements):
+            if index and isinstance(statement, (Class, Def, Decorator)):
+                tokens.append(Symbols.NEWLINE)
+
             tokens.append(Symbols.NEWLINE)
             tokens.append(Symbols.INDENT)
 
@@ -80,7 +129,7 @@ class Block(Code):
         return tokens
 
 
-@dataclass
+@dataclass(frozen=True)
 class Class(Statement):
     name: str
     block: Block
@@ -95,7 +144,7 @@ class Class(Statement):
         ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class ImportFrom(Statement):
     import_: Object
     from_: Union[Var, Args]
@@ -112,7 +161,19 @@ class ImportFrom(Statement):
         ]
 
 
-@dataclass
+@dataclass(frozen=True)
+class Import(Statement):
+    name: Object
+
+    def tokens(self) -> list[str]:
+        return [
+            Keywords.IMPORT,
+            Symbols.SPACE,
+            *self.name.tokens()
+        ]
+
+
+@dataclass(frozen=True)
 class Var(Object):
     name: str
     import_info: Optional[ImportFrom] = None
@@ -126,7 +187,7 @@ class Var(Object):
         ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Str(Object):
     value: str
 
@@ -136,7 +197,55 @@ class Str(Object):
         ]
 
 
-@dataclass
+@dataclass(frozen=True)
+class Int(Object):
+    value: int
+
+    def tokens(self) -> list[str]:
+        return [
+            repr(self.value)
+        ]
+
+
+@dataclass(frozen=True)
+class Tuple(Object):
+    items: list[Expression]
+
+    def tokens(self) -> list[str]:
+        tokens = [Symbols.LP]
+        for index, item in enumerate(self.items):
+            if index:
+                tokens.append(Symbols.COMMA)
+                tokens.append(Symbols.SPACE)
+            tokens.extend(item.tokens())
+
+        if len(self.items) == 1:
+            tokens.append(Symbols.COMMA)
+
+        tokens.append(Symbols.RP)
+        return tokens
+
+
+@dataclass(frozen=True)
+class Dict(Object):
+    items: list[tuple[Expression, Expression]]
+
+    def tokens(self) -> list[str]:
+        tokens = [Symbols.LB]
+        for index, (key, value) in enumerate(self.items):
+            if index:
+                tokens.append(Symbols.COMMA)
+                tokens.append(Symbols.SPACE)
+            tokens.extend(key.tokens())
+            tokens.append(Symbols.COLON)
+            tokens.append(Symbols.SPACE)
+            tokens.extend(value.tokens())
+
+        tokens.append(Symbols.RB)
+        return tokens
+
+
+@dataclass(frozen=True)
 class Typed(Object, Statement):
     obj: Object
     typ: Var
@@ -150,7 +259,7 @@ class Typed(Object, Statement):
         ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Args(Code):
     args: list[Var]
 
@@ -165,26 +274,117 @@ class Args(Code):
         return tokens
 
 
-@dataclass
+@dataclass(frozen=True)
+class Keyword(Code):
+    name: str
+    value: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            self.name,
+            Symbols.EQUAL,
+            *self.value.tokens()
+        ]
+
+
+@dataclass(frozen=True)
+class Call(Object, Statement):
+    func: Object
+    args: Args
+
+    def tokens(self) -> list[str]:
+        return [
+            *self.func.tokens(),
+            Symbols.LP,
+            *self.args.tokens(),
+            Symbols.RP
+        ]
+
+
+@dataclass(frozen=True)
 class Def(Statement):
     name: str
     args: Args
     block: Block
+    returns: Optional[Object] = None
 
     def tokens(self) -> list[str]:
-        return [
+        tokens = [
             Keywords.DEF,
             Symbols.SPACE,
             self.name,
             Symbols.LP,
             *self.args.tokens(),
-            Symbols.RP,
+            Symbols.RP
+        ]
+
+        if self.returns:
+            tokens.extend([
+                Symbols.SPACE,
+                Symbols.ARROW,
+                Symbols.SPACE,
+                *self.returns.tokens()
+            ])
+
+        tokens.extend([
             Symbols.COLON,
             *self.block.tokens()
+        ])
+
+        return tokens
+
+
+@dataclass(frozen=True)
+class Return(Statement):
+    value: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            Keywords.RETURN,
+            Symbols.SPACE,
+            *self.value.tokens()
         ]
 
 
-@dataclass
+@dataclass(frozen=True)
+class Raise(Statement):
+    exc: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            Keywords.RAISE,
+            Symbols.SPACE,
+            *self.exc.tokens()
+        ]
+
+
+@dataclass(frozen=True)
+class If(Statement):
+    test: Expression
+    block: Block
+    orelse: Optional[Block] = None
+
+    def tokens(self) -> list[str]:
+        tokens = [
+            Keywords.IF,
+            Symbols.SPACE,
+            *self.test.tokens(),
+            Symbols.COLON,
+            *self.block.tokens()
+        ]
+
+        if self.orelse:
+            tokens.extend([
+                Symbols.NEWLINE,
+                Keywords.ELSE,
+                Symbols.COLON,
+                *self.orelse.tokens()
+            ])
+
+        return tokens
+
+
+@dataclass(frozen=True)
 class Assign(Statement):
     obj: Object
     val: Expression
@@ -199,7 +399,7 @@ class Assign(Statement):
         ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Getattr(Object):
     obj: Object
     key: Var
@@ -212,12 +412,144 @@ class Getattr(Object):
         ]
 
 
+@dataclass(frozen=True)
+class For(Statement):
+    target: Union[Var, Args]
+    iter: Expression
+    block: Block
+
+    def tokens(self) -> list[str]:
+        return [
+            Keywords.FOR,
+            Symbols.SPACE,
+            *self.target.tokens(),
+            Symbols.SPACE,
+            Keywords.IN,
+            Symbols.SPACE,
+            *self.iter.tokens(),
+            Symbols.COLON,
+            *self.block.tokens()
+        ]
+
+
+@dataclass(frozen=True)
+class AugAssign(Statement):
+    obj: Object
+    op: str
+    val: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            *self.obj.tokens(),
+            Symbols.SPACE,
+            self.op,
+            Symbols.EQUAL,
+            Symbols.SPACE,
+            *self.val.tokens()
+        ]
+
+
+@dataclass(frozen=True)
+class Getitem(Object):
+    obj: Object
+    key: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            *self.obj.tokens(),
+            Symbols.LS,
+            *self.key.tokens(),
+            Symbols.RS
+        ]
+
+
+@dataclass(frozen=True)
+class BinOp(Expression):
+    left: Expression
+    op: str
+    right: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            *self.left.tokens(),
+            Symbols.SPACE,
+            self.op,
+            Symbols.SPACE,
+            *self.right.tokens()
+        ]
+
+
+@dataclass(frozen=True)
+class Paren(Object):
+    value: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            Symbols.LP,
+            *self.value.tokens(),
+            Symbols.RP
+        ]
+
+
+@dataclass(frozen=True)
+class IfExp(Expression):
+    body: Expression
+    test: Expression
+    orelse: Expression
+
+    def tokens(self) -> list[str]:
+        return [
+            *self.body.tokens(),
+            Symbols.SPACE,
+            Keywords.IF,
+            Symbols.SPACE,
+            *self.test.tokens(),
+            Symbols.SPACE,
+            Keywords.ELSE,
+            Symbols.SPACE,
+            *self.orelse.tokens()
+        ]
+
+
+@dataclass(frozen=True)
+class ListComp(Object):
+    elt: Expression
+    target: Union[Var, Args]
+    iter: Expression
+    test: Optional[Expression] = None
+
+    def tokens(self) -> list[str]:
+        tokens = [
+            Symbols.LS,
+            *self.elt.tokens(),
+            Symbols.SPACE,
+            Keywords.FOR,
+            Symbols.SPACE,
+            *self.target.tokens(),
+            Symbols.SPACE,
+            Keywords.IN,
+            Symbols.SPACE,
+            *self.iter.tokens()
+        ]
+
+        if self.test:
+            tokens.extend([
+                Symbols.SPACE,
+                Keywords.IF,
+                Symbols.SPACE,
+                *self.test.tokens()
+            ])
+
+        tokens.append(Symbols.RS)
+        return tokens
+
+
 class _Pass(Statement):
     def tokens(self) -> list[str]:
         return [Keywords.PASS]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Decorator(Statement):
     base: Object
     over: Union['Decorator', Class, Def]
@@ -231,7 +563,7 @@ class Decorator(Statement):
         ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Module(Code):
     statements: list[Statement]
 
@@ -242,7 +574,8 @@ class Module(Code):
 
         for statement in self.statements:
             if isinstance(statement, ImportFrom):
-                imports.append(statement)
+                if statement not in imports:
+                    imports.append(statement)
             else:
                 statements.append(statement)
 
@@ -252,7 +585,7 @@ class Module(Code):
                 tokens.append(Symbols.NEWLINE)
 
         for statement in statements:
-            if isinstance(statement, Class):
+            if isinstance(statement, (Class, Def, Decorator)):
                 tokens.append(Symbols.NEWLINE)
                 tokens.append(Symbols.NEWLINE)
             tokens.extend(statement.tokens())
@@ -260,16 +593,85 @@ class Module(Code):
 
         return tokens
 
-    def save_to(self, dst: str) -> None:
-        with open(dst, mode="w", encoding="utf-8") as file:
-            file.write(str(self))
+    def save_to(self, dst: str) -> bool:
+        """Write the module to `dst` atomically unless unchanged, see `write_atomic`. Return whether it was written."""
+        return write_atomic(dst, self.render_bytes())
+
+
+def _indexed_modules(path: str) -> set[str]:
+    """
+        Names of the modules listed in the `_MODULES = {class name: '.module', ...}` index of the `__init__.py` at
+        `path`, empty if there is no such index.
+    """
+    try:
+        with open(path, encoding='utf-8') as file:
+            tree = ast.parse(file.read())
+    except (OSError, SyntaxError, ValueError):
+        return set()
+
+    for statement in tree.body:
+        if isinstance(statement, ast.Assign) and \
+                any(isinstance(target, ast.Name) and target.id == '_MODULES' for target in statement.targets):
+            try:
+                index = ast.literal_eval(statement.value)
+            except ValueError:
+                return set()
+
+            if isinstance(index, dict):
+                modules = (module[1:] for module in index.values() if isinstance(module, str) and module[:1] == '.')
+                # only the modules of the package itself, never a path out of it.
+                return {module for module in modules if module.isidentifier()}
+
+    return set()
+
+
+@dataclass
+class Package:
+    """Modules of a package by module name, '__init__' included."""
+    modules: dict[str, Module]
+
+    def save_to(self, dst: str) -> int:
+        """
+            Write the modules in the `dst` directory, created if missing, by a `FileWriter` : the modules are written
+            concurrently and atomically, the unchanged ones being skipped. Return the number of modules written.
+            The modules of a previous generation, listed in the `_MODULES` index of its `__init__.py`, which aren't
+            part of the package anymore are removed once the modules are written, so that they can't be imported
+            anymore. The other files of `dst` are left as they are.
+        """
+        os.makedirs(dst, exist_ok=True)
+        previous = _indexed_modules(os.path.join(dst, "__init__.py"))
+
+        with FileWriter() as writer:
+            for name, module in self.modules.items():
+                writer.write(os.path.join(dst, name + ".py"), module.render_bytes())
+
+        for name in previous.difference(self.modules):
+            path = os.path.join(dst, name + ".py")
+
+            if os.path.isfile(path):
+                os.remove(path)
+
+        return writer.written
 
 
 PASS = _Pass()
 
 CLS = Var('cls')
 SELF = Var('self')
+OBJECT = Var('object')
+CLASSMETHOD = Var('classmethod')
+PROPERTY = Var('property')
 
 DATACLASS = Var('dataclass', import_info=ImportFrom(Var('dataclasses'), Var('dataclass')))
 DATE = Var('date', import_info=ImportFrom(Var('datetime'), Var('date')))
 DATETIME = Var('datetime', import_info=ImportFrom(Var('datetime'), Var('datetime')))
+TIMEDELTA = Var('timedelta', import_info=ImportFrom(Var('datetime'), Var('timedelta')))
+DECIMAL = Var('Decimal', import_info=ImportFrom(Var('decimal'), Var('Decimal')))
+JSON_LOADS = Var('loads', import_info=ImportFrom(Var('json'), Var('loads')))
+ENCODE_BASESTRING = Var('encode_basestring', import_info=ImportFrom(
+    Getattr(Var('json'), Var('encoder')), Var('encode_basestring')
+))
+B64ENCODE = Var('b64encode', import_info=ImportFrom(Var('base64'), Var('b64encode')))
+B64DECODE = Var('b64decode', import_info=ImportFrom(Var('base64'), Var('b64decode')))
+ARRAY = Var('array', import_info=ImportFrom(Var('array'), Var('array')))
+IMPORT_MODULE = Var('import_module', import_info=ImportFrom(Var('importlib'), Var('import_module')))
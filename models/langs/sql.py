@@ -10,12 +10,18 @@ from enum import Enum
 from typing import Optional, Union
 
 from .base import Code
+from ..writers import write_atomic
 
 __all__ = [
     'Keywords',
     'Symbols',
     'CreateTable',
     'ColumnConstraint',
+    'ConflictClause',
+    'Expression',
+    'LiteralValue',
+    'SignedNumber',
+    'CollationName',
     'PrimaryKey',
     'NotNull',
     'Unique',
@@ -25,7 +31,12 @@ __all__ = [
     'Action',
     'ForeignKeyClause',
     'Generated',
+    'TypeName',
     'ColumnDefinition',
+    'Update',
+    'Insert',
+    'LoadData',
+    'Import',
     'Commands'
 ]
 
@@ -61,6 +72,25 @@ class Keywords:
     TEMPORARY = "TEMPORARY"
     IF = "IF"
     EXISTS = "EXISTS"
+    WHERE = "WHERE"
+    AND = "AND"
+    CONFLICT = "CONFLICT"
+    INSERT = "INSERT"
+    INTO = "INTO"
+    VALUES = "VALUES"
+    LOAD = "LOAD"
+    DATA = "DATA"
+    LOCAL = "LOCAL"
+    INFILE = "INFILE"
+    FIELDS = "FIELDS"
+    TERMINATED = "TERMINATED"
+    BY = "BY"
+    OPTIONALLY = "OPTIONALLY"
+    ENCLOSED = "ENCLOSED"
+    ESCAPED = "ESCAPED"
+    LINES = "LINES"
+    IGNORE = "IGNORE"
+    UNSIGNED = "UNSIGNED"
 
 
 class Symbols:
@@ -72,13 +102,17 @@ class Symbols:
     RP = ")"
     DOT = "."
     INDENT = "    "
+    EQUAL = "="
+    QMARK = "?"
+    QUOTE = "'"
+    AT = "@"
 
 
 class Statement(Code, ABC):
     ...
 
 
-@dataclass
+@dataclass(frozen=True)
 class CreateTable(Statement):
     name: str
     columns: list[ColumnDefinition] = field(default_factory=list)
@@ -171,9 +205,74 @@ class Order(str, Enum):
     DESC = "DESC"
 
 
-@dataclass
+@dataclass(frozen=True)
+class ConflictClause(Code):
+    """ON CONFLICT clause, empty without `resolution` (ROLLBACK, ABORT, FAIL, IGNORE or REPLACE)."""
+    resolution: Optional[str] = None
+
+    def tokens(self) -> list[str]:
+        if not self.resolution:
+            return []
+
+        return [
+            Keywords.ON,
+            Symbols.SPACE,
+            Keywords.CONFLICT,
+            Symbols.SPACE,
+            self.resolution
+        ]
+
+
+@dataclass(frozen=True)
+class Expression(Code):
+    """Expression kept as its SQL source text."""
+    text: str
+
+    def tokens(self) -> list[str]:
+        return [
+            self.text
+        ]
+
+
+@dataclass(frozen=True)
+class LiteralValue(Code):
+    """Literal as written in SQL : quoted string, blob, NULL, TRUE, FALSE, CURRENT_TIMESTAMP, ..."""
+    value: str
+
+    def tokens(self) -> list[str]:
+        return [
+            self.value
+        ]
+
+
+@dataclass(frozen=True)
+class SignedNumber(Code):
+    value: str
+
+    def tokens(self) -> list[str]:
+        return [
+            self.value
+        ]
+
+
+@dataclass(frozen=True)
+class CollationName(Code):
+    name: str
+
+    def tokens(self) -> list[str]:
+        return [
+            self.name
+        ]
+
+
+def _conflict_tokens(conflict_clause: ConflictClause) -> list[str]:
+    tokens = conflict_clause.tokens()
+    return [Symbols.SPACE, *tokens] if tokens else []
+
+
+@dataclass(frozen=True)
 class PrimaryKey(ColumnConstraint):
-    conflict_clause: ConflictClause
+    conflict_clause: ConflictClause = field(default_factory=ConflictClause)
     auto_increment: bool = False
     name: Optional[str] = None
     order: Optional[Order] = None
@@ -192,17 +291,16 @@ class PrimaryKey(ColumnConstraint):
         tokens.extend([
             Keywords.PRIMARY,
             Symbols.SPACE,
-            Keywords.KEY,
-            Symbols.SPACE
+            Keywords.KEY
         ])
 
         if self.order:
             tokens.extend([
-                self.order.name,
-                Symbols.SPACE
+                Symbols.SPACE,
+                self.order.name
             ])
 
-        tokens.extend(self.conflict_clause.tokens())
+        tokens.extend(_conflict_tokens(self.conflict_clause))
 
         if self.auto_increment:
             tokens.extend([
@@ -213,9 +311,9 @@ class PrimaryKey(ColumnConstraint):
         return tokens
 
 
-@dataclass
+@dataclass(frozen=True)
 class NotNull(ColumnConstraint):
-    conflict_clause: ConflictClause
+    conflict_clause: ConflictClause = field(default_factory=ConflictClause)
     name: Optional[str] = None
 
     def tokens(self) -> list[str]:
@@ -232,18 +330,17 @@ class NotNull(ColumnConstraint):
         tokens.extend([
             Keywords.NOT,
             Symbols.SPACE,
-            Keywords.NULL,
-            Symbols.SPACE
+            Keywords.NULL
         ])
 
-        tokens.extend(self.conflict_clause.tokens())
+        tokens.extend(_conflict_tokens(self.conflict_clause))
 
         return tokens
 
 
-@dataclass
+@dataclass(frozen=True)
 class Unique(ColumnConstraint):
-    conflict_clause: ConflictClause
+    conflict_clause: ConflictClause = field(default_factory=ConflictClause)
     name: Optional[str] = None
 
     def tokens(self) -> list[str]:
@@ -257,17 +354,13 @@ class Unique(ColumnConstraint):
                 Symbols.SPACE
             ])
 
-        tokens.extend([
-            Keywords.UNIQUE,
-            Symbols.SPACE
-        ])
-
-        tokens.extend(self.conflict_clause.tokens())
+        tokens.append(Keywords.UNIQUE)
+        tokens.extend(_conflict_tokens(self.conflict_clause))
 
         return tokens
 
 
-@dataclass
+@dataclass(frozen=True)
 class Check(ColumnConstraint):
     expr: Expression
     name: Optional[str] = None
@@ -293,7 +386,7 @@ class Check(ColumnConstraint):
         return tokens
 
 
-@dataclass
+@dataclass(frozen=True)
 class Default(ColumnConstraint):
     expr: Union[Expression, LiteralValue, SignedNumber]
     name: Optional[str] = None
@@ -330,7 +423,7 @@ class Default(ColumnConstraint):
         return tokens
 
 
-@dataclass
+@dataclass(frozen=True)
 class Collate(ColumnConstraint):
     collation_name: CollationName
     name: Optional[str] = None
@@ -348,6 +441,7 @@ class Collate(ColumnConstraint):
 
         tokens.extend([
             Keywords.COLLATE,
+            Symbols.SPACE,
             *self.collation_name.tokens()
         ])
 
@@ -407,7 +501,7 @@ class Action:
     NO_ACTION = _NoAction()
 
 
-@dataclass
+@dataclass(frozen=True)
 class ForeignKeyClause(ColumnConstraint):
     foreign_table: str
     column_names: list[str] = field(default_factory=list)
@@ -471,7 +565,7 @@ class ForeignKeyClause(ColumnConstraint):
         return tokens
 
 
-@dataclass
+@dataclass(frozen=True)
 class Generated(ColumnConstraint):
     expr: Expression
     always: bool = False
@@ -515,10 +609,17 @@ class Generated(ColumnConstraint):
         return tokens
 
 
-@dataclass
+def _quote(text: str) -> str:
+    return Symbols.QUOTE + text.replace(Symbols.QUOTE, Symbols.QUOTE + Symbols.QUOTE) + Symbols.QUOTE
+
+
+@dataclass(frozen=True)
 class TypeName(Code):
     name: str
     args: list[str] = field(default_factory=list)
+    cfg_quote: bool = False
+    # MySQL numeric attribute.
+    unsigned: bool = False
 
     def tokens(self) -> list[str]:
         tokens = [
@@ -526,22 +627,24 @@ class TypeName(Code):
         ]
 
         if self.args:
-            tokens.append(Symbols.LP)
-
-            for index, arg in enumerate(self.args):
-                if index:
-                    tokens.extend([
-                        Symbols.COMMA,
-                        Symbols.SPACE
-                    ])
-                tokens.append(arg)
+            # the arguments are joined in a single token, ENUM can have up to 65535 of them.
+            args = map(_quote, self.args) if self.cfg_quote else self.args
+            tokens.extend([
+                Symbols.LP,
+                (Symbols.COMMA + Symbols.SPACE).join(args),
+                Symbols.RP
+            ])
 
-            tokens.append(Symbols.RP)
+        if self.unsigned:
+            tokens.extend([
+                Symbols.SPACE,
+                Keywords.UNSIGNED
+            ])
 
         return tokens
 
 
-@dataclass
+@dataclass(frozen=True)
 class ColumnDefinition(Code):
     name: str
     datatype: Optional[TypeName] = None
@@ -566,7 +669,279 @@ class ColumnDefinition(Code):
         return tokens
 
 
-@dataclass
+@dataclass(frozen=True)
+class Update(Statement):
+    """
+        Parametrized UPDATE statement, every value is bound with a '?' placeholder.
+        Parameters are expected in order : the `columns` values then the `keys` values.
+    """
+    name: str
+    columns: list[str]
+    keys: list[str] = field(default_factory=list)
+    schema_name: Optional[str] = None
+
+    def tokens(self) -> list[str]:
+        tokens = [
+            Keywords.UPDATE,
+            Symbols.SPACE
+        ]
+
+        if self.schema_name:
+            tokens.extend([
+                self.schema_name,
+                Symbols.DOT
+            ])
+
+        tokens.extend([
+            self.name,
+            Symbols.SPACE,
+            Keywords.SET,
+            Symbols.SPACE
+        ])
+
+        for index, column in enumerate(self.columns):
+            if index:
+                tokens.extend([
+                    Symbols.COMMA,
+                    Symbols.SPACE
+                ])
+
+            tokens.extend([
+                column,
+                Symbols.SPACE,
+                Symbols.EQUAL,
+                Symbols.SPACE,
+                Symbols.QMARK
+            ])
+
+        for index, key in enumerate(self.keys):
+            tokens.extend([
+                Symbols.SPACE,
+                Keywords.AND if index else Keywords.WHERE,
+                Symbols.SPACE,
+                key,
+                Symbols.SPACE,
+                Symbols.EQUAL,
+                Symbols.SPACE,
+                Symbols.QMARK
+            ])
+
+        tokens.append(Symbols.SEMICOLON)
+
+        return tokens
+
+
+@dataclass(frozen=True)
+class Insert(Statement):
+    """Parametrized INSERT statement of a single row, to be run with `executemany` for batches."""
+    name: str
+    columns: list[str]
+    schema_name: Optional[str] = None
+
+    def tokens(self) -> list[str]:
+        tokens = [
+            Keywords.INSERT,
+            Symbols.SPACE,
+            Keywords.INTO,
+            Symbols.SPACE
+        ]
+
+        if self.schema_name:
+            tokens.extend([
+                self.schema_name,
+                Symbols.DOT
+            ])
+
+        tokens.extend([
+            self.name,
+            Symbols.SPACE,
+            Symbols.LP,
+            (Symbols.COMMA + Symbols.SPACE).join(self.columns),
+            Symbols.RP,
+            Symbols.SPACE,
+            Keywords.VALUES,
+            Symbols.SPACE,
+            Symbols.LP,
+            (Symbols.COMMA + Symbols.SPACE).join(Symbols.QMARK * len(self.columns)),
+            Symbols.RP,
+            Symbols.SEMICOLON
+        ])
+
+        return tokens
+
+
+# escapes of the MySQL string literals.
+_MYSQL_ESCAPES = str.maketrans({'\\': '\\\\', "'": "\\'", '\0': '\\0', '\n': '\\n', '\r': '\\r', '\t': '\\t'})
+
+
+def _mysql_quote(text: str) -> str:
+    return Symbols.QUOTE + text.translate(_MYSQL_ESCAPES) + Symbols.QUOTE
+
+
+@dataclass(frozen=True)
+class LoadData(Statement):
+    """
+        MySQL LOAD DATA statement of a CSV file, see https://dev.mysql.com/doc/refman/8.0/en/load-data.html
+        `columns` maps the fields of the file, in order, to column names or to '@variables', the variables being
+        assigned to their column by the `assignments` expressions, e.g. ('data', Expression('UNHEX(@data)')).
+    """
+    path: str
+    name: str
+    columns: list[str] = field(default_factory=list)
+    assignments: list[tuple[str, Expression]] = field(default_factory=list)
+    schema_name: Optional[str] = None
+    cfg_local: bool = False
+    cfg_delimiter: str = ","
+    cfg_enclosure: str = '"'
+    cfg_escape: str = "\\"
+    cfg_line_terminator: str = "\n"
+    cfg_ignore_lines: int = 0
+
+    def tokens(self) -> list[str]:
+        tokens = [
+            Keywords.LOAD,
+            Symbols.SPACE,
+            Keywords.DATA,
+            Symbols.SPACE
+        ]
+
+        if self.cfg_local:
+            tokens.extend([
+                Keywords.LOCAL,
+                Symbols.SPACE
+            ])
+
+        tokens.extend([
+            Keywords.INFILE,
+            Symbols.SPACE,
+            _mysql_quote(self.path),
+            Symbols.SPACE,
+            Keywords.INTO,
+            Symbols.SPACE,
+            Keywords.TABLE,
+            Symbols.SPACE
+        ])
+
+        if self.schema_name:
+            tokens.extend([
+                self.schema_name,
+                Symbols.DOT
+            ])
+
+        tokens.extend([
+            self.name,
+            Symbols.NEWLINE,
+            Keywords.FIELDS,
+            Symbols.SPACE,
+            Keywords.TERMINATED,
+            Symbols.SPACE,
+            Keywords.BY,
+            Symbols.SPACE,
+            _mysql_quote(self.cfg_delimiter),
+            Symbols.SPACE,
+            Keywords.OPTIONALLY,
+            Symbols.SPACE,
+            Keywords.ENCLOSED,
+            Symbols.SPACE,
+            Keywords.BY,
+            Symbols.SPACE,
+            _mysql_quote(self.cfg_enclosure),
+            Symbols.SPACE,
+            Keywords.ESCAPED,
+            Symbols.SPACE,
+            Keywords.BY,
+            Symbols.SPACE,
+            _mysql_quote(self.cfg_escape),
+            Symbols.NEWLINE,
+            Keywords.LINES,
+            Symbols.SPACE,
+            Keywords.TERMINATED,
+            Symbols.SPACE,
+            Keywords.BY,
+            Symbols.SPACE,
+            _mysql_quote(self.cfg_line_terminator)
+        ])
+
+        if self.cfg_ignore_lines:
+            tokens.extend([
+                Symbols.NEWLINE,
+                Keywords.IGNORE,
+                Symbols.SPACE,
+                str(self.cfg_ignore_lines),
+                Symbols.SPACE,
+                Keywords.LINES
+            ])
+
+        if self.columns:
+            tokens.extend([
+                Symbols.NEWLINE,
+                Symbols.LP,
+                (Symbols.COMMA + Symbols.SPACE).join(self.columns),
+                Symbols.RP
+            ])
+
+        for index, (column, expression) in enumerate(self.assignments):
+            tokens.extend([
+                Symbols.COMMA if index else Symbols.NEWLINE + Keywords.SET,
+                Symbols.SPACE,
+                column,
+                Symbols.SPACE,
+                Symbols.EQUAL,
+                Symbols.SPACE,
+                *expression.tokens()
+            ])
+
+        tokens.append(Symbols.SEMICOLON)
+
+        return tokens
+
+
+@dataclass(frozen=True)
+class Import(Statement):
+    """
+        `.import` dot-command of the sqlite3 shell, loading a CSV file into an existing table.
+        It is not SQL : the commands holding it must be run by the sqlite3 shell, not by `executescript`.
+    """
+    path: str
+    name: str
+    schema_name: Optional[str] = None
+    cfg_skip: int = 0
+
+    def tokens(self) -> list[str]:
+        assert '"' not in self.path, "The sqlite3 shell can't quote a path with double quotes!"
+        tokens = [
+            ".import",
+            Symbols.SPACE,
+            "--csv"
+        ]
+
+        if self.schema_name:
+            tokens.extend([
+                Symbols.SPACE,
+                "--schema",
+                Symbols.SPACE,
+                self.schema_name
+            ])
+
+        if self.cfg_skip:
+            tokens.extend([
+                Symbols.SPACE,
+                "--skip",
+                Symbols.SPACE,
+                str(self.cfg_skip)
+            ])
+
+        tokens.extend([
+            Symbols.SPACE,
+            '"' + self.path + '"',
+            Symbols.SPACE,
+            self.name
+        ])
+
+        return tokens
+
+
+@dataclass(frozen=True)
 class Commands(Code):
     statements: list[Statement]
 
@@ -581,6 +956,6 @@ class Commands(Code):
 
         return tokens
 
-    def save_to(self, dst: str) -> None:
-        with open(dst, mode="w", encoding="utf-8") as file:
-            file.write(str(self))
+    def save_to(self, dst: str) -> bool:
+        """Write to `dst` atomically unless unchanged, see `write_atomic`. Return whether it was written."""
+        return write_atomic(dst, self.render_bytes())
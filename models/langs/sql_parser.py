@@ -0,0 +1,449 @@
+"""
+    Streaming parser of the CREATE TABLE statements of SQL dumps (mysqldump, sqlite .schema, ...) to `sql` nodes.
+    Other statements are skipped, as well as the table constraints and options which `sql.CreateTable` can't express,
+    except the single column PRIMARY KEY and FOREIGN KEY constraints which are moved on their column.
+"""
+import re
+from typing import Iterator, Optional, TextIO
+
+from . import sql
+from .base import Code
+
+__all__ = [
+    'Token',
+    'tokenize',
+    'parse'
+]
+
+WORD = 'word'
+QUOTED = 'quoted'
+STRING = 'string'
+NUMBER = 'number'
+SYMBOL = 'symbol'
+
+# leading spaces are part of the tokens, saving a match per token.
+_TOKEN = re.compile(r"""
+    \s*(?:
+      (?P<comment>--[^\n]*|\#[^\n]*|/\*.*?\*/)
+    | (?P<string>'(?:[^'\\]|\\.|'')*')
+    | (?P<quoted>`(?:[^`]|``)*`|"(?:[^"]|"")*"|\[[^\]]*\])
+    | (?P<number>0[xX][0-9a-fA-F]+|(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)
+    | (?P<word>[^\W\d]\w*)
+    | (?P<opening>/\*|['`"\[])
+    | (?P<symbol>[^\s\w'`"\[])
+    | (?P<space>$)
+    )
+""", re.VERBOSE | re.DOTALL)
+
+_COLUMN_CONSTRAINTS = frozenset({
+    'CONSTRAINT', 'PRIMARY', 'NOT', 'NULL', 'UNIQUE', 'CHECK', 'DEFAULT', 'COLLATE', 'REFERENCES', 'GENERATED', 'AS'
+})
+_TABLE_CONSTRAINTS = frozenset({
+    'CONSTRAINT', 'PRIMARY', 'UNIQUE', 'CHECK', 'FOREIGN', 'KEY', 'INDEX', 'FULLTEXT', 'SPATIAL'
+})
+_ACTIONS = {
+    'CASCADE': sql.Action.CASCADE,
+    'RESTRICT': sql.Action.RESTRICT
+}
+
+# (kind, text, keyword), keyword being the upper case text of the words and symbols, else None.
+Token = tuple[str, str, Optional[str]]
+
+
+def tokenize(stream: TextIO, chunk_size: int = 1 << 20) -> Iterator[Token]:
+    """Tokens of `stream`, read by chunks of `chunk_size` characters, spaces and comments being dropped."""
+    buffer = ''
+    final = False
+
+    while not final:
+        chunk = stream.read(chunk_size)
+        final = not chunk
+        buffer += chunk
+        position = 0
+        end = len(buffer)
+        # a string, quoted identifier or comment cut by the end of the chunk may still match up to an escaped quote
+        # ('it' of 'it''s' or `a` of `a``b`) : it is only accepted once a later token has matched after it.
+        pending = None
+
+        for match in _TOKEN.finditer(buffer):
+            kind = match.lastgroup
+
+            # the token may continue in the next chunk : 'it''s', 1e+5, ...
+            if not final and (match.end() + 2 >= end or kind == 'opening'):
+                break
+
+            if kind == 'opening':
+                raise Exception(f"Unterminated {match.group(kind)!r} in the SQL dump!")
+
+            if pending is not None:
+                position = pending.end()
+                if pending.lastgroup != 'comment':
+                    yield pending.lastgroup, pending.group(pending.lastgroup), None
+                pending = None
+
+            if not final and (kind == STRING or kind == QUOTED or kind == 'comment'):
+                pending = match
+                continue
+
+            position = match.end()
+
+            if kind == WORD or kind == SYMBOL:
+                text = match.group(kind)
+                yield kind, text, text.upper()
+            elif kind != 'space' and kind != 'comment':
+                yield kind, match.group(kind), None
+
+        buffer = buffer[position:]
+
+
+def _unquote(text: str) -> str:
+    if text[0] == '`':
+        return text[1:-1].replace('``', '`')
+    elif text[0] == '"':
+        return text[1:-1].replace('""', '"')
+    elif text[0] == '[':
+        return text[1:-1]
+    return text
+
+
+def _string_value(text: str) -> str:
+    """Value of the SQL string literal `text`."""
+    return re.sub(r"''|\\(.)", lambda match: "'" if match.group() == "''" else match.group(1), text[1:-1])
+
+
+class _Parser:
+    def __init__(self, tokens: Iterator[Token]):
+        self._tokens = tokens
+        self._token: Optional[Token] = next(tokens, None)
+        self._keyword = self._token and self._token[2]
+
+    def peek(self) -> Optional[Token]:
+        return self._token
+
+    def next(self) -> Token:
+        token = self._token
+        assert token is not None, "Unexpected end of the SQL dump!"
+        self._token = next(self._tokens, None)
+        self._keyword = self._token and self._token[2]
+        return token
+
+    def at(self, *texts: str) -> bool:
+        """Whether the current token is one of the keywords or symbols `texts`."""
+        return self._keyword in texts
+
+    def accept(self, *texts: str) -> bool:
+        if self._keyword in texts:
+            self.next()
+            return True
+        return False
+
+    def expect(self, text: str) -> None:
+        token = self.next()
+        assert token[2] == text, f"Expected {text!r}, found {token[1]!r}!"
+
+    def name(self) -> str:
+        kind, text, _ = self.next()
+        assert kind in (WORD, QUOTED, STRING), f"Expected a name, found {text!r}!"
+        return _string_value(text) if kind == STRING else _unquote(text)
+
+    def names(self) -> list[str]:
+        self.expect('(')
+        names = [self.name()]
+        self.skip_arguments()
+
+        while self.accept(','):
+            names.append(self.name())
+            self.skip_arguments()
+
+        self.expect(')')
+        return names
+
+    def skip_arguments(self) -> None:
+        """Skip the prefix length and order of an indexed column."""
+        if self.at('('):
+            self.group()
+        self.accept('ASC', 'DESC')
+
+    def group(self) -> str:
+        """Source text of the parenthesized group, without the outer parentheses."""
+        self.expect('(')
+        depth = 1
+        texts = []
+        previous = None
+
+        while True:
+            kind, text, _ = self.next()
+            if text == '(':
+                depth += 1
+            elif text == ')':
+                depth -= 1
+                if not depth:
+                    break
+
+            if texts and not (texts[-1] == '(' or texts[-1] == '.' or text in (')', ',', '.') or
+                              text == '(' and previous == WORD):
+                texts.append(' ')
+            texts.append(text)
+            previous = kind
+
+        return ''.join(texts)
+
+    def skip_item(self) -> None:
+        """Skip the tokens up to the next ',' or ')' of the current level."""
+        while not self.at(',', ')'):
+            if self.at('('):
+                self.group()
+            else:
+                self.next()
+
+    def skip_statement(self) -> None:
+        while self.peek() is not None and not self.accept(';'):
+            if self.at('('):
+                self.group()
+            else:
+                self.next()
+
+    def statements(self) -> Iterator[sql.CreateTable]:
+        while self.peek() is not None:
+            if self.accept('CREATE'):
+                command = self.create_table()
+                if command is not None:
+                    yield command
+            self.skip_statement()
+
+    def create_table(self) -> Optional[sql.CreateTable]:
+        temporary = self.accept('TEMPORARY', 'TEMP')
+
+        if not self.accept('TABLE'):
+            return None
+
+        if_not_exists = self.accept('IF')
+        if if_not_exists:
+            self.expect('NOT')
+            self.expect('EXISTS')
+
+        schema_name = None
+        name = self.name()
+
+        if self.accept('.'):
+            schema_name, name = name, self.name()
+
+        # CREATE TABLE ... AS SELECT and CREATE TABLE ... LIKE aren't supported.
+        if not self.at('('):
+            return None
+
+        # the nodes are immutable : the columns are collected as (name, datatype, constraints) until the end.
+        columns: list[tuple[str, Optional[sql.TypeName], list[sql.ColumnConstraint]]] = []
+        self.expect('(')
+
+        while True:
+            if self.at(*_TABLE_CONSTRAINTS):
+                self.table_constraint(columns)
+            else:
+                columns.append(self.column_definition())
+
+            if not self.accept(','):
+                break
+
+        self.expect(')')
+        return sql.CreateTable(
+            name=name,
+            columns=[
+                sql.ColumnDefinition(name=column_name, datatype=datatype, constraints=constraints)
+                for column_name, datatype, constraints in columns
+            ],
+            if_not_exists=if_not_exists,
+            temporary=temporary,
+            schema_name=schema_name,
+            cfg_expand=True
+        )
+
+    def table_constraint(self, columns: list[tuple[str, Optional[sql.TypeName], list[sql.ColumnConstraint]]]) \
+            -> None:
+        name = self.name() if self.accept('CONSTRAINT') and not self.at('PRIMARY', 'UNIQUE', 'CHECK', 'FOREIGN') \
+            else None
+        constraints = {column_name: column_constraints for column_name, _, column_constraints in columns}
+
+        if self.accept('PRIMARY'):
+            self.expect('KEY')
+            self.skip_index_name()
+            names = self.names()
+            if len(names) == 1 and names[0] in constraints:
+                constraints[names[0]].append(sql.PrimaryKey(name=name))
+
+        elif self.accept('FOREIGN'):
+            self.expect('KEY')
+            self.skip_index_name()
+            names = self.names()
+            self.expect('REFERENCES')
+            clause = self.foreign_key_clause(name)
+            if len(names) == 1 and names[0] in constraints:
+                constraints[names[0]].append(clause)
+
+        self.skip_item()
+
+    def skip_index_name(self) -> None:
+        if not self.at('('):
+            self.name()
+
+    def column_definition(self) -> tuple[str, Optional[sql.TypeName], list[sql.ColumnConstraint]]:
+        name = self.name()
+        datatype = None
+        constraints = []
+
+        if self.peek()[0] == WORD and not self.at(*_COLUMN_CONSTRAINTS):
+            datatype = self.type_name()
+
+        while not self.at(',', ')'):
+            constraint = self.column_constraint()
+            if constraint is not None:
+                constraints.append(constraint)
+
+        return name, datatype, constraints
+
+    def type_name(self) -> sql.TypeName:
+        name = self.next()[1].upper()
+        args = []
+        quote = False
+
+        # multiple words type names : DOUBLE PRECISION, CHARACTER VARYING, ...
+        while self.at('PRECISION', 'VARYING'):
+            name += ' ' + self.next()[1].upper()
+
+        if self.accept('('):
+            while True:
+                kind, text, _ = self.next()
+                if kind == STRING:
+                    args.append(_string_value(text))
+                    quote = True
+                else:
+                    args.append(text)
+
+                if not self.accept(','):
+                    break
+
+            self.expect(')')
+
+        # ZEROFILL implies UNSIGNED.
+        unsigned = False
+        while self.at('UNSIGNED', 'SIGNED', 'ZEROFILL'):
+            unsigned |= self.next()[2] != 'SIGNED'
+
+        return sql.TypeName(name=name, args=args, cfg_quote=quote, unsigned=unsigned)
+
+    def column_constraint(self) -> Optional[sql.ColumnConstraint]:
+        name = self.name() if self.accept('CONSTRAINT') else None
+
+        if self.accept('PRIMARY'):
+            self.expect('KEY')
+            order = sql.Order(self.next()[1].upper()) if self.at('ASC', 'DESC') else None
+            conflict_clause = self.conflict_clause()
+            return sql.PrimaryKey(
+                conflict_clause=conflict_clause,
+                auto_increment=self.accept('AUTOINCREMENT'),
+                name=name,
+                order=order
+            )
+
+        elif self.accept('NOT'):
+            self.expect('NULL')
+            return sql.NotNull(conflict_clause=self.conflict_clause(), name=name)
+
+        elif self.accept('UNIQUE'):
+            self.accept('KEY')
+            return sql.Unique(conflict_clause=self.conflict_clause(), name=name)
+
+        elif self.accept('CHECK'):
+            return sql.Check(expr=sql.Expression(self.group()), name=name)
+
+        elif self.accept('DEFAULT'):
+            return sql.Default(expr=self.default_value(), name=name)
+
+        elif self.accept('COLLATE'):
+            return sql.Collate(collation_name=sql.CollationName(self.name()), name=name)
+
+        elif self.accept('REFERENCES'):
+            return self.foreign_key_clause(name)
+
+        elif self.at('GENERATED', 'AS'):
+            always = self.accept('GENERATED')
+            if always:
+                self.expect('ALWAYS')
+            self.expect('AS')
+            return sql.Generated(
+                expr=sql.Expression(self.group()),
+                always=always,
+                stored=self.accept('STORED'),
+                virtual=self.accept('VIRTUAL'),
+                name=name
+            )
+
+        # MySQL attributes without equivalent : NULL, AUTO_INCREMENT, COMMENT '...', ON UPDATE ..., ...
+        elif self.at('('):
+            self.group()
+
+        else:
+            self.next()
+
+        return None
+
+    def conflict_clause(self) -> sql.ConflictClause:
+        # a MySQL ON UPDATE attribute can follow instead, its remaining tokens are then skipped.
+        if self.accept('ON') and self.accept('CONFLICT'):
+            return sql.ConflictClause(self.next()[1].upper())
+        return sql.ConflictClause()
+
+    def default_value(self) -> Code:
+        if self.at('('):
+            return sql.Expression(self.group())
+
+        elif self.at('-', '+'):
+            sign = self.next()[1]
+            return sql.SignedNumber(sign + self.next()[1])
+
+        kind, text, _ = self.next()
+
+        if kind == NUMBER:
+            return sql.SignedNumber(text)
+
+        # CURRENT_TIMESTAMP(6), NOW(), ...
+        if kind == WORD and self.at('('):
+            return sql.LiteralValue(f"{text}({self.group()})")
+
+        # b'0101' and x'1F' literals.
+        if kind == WORD and text.upper() in ('B', 'X') and self.peek() is not None and self.peek()[0] == STRING:
+            return sql.LiteralValue(text + self.next()[1])
+
+        return sql.LiteralValue(text)
+
+    def foreign_key_clause(self, name: Optional[str]) -> sql.ForeignKeyClause:
+        options = {'foreign_table': self.name(), 'name': name}
+
+        if self.at('('):
+            options['column_names'] = self.names()
+
+        while True:
+            if self.accept('ON'):
+                event = self.next()[1].upper()
+                options['on_delete' if event == 'DELETE' else 'on_update'] = self.action()
+
+            elif self.accept('MATCH'):
+                options['match_name'] = self.next()[1].upper()
+
+            else:
+                return sql.ForeignKeyClause(**options)
+
+    def action(self) -> Code:
+        if self.accept('SET'):
+            return sql.Action.SET_NULL if self.next()[1].upper() == 'NULL' else sql.Action.SET_DEFAULT
+
+        elif self.accept('NO'):
+            self.expect('ACTION')
+            return sql.Action.NO_ACTION
+
+        return _ACTIONS[self.next()[1].upper()]
+
+
+def parse(stream: TextIO, chunk_size: int = 1 << 20) -> Iterator[sql.CreateTable]:
+    """CREATE TABLE statements of the SQL dump `stream`, parsed in a single pass."""
+    return _Parser(tokenize(stream, chunk_size)).statements()
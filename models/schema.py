@@ -0,0 +1,181 @@
+import json
+import re
+from dataclasses import fields
+from functools import lru_cache
+from typing import Iterable, Iterator, TextIO
+
+from models import datatypes as dt
+from .core import Field, Model
+
+__all__ = [
+    'Schema'
+]
+
+_SINGLETONS = (
+    ('BOOLEAN', dt.BOOLEAN),
+    ('DATE', dt.DATE),
+    ('YEAR', dt.YEAR),
+    ('TINYBLOB', dt.TINYBLOB),
+    ('MEDIUMBLOB', dt.MEDIUMBLOB),
+    ('LONGBLOB', dt.LONGBLOB),
+    ('TINYTEXT', dt.TINYTEXT),
+    ('MEDIUMTEXT', dt.MEDIUMTEXT),
+    ('LONGTEXT', dt.LONGTEXT)
+)
+
+# whitespaces and commas between the items of the top level array.
+_SEPARATORS = re.compile(r'[\s,]*')
+
+
+@lru_cache(maxsize=None)
+def _interned_datatype(name: str, args: tuple) -> dt.DataType:
+    datatype = getattr(dt, name, None)
+
+    if isinstance(datatype, dt.DataType):
+        assert not args, f"{name} takes no arguments!"
+        return datatype
+
+    elif isinstance(datatype, type) and issubclass(datatype, dt.DataType):
+        if issubclass(datatype, (dt.ENUM, dt.SET)):
+            return datatype(list(args))
+        return datatype(*args)
+
+    raise Exception(f"DataType not found for {name!r}!")
+
+
+def _yaml():
+    try:
+        import yaml
+    except ImportError:
+        raise Exception("PyYAML is required for the YAML schemas!")
+
+    return yaml
+
+
+class Schema:
+    """
+        Load and dump `Model` definitions.
+        A model is stored as {"name": ..., "fields": [{"name": ..., "type": ..., "args": [...]}, ...]}, "args" being
+        omitted for the datatypes without parameters (BOOLEAN, DATE, ...).
+            JSON : a top level array of models, read one model at a time.
+            YAML : one model per document, see `yaml.safe_load_all`.
+            packed : nested tuples of builtins, cheap to pickle for worker processes.
+        Equal datatypes are resolved to a single shared instance, which must therefore never be mutated.
+    """
+
+    @classmethod
+    def datatype(cls, name: str, args: Iterable = ()) -> dt.DataType:
+        """Interned datatype `name(*args)`, ENUM and SET taking their values as arguments."""
+        return _interned_datatype(name, tuple(args))
+
+    @classmethod
+    def datatype_info(cls, datatype: dt.DataType) -> tuple[str, tuple]:
+        """Name and arguments of `datatype`, reverse of `datatype`."""
+        for name, singleton in _SINGLETONS:
+            if datatype is singleton:
+                return name, ()
+
+        if isinstance(datatype, (dt.ENUM, dt.SET)):
+            return datatype.__class__.__name__, tuple(datatype.values)
+
+        return datatype.__class__.__name__, tuple(getattr(datatype, item.name) for item in fields(datatype))
+
+    @classmethod
+    def model_dict(cls, model: Model) -> dict:
+        items = []
+
+        for field in model.fields:
+            name, args = cls.datatype_info(field.datatype)
+            item = {'name': field.name, 'type': name}
+            if args:
+                item['args'] = list(args)
+            items.append(item)
+
+        return {'name': model.name, 'fields': items}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Model:
+        return Model(data['name'], [
+            Field(item['name'], cls.datatype(item['type'], item.get('args', ())))
+            for item in data['fields']
+        ])
+
+    @classmethod
+    def iter_json(cls, stream: TextIO, chunk_size: int = 1 << 16) -> Iterator[Model]:
+        """Models of the JSON array read from `stream`, parsed one at a time from chunks of `chunk_size` characters."""
+        decoder = json.JSONDecoder()
+        buffer = ''
+        position = 0
+        opened = False
+
+        while True:
+            position = _SEPARATORS.match(buffer, position).end()
+
+            if position < len(buffer):
+                char = buffer[position]
+
+                if not opened:
+                    assert char == '[', "The JSON schema must be an array of models!"
+                    opened = True
+                    position += 1
+                    continue
+
+                elif char == ']':
+                    return
+
+                try:
+                    data, position = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    # the model is cut by the end of the chunk.
+                    pass
+                else:
+                    yield cls.from_dict(data)
+                    continue
+
+            chunk = stream.read(chunk_size)
+
+            if not chunk:
+                if position < len(buffer):
+                    decoder.raw_decode(buffer, position)
+                raise Exception("Unexpected end of the JSON schema!")
+
+            buffer = buffer[position:] + chunk
+            position = 0
+
+    @classmethod
+    def dump_json(cls, models: Iterable[Model], stream: TextIO) -> None:
+        """Write `models` as a JSON array, one model per line."""
+        stream.write('[')
+
+        for index, model in enumerate(models):
+            stream.write(',\n' if index else '\n')
+            stream.write(json.dumps(cls.model_dict(model), separators=(',', ':')))
+
+        stream.write('\n]\n')
+
+    @classmethod
+    def iter_yaml(cls, stream: TextIO) -> Iterator[Model]:
+        for data in _yaml().safe_load_all(stream):
+            if isinstance(data, list):
+                yield from map(cls.from_dict, data)
+            elif data is not None:
+                yield cls.from_dict(data)
+
+    @classmethod
+    def dump_yaml(cls, models: Iterable[Model], stream: TextIO) -> None:
+        _yaml().safe_dump_all(map(cls.model_dict, models), stream, sort_keys=False)
+
+    @classmethod
+    def pack(cls, models: Iterable[Model]) -> tuple:
+        """Compact form of `models` : ((name, ((field name, type name, args), ...)), ...)."""
+        return tuple(
+            (model.name, tuple((field.name, *cls.datatype_info(field.datatype)) for field in model.fields))
+            for model in models
+        )
+
+    @classmethod
+    def unpack(cls, packed: tuple) -> list[Model]:
+        return [
+            Model(name, [Field(field_name, _interned_datatype(type_name, args)) for field_name, type_name, args in items])
+            for name, items in packed
+        ]
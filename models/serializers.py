@@ -1,30 +1,117 @@
+import inspect
+import keyword
+import queue
 import re
+import threading
 from abc import abstractmethod, ABC
-from functools import singledispatchmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import singledispatchmethod, wraps
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional, TextIO, Union
 
 from models import datatypes as dt
+from .analysis import Storage
+from .schema import Schema
+from models.langs.base import Code
 from models.langs import javascript as js
 from models.langs import python as py
 from models.langs import sql
-from .core import Model
+from models.langs import sql_parser
+from .core import Field, Model
 
 __all__ = [
     'Serializer',
+    'PythonOptions',
     'PythonSerializer',
+    'JavascriptOptions',
     'JavascriptSerializer',
     'SQLSerializer',
     'Server',
+    'Client',
     'Database',
+    'Templates',
+    'Compiler',
     'Case'
 ]
 
 
+# (mapping, datatype id) -> (datatype, result) of the datatype mappings, shared by the targets of a `Compiler` run.
+_MAPPINGS: ContextVar[Optional[dict]] = ContextVar('_MAPPINGS', default=None)
+
+
+def _shared_mapping(func):
+    """Resolve the mapping of a datatype once per `Compiler` run, the datatype being kept alive with its result."""
+    @wraps(func)
+    def wrapper(datatype):
+        cache = _MAPPINGS.get()
+
+        if cache is None:
+            return func(datatype)
+
+        key = (func, id(datatype))
+        item = cache.get(key)
+
+        if item is None or item[0] is not datatype:
+            item = cache[key] = (datatype, func(datatype))
+
+        return item[1]
+
+    return wrapper
+
+
+@contextmanager
+def _shared_mappings():
+    token = _MAPPINGS.set({})
+
+    try:
+        yield
+    finally:
+        _MAPPINGS.reset(token)
+
+
 class Serializer(ABC):
+    # written between two serialized objects by `serialize_many`.
+    _SEPARATOR = "\n"
+
     @abstractmethod
     def serialize(self, o) -> str:
         """"""
 
+    def _implementation(self, cls: type) -> Callable[[object], str]:
+        """`serialize` implementation of the objects of type `cls`, bound to the serializer."""
+        method = inspect.getattr_static(self, 'serialize')
+
+        if isinstance(method, singledispatchmethod):
+            return method.dispatcher.dispatch(cls).__get__(self)
+
+        return self.serialize
+
+    def serialize_many(self, objects: Iterable, sink: TextIO) -> int:
+        """
+            Write the serialization of each of `objects` to `sink` as soon as it's generated, without building the
+            whole text. The `serialize` implementation is resolved once per type. Return the number of objects.
+        """
+        implementations: dict[type, Callable[[object], str]] = {}
+        count = 0
 
+        for o in objects:
+            implementation = implementations.get(type(o))
+
+            if implementation is None:
+                implementation = implementations[type(o)] = self._implementation(type(o))
+
+            if count:
+                sink.write(self._SEPARATOR)
+
+            sink.write(implementation(o))
+            count += 1
+
+        return count
+
+
+@_shared_mapping
 def _get_python_type(datatype) -> py.Var:
     if datatype is dt.BOOLEAN:
         return py.Var('bool')
@@ -44,9 +131,12 @@ def _get_python_type(datatype) -> py.Var:
     elif isinstance(datatype, (dt.FLOAT, dt.DOUBLE, dt.DECIMAL)):
         return py.Var('float')
 
-    elif isinstance(datatype, dt.DATETIME):
+    elif isinstance(datatype, (dt.DATETIME, dt.TIMESTAMP)):
         return py.DATETIME
 
+    elif isinstance(datatype, dt.TIME):
+        return py.TIMEDELTA
+
     elif isinstance(datatype, (dt.BINARY, dt.VARBINARY, dt.BLOB)):
         return py.Var('bytes')
 
@@ -57,11 +147,232 @@ def _get_python_type(datatype) -> py.Var:
         raise Exception(f"Mapping DataType -> py.Var not found for {datatype.__class__.__name__!r}!")
 
 
+def _decode_python(datatype, value: py.Expression) -> py.Expression:
+    """Conversion of a raw `value` (database row or dict item) to the python type of `datatype`."""
+    if datatype is dt.BOOLEAN:
+        return py.Call(py.Var('bool'), py.Args([value]))
+
+    elif datatype is dt.DATE:
+        return py.Call(py.Getattr(py.DATE, py.Var('fromisoformat')), py.Args([value]))
+
+    elif isinstance(datatype, (dt.DATETIME, dt.TIMESTAMP)):
+        return py.Call(py.Getattr(py.DATETIME, py.Var('fromisoformat')), py.Args([value]))
+
+    else:
+        return value
+
+
+def _encode_python(datatype, value: py.Expression) -> py.Expression:
+    """Conversion of a python `value` of type `datatype` to its raw form, reverse of `_decode_python`."""
+    if datatype is dt.DATE:
+        return py.Call(py.Getattr(value, py.Var('isoformat')), py.Args([]))
+
+    elif isinstance(datatype, (dt.DATETIME, dt.TIMESTAMP)):
+        return py.Call(py.Getattr(value, py.Var('isoformat')), py.Args([py.Str(' ')]))
+
+    else:
+        return value
+
+
+def _format_time(seconds: int) -> str:
+    """'[-]HH:MM:SS' text of a TIME value of `seconds`."""
+    sign = '-' if seconds < 0 else ''
+    minutes, seconds = divmod(abs(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{sign}{hours:02}:{minutes:02}:{seconds:02}"
+
+
+def _is_blob(datatype) -> bool:
+    return datatype in (dt.TINYBLOB, dt.MEDIUMBLOB, dt.LONGBLOB) or isinstance(datatype, (dt.BINARY, dt.VARBINARY, dt.BLOB))
+
+
+def _is_text(datatype) -> bool:
+    return datatype in (dt.TINYTEXT, dt.MEDIUMTEXT, dt.LONGTEXT) or \
+        isinstance(datatype, (dt.CHAR, dt.VARCHAR, dt.TEXT, dt.ENUM, dt.SET))
+
+
+def _python_json_parts(datatype, value: py.Expression) -> list[Union[str, py.Expression]]:
+    """JSON text of a python `value`, as literal strings and expressions to join."""
+    if datatype is dt.BOOLEAN:
+        return [py.IfExp(py.Str('true'), value, py.Str('false'))]
+
+    elif datatype is dt.DATE or isinstance(datatype, (dt.DATETIME, dt.TIMESTAMP)):
+        return ['"', py.Call(py.Getattr(value, py.Var('isoformat')), py.Args([])), '"']
+
+    elif _is_blob(datatype):
+        encoded = py.Call(py.B64ENCODE, py.Args([value]))
+        return ['"', py.Call(py.Getattr(encoded, py.Var('decode')), py.Args([py.Str('ascii')])), '"']
+
+    elif isinstance(datatype, (dt.BIT, dt.TINYINT, dt.SMALLINT, dt.MEDIUMINT, dt.INTEGER, dt.BIGINT)):
+        return [py.Call(py.Var('str'), py.Args([value]))]
+
+    elif isinstance(datatype, (dt.FLOAT, dt.DOUBLE, dt.DECIMAL)):
+        return [py.Call(py.Var('repr'), py.Args([value]))]
+
+    elif _is_text(datatype):
+        return [py.Call(py.ENCODE_BASESTRING, py.Args([value]))]
+
+    else:
+        raise Exception(f"JSON encoding not found for {datatype.__class__.__name__!r}!")
+
+
+def _python_json_decode(datatype, value: py.Expression) -> py.Expression:
+    if datatype is dt.DATE:
+        return py.Call(py.Getattr(py.DATE, py.Var('fromisoformat')), py.Args([value]))
+
+    elif isinstance(datatype, (dt.DATETIME, dt.TIMESTAMP)):
+        return py.Call(py.Getattr(py.DATETIME, py.Var('fromisoformat')), py.Args([value]))
+
+    elif _is_blob(datatype):
+        return py.Call(py.B64DECODE, py.Args([value]))
+
+    else:
+        return value
+
+
+# bytes converted to characters by a single `String.fromCharCode.apply`.
+_JS_BYTES_SLICE = 8192
+
+
+def _javascript_json_parts(datatype, value: js.Expression) -> list[Union[str, js.Expression]]:
+    """JSON text of a javascript `value`, as literal strings and expressions to concatenate."""
+    if datatype is dt.BOOLEAN:
+        return [js.Conditional(value, js.Str('true'), js.Str('false'))]
+
+    elif datatype is dt.DATE:
+        iso = js.Call(js.Getattr(value, js.Var('toISOString')), js.Args([]))
+        return ['"', js.Call(js.Getattr(iso, js.Var('slice')), js.Args([js.Num(0), js.Num(10)])), '"']
+
+    elif isinstance(datatype, (dt.DATETIME, dt.TIMESTAMP)):
+        return ['"', js.Call(js.Getattr(value, js.Var('toISOString')), js.Args([])), '"']
+
+    elif _is_blob(datatype):
+        # `apply` passes the bytes as arguments, whose number is bounded by the call stack : the bytes are converted
+        # by slices of `_JS_BYTES_SLICE`.
+        index = js.Var('index')
+        start = js.BinOp(index, '*', js.Num(_JS_BYTES_SLICE))
+        chars = js.Call(
+            js.Getattr(js.Getattr(js.Var('String'), js.Var('fromCharCode')), js.Var('apply')),
+            js.Args([js.Var('null'), js.Call(js.Getattr(value, js.Var('slice')), js.Args([
+                start,
+                js.BinOp(start, '+', js.Num(_JS_BYTES_SLICE))
+            ]))])
+        )
+        slices = js.Call(js.Getattr(js.Var('Array'), js.Var('from')), js.Args([
+            js.Obj([('length', js.Call(js.Getattr(js.Var('Math'), js.Var('ceil')), js.Args([
+                js.BinOp(js.Getattr(value, js.Var('length')), '/', js.Num(_JS_BYTES_SLICE))
+            ])))]),
+            js.Arrow(js.Args([js.Var('_'), index]), chars)
+        ]))
+        text = js.Call(js.Getattr(slices, js.Var('join')), js.Args([js.Str('')]))
+        return ['"', js.Call(js.Var('btoa'), js.Args([text])), '"']
+
+    elif isinstance(datatype, (dt.BIT, dt.TINYINT, dt.SMALLINT, dt.MEDIUMINT, dt.INTEGER, dt.BIGINT,
+                               dt.FLOAT, dt.DOUBLE, dt.DECIMAL)):
+        return [value]
+
+    elif _is_text(datatype):
+        return [js.Call(js.Getattr(js.JSON, js.Var('stringify')), js.Args([value]))]
+
+    else:
+        raise Exception(f"JSON encoding not found for {datatype.__class__.__name__!r}!")
+
+
+def _javascript_json_decode(datatype, value: js.Expression) -> js.Expression:
+    if datatype is dt.DATE or isinstance(datatype, (dt.DATETIME, dt.TIMESTAMP)):
+        return js.New(js.DATE, js.Args([value]))
+
+    elif _is_blob(datatype):
+        char = js.Var('c')
+        return js.Call(js.Getattr(js.Var('Uint8Array'), js.Var('from')), js.Args([
+            js.Call(js.Var('atob'), js.Args([value])),
+            js.Arrow(js.Args([char]), js.Call(js.Getattr(char, js.Var('charCodeAt')), js.Args([js.Num(0)])))
+        ]))
+
+    else:
+        return value
+
+
+def _json_template(model: Model, encode: Callable[[Field], list]) -> list:
+    """Literal strings and expressions of the JSON object of `model`, consecutive literals being merged."""
+    parts = ['{']
+
+    for index, field in enumerate(model.fields):
+        parts.append(f'{"," if index else ""}"{field.name}":')
+        parts.extend(encode(field))
+
+    parts.append('}')
+
+    merged = []
+    for part in parts:
+        if isinstance(part, str) and merged and isinstance(merged[-1], str):
+            merged[-1] += part
+        else:
+            merged.append(part)
+
+    return merged
+
+
+def _unsigned_typecode(bits: int) -> str:
+    """Smallest unsigned `array.array` typecode holding `bits` bits."""
+    if bits <= 8:
+        return 'B'
+    elif bits <= 16:
+        return 'H'
+    elif bits <= 32:
+        return 'I'
+    else:
+        return 'Q'
+
+
+def _unsigned_typed_array(bits: int) -> str:
+    """Smallest unsigned javascript TypedArray holding `bits` bits."""
+    if bits <= 8:
+        return 'Uint8Array'
+    elif bits <= 16:
+        return 'Uint16Array'
+    elif bits <= 32:
+        return 'Uint32Array'
+    else:
+        return 'BigUint64Array'
+
+
+def _epoch_unit(datatype) -> py.Call:
+    """`timedelta` of one unit of the epoch integers of `datatype`: microseconds with fractional seconds, else seconds."""
+    return py.Call(py.TIMEDELTA, py.Args([py.Keyword('microseconds' if datatype.fsp else 'seconds', py.Int(1))]))
+
+
+def _is_wide_set(datatype) -> bool:
+    """Whether the bitmasks of the SET `datatype` can exceed `Number.MAX_SAFE_INTEGER`, their JSON being a string."""
+    return len(datatype.values) > 53
+
+
+def _enum_class_name(model: Model, field: Field) -> str:
+    return model.name + Case.join_pascal(field.name.split('_'))
+
+
+def _enum_constants(values: list[str]) -> list[tuple[str, int]]:
+    """Named codes of the ENUM `values` which can be used as attributes, code 0 being the MySQL error value ''."""
+    names = set()
+    constants = []
+
+    for code, value in enumerate(values, start=1):
+        name = value.upper()
+        if name.isidentifier() and not keyword.iskeyword(name) and name not in ('VALUES', 'CODES') and name not in names:
+            names.add(name)
+            constants.append((name, code))
+
+    return constants
+
+
+@_shared_mapping
 def _get_sql_type(datatype) -> sql.TypeName:
     if datatype is dt.BOOLEAN:
         return sql.TypeName('BOOLEAN')
     elif datatype is dt.DATE:
         return sql.TypeName('DATE')
+    elif datatype is dt.YEAR:
+        return sql.TypeName('YEAR')
     elif datatype is dt.TINYBLOB:
         return sql.TypeName('TINYBLOB')
     elif datatype is dt.MEDIUMBLOB:
@@ -79,7 +390,8 @@ def _get_sql_type(datatype) -> sql.TypeName:
         return sql.TypeName(datatype.__class__.__name__, [str(datatype.size)])
 
     elif isinstance(datatype, (dt.FLOAT, dt.DOUBLE, dt.DECIMAL)):
-        return sql.TypeName(datatype.__class__.__name__, [str(datatype.size)])
+        args = [str(arg) for arg in (datatype.size, datatype.d) if arg is not None]
+        return sql.TypeName(datatype.__class__.__name__, args)
 
     elif isinstance(datatype, (dt.DATETIME, dt.TIME, dt.TIMESTAMP)):
         return sql.TypeName(datatype.__class__.__name__, [str(datatype.fsp)])
@@ -91,197 +403,2107 @@ def _get_sql_type(datatype) -> sql.TypeName:
         return sql.TypeName(datatype.__class__.__name__, [str(datatype.size)])
 
     elif isinstance(datatype, (dt.ENUM, dt.SET)):
-        return sql.TypeName(datatype.__class__.__name__, list(map(str, datatype.values)))
+        return sql.TypeName(datatype.__class__.__name__, datatype.values, cfg_quote=True)
 
     else:
         raise Exception(f"Mapping DataType -> sql.TypeName not found for {datatype.__class__.__name__!r}!")
 
 
+# display widths of the integer types declared without size, as shown by MySQL.
+_INTEGER_WIDTHS = {'TINYINT': 4, 'SMALLINT': 6, 'MEDIUMINT': 9, 'INTEGER': 11, 'BIGINT': 20}
+
+# smallest signed types holding the range of the UNSIGNED integer types, which `DataType` can't express.
+_UNSIGNED_TYPES = {
+    'TINYINT': dt.SMALLINT(6),
+    'SMALLINT': dt.MEDIUMINT(9),
+    'MEDIUMINT': dt.INTEGER(11),
+    'INTEGER': dt.BIGINT(20),
+    'BIGINT': dt.DECIMAL(20, 0)
+}
+
+# length of the VARCHAR / VARBINARY declared without one, which MySQL rejects but sqlite accepts.
+_DEFAULT_LENGTH = 255
+
+_TYPE_ALIASES = {
+    'BOOL': 'BOOLEAN',
+    'INT': 'INTEGER',
+    'DEC': 'DECIMAL',
+    'NUMERIC': 'DECIMAL',
+    'FIXED': 'DECIMAL',
+    'REAL': 'DOUBLE',
+    'DOUBLE PRECISION': 'DOUBLE',
+    'CHARACTER': 'CHAR',
+    'CHARACTER VARYING': 'VARCHAR'
+}
+
+
+def _get_datatype(type_name: sql.TypeName) -> dt.DataType:
+    """
+        Reverse of `_get_sql_type`, raising a ValueError for the types without `DataType` and the invalid arguments.
+        The UNSIGNED integers are widened to the signed type holding their range, UNSIGNED being dropped for the
+        other numerics whose range it only halves.
+    """
+    name = _TYPE_ALIASES.get(type_name.name.upper(), type_name.name.upper())
+
+    if name in ('ENUM', 'SET'):
+        return getattr(dt, name)(list(type_name.args))
+
+    try:
+        args = [int(arg) for arg in type_name.args]
+
+        if name in ('BOOLEAN', 'DATE', 'YEAR', 'TINYBLOB', 'MEDIUMBLOB', 'LONGBLOB', 'TINYTEXT', 'MEDIUMTEXT',
+                    'LONGTEXT'):
+            return getattr(dt, name)
+
+        elif name in _INTEGER_WIDTHS and type_name.unsigned:
+            return _UNSIGNED_TYPES[name]
+
+        elif name in _INTEGER_WIDTHS:
+            return getattr(dt, name)(*args or [_INTEGER_WIDTHS[name]])
+
+        elif name in ('DATETIME', 'TIMESTAMP', 'TIME'):
+            return getattr(dt, name)(*args or [0])
+
+        elif name in ('BLOB', 'TEXT'):
+            return getattr(dt, name)(*args or [65535])
+
+        elif name in ('VARCHAR', 'VARBINARY'):
+            return getattr(dt, name)(*args or [_DEFAULT_LENGTH])
+
+        # declared without arguments, they use the defaults of their DataType.
+        elif name in ('BIT', 'FLOAT', 'DOUBLE', 'DECIMAL', 'CHAR', 'BINARY'):
+            return getattr(dt, name)(*args)
+
+    except (TypeError, ValueError, AssertionError):
+        raise ValueError(f"Invalid arguments {list(type_name.args)!r} for {type_name.name!r}!") from None
+
+    raise ValueError(f"Mapping sql.TypeName -> DataType not found for {type_name.name!r}!")
+
+
+@dataclass(frozen=True)
+class PythonOptions:
+    """
+        Options of the python code generated by `Server`.
+            track_changes : record the assigned fields in a bitmask (`_dirty`), see `Database.update_batches`.
+                `raw_values(mask)` returns the database form of the fields of a mask.
+            converters : add the unrolled `from_row(s)`, `from_dict(s)`, `to_tuple` and `to_dict` methods.
+            json : add the specialized `to_json` and `from_json` methods.
+            table : add a `<Model>Table` struct-of-arrays collection and its `<Model>RowView`.
+            set_bitmask : store SET values as integer bitmasks, with `<FIELD>_BITS` tables and encode/decode helpers.
+                The JSON of the bitmasks of more than 53 members is a string, which javascript reads exactly.
+            enum_classes : store ENUM values as integer codes, with a `<Model><Field>` class of code/value tables.
+            time_epoch : store DATETIME/TIMESTAMP values as integers since 1970-01-01 (UTC) and TIME values as
+                signed integers, in seconds or microseconds if `fsp` is set. Rows and dicts carry the ISO texts of the
+                database (`parse_<field>` / `format_<field>` for TIME), JSON and table columns the integers.
+                `<field>_datetime` / `<field>_timedelta` properties and `encode_<field>` / `decode_<field>` convert
+                on demand, and `<Model>Table.as_numpy` returns `datetime64` / `timedelta64` views.
+            decimal_scaled : store DECIMAL(size, d) values as integers scaled by 10 ** d, checked against 10 ** size.
+                Rows and dicts carry `Decimal` values, JSON and table columns the integers, and `<Model>Table`
+                gets exact `sum_<field>` / `mean_<field>` aggregates.
+            physical_order : `from_row(s)` and `to_tuple` follow the column order of
+                `Database.model_command(model, cfg_reorder=True)` instead of the field order.
+    """
+    track_changes: bool = False
+    converters: bool = False
+    json: bool = False
+    table: bool = False
+    set_bitmask: bool = False
+    enum_classes: bool = False
+    time_epoch: bool = False
+    decimal_scaled: bool = False
+    physical_order: bool = False
+
+
 class Server:
     @classmethod
-    def model_dataclass(cls, model: Model) -> py.Module:
-        imports: list[py.Statement] = [
-            py.DATACLASS.import_info
-        ]
+    def _imports(cls, model: Model, options: PythonOptions) -> list[py.Statement]:
+        imports: list[py.Statement] = []
 
-        annotations: list[py.Statement] = []
+        if options.json:
+            imports.append(py.JSON_LOADS.import_info)
 
         for field in model.fields:
-            if isinstance(field.datatype, dt.DATETIME):
+            if isinstance(field.datatype, (dt.DATETIME, dt.TIMESTAMP)):
                 imports.append(py.DATETIME.import_info)
 
+            if cls._is_epoch(field, options) or isinstance(field.datatype, dt.TIME):
+                imports.append(py.TIMEDELTA.import_info)
+
+            if cls._is_scaled(field, options):
+                imports.append(py.DECIMAL.import_info)
+
             if field.datatype is dt.DATE:
                 imports.append(py.DATE.import_info)
 
-            annotations.append(
-                py.Typed(py.Var(field.name), _get_python_type(field.datatype))
-            )
+            if options.json and _is_blob(field.datatype):
+                imports.append(py.B64ENCODE.import_info)
+                imports.append(py.B64DECODE.import_info)
 
-        if not annotations:
-            annotations.append(py.PASS)
+            if options.table and cls._typecode(field, options):
+                imports.append(py.ARRAY.import_info)
 
-        return py.Module([
-            *imports,
+            if options.json and _is_text(field.datatype) and \
+                    not cls._is_bitmask(field, options) and not cls._is_enum_code(field, options):
+                imports.append(py.ENCODE_BASESTRING.import_info)
 
-            py.Decorator(
-                base=py.DATACLASS,
-                over=py.Class(
-                    name=model.name,
-                    block=py.Block(annotations)
-                )
-            )
-        ])
+        return imports
 
     @classmethod
-    def model_class(cls, model: Model) -> py.Module:
-        imports: list[py.Statement] = []
+    def _is_bitmask(cls, field: Field, options: PythonOptions) -> bool:
+        return options.set_bitmask and isinstance(field.datatype, dt.SET)
 
-        field_args = []
-        field_attr = []
+    @classmethod
+    def _is_enum_code(cls, field: Field, options: PythonOptions) -> bool:
+        return options.enum_classes and isinstance(field.datatype, dt.ENUM)
 
-        for field in model.fields:
-            if isinstance(field.datatype, dt.DATETIME):
-                imports.append(py.DATETIME.import_info)
+    @classmethod
+    def _is_epoch(cls, field: Field, options: PythonOptions) -> bool:
+        return options.time_epoch and isinstance(field.datatype, (dt.DATETIME, dt.TIMESTAMP, dt.TIME))
 
-            if field.datatype is dt.DATE:
-                imports.append(py.DATE.import_info)
+    @classmethod
+    def _is_scaled(cls, field: Field, options: PythonOptions) -> bool:
+        return options.decimal_scaled and isinstance(field.datatype, dt.DECIMAL)
 
-            field_args.append(
-                py.Typed(py.Var(field.name), _get_python_type(field.datatype))
-            )
-            field_attr.append(
-                py.Assign(py.Getattr(py.SELF, py.Var(field.name)), py.Var(field.name))
-            )
+    @classmethod
+    def _is_integer_coded(cls, field: Field, options: PythonOptions) -> bool:
+        """Whether a representation option stores `field` as an integer."""
+        return cls._is_bitmask(field, options) or cls._is_enum_code(field, options) or \
+            cls._is_epoch(field, options) or cls._is_scaled(field, options)
 
-        __init__method = py.Def(
-            name='__init__',
-            args=py.Args([py.SELF, *field_args]),
-            block=py.Block(field_attr)
-        )
+    @classmethod
+    def _python_type(cls, field: Field, options: PythonOptions) -> py.Var:
+        if cls._is_integer_coded(field, options):
+            return py.Var('int')
 
-        return py.Module([
-            *imports,
-            py.Class(
-                name=model.name,
-                block=py.Block([
-                    __init__method
-                ])
+        return _get_python_type(field.datatype)
+
+    @classmethod
+    def _decode(cls, model: Model, field: Field, value: py.Expression, options: PythonOptions) -> py.Expression:
+        """Conversion of a raw database `value` to the stored representation of `field`."""
+        if cls._is_bitmask(field, options) or cls._is_scaled(field, options):
+            return py.Call(py.Getattr(py.Var(model.name), py.Var(f'encode_{field.name}')), py.Args([value]))
+
+        elif cls._is_enum_code(field, options):
+            return py.Getitem(py.Getattr(py.Var(_enum_class_name(model, field)), py.Var('CODES')), value)
+
+        elif isinstance(field.datatype, dt.TIME):
+            return py.Call(py.Getattr(py.Var(model.name), py.Var(f'parse_{field.name}')), py.Args([value]))
+
+        elif cls._is_epoch(field, options):
+            return py.Call(
+                py.Getattr(py.Var(model.name), py.Var(f'encode_{field.name}')),
+                py.Args([_decode_python(field.datatype, value)])
             )
-        ])
+
+        return _decode_python(field.datatype, value)
 
     @classmethod
-    def model_classes(cls, models: list[Model]) -> py.Module:
-        imports: list[py.Statement] = []
-        classes: list[py.Class] = []
+    def _encode(cls, model: Model, field: Field, value: py.Expression, options: PythonOptions) -> py.Expression:
+        """Conversion of the stored representation `value` of `field` to its raw database form."""
+        if cls._is_bitmask(field, options) or cls._is_scaled(field, options):
+            return py.Call(py.Getattr(py.Var(model.name), py.Var(f'decode_{field.name}')), py.Args([value]))
 
-        for model in models:
-            field_args = []
-            field_attr = []
+        elif cls._is_enum_code(field, options):
+            return py.Getitem(py.Getattr(py.Var(_enum_class_name(model, field)), py.Var('VALUES')), value)
+
+        elif isinstance(field.datatype, dt.TIME):
+            return py.Call(py.Getattr(py.Var(model.name), py.Var(f'format_{field.name}')), py.Args([value]))
+
+        elif cls._is_epoch(field, options):
+            return _encode_python(field.datatype, py.Call(
+                py.Getattr(py.Var(model.name), py.Var(f'decode_{field.name}')),
+                py.Args([value])
+            ))
+
+        return _encode_python(field.datatype, value)
+
+    @classmethod
+    def _json_parts(cls, field: Field, value: py.Expression, options: PythonOptions) -> list:
+        if cls._is_bitmask(field, options) and _is_wide_set(field.datatype):
+            return ['"', py.Call(py.Var('str'), py.Args([value])), '"']
+
+        elif cls._is_integer_coded(field, options):
+            return [py.Call(py.Var('str'), py.Args([value]))]
+
+        elif isinstance(field.datatype, dt.TIME):
+            return ['"', py.Call(py.Getattr(py.SELF, py.Var(f'format_{field.name}')), py.Args([value])), '"']
+
+        return _python_json_parts(field.datatype, value)
+
+    @classmethod
+    def _json_decode(cls, field: Field, value: py.Expression, options: PythonOptions) -> py.Expression:
+        if cls._is_bitmask(field, options) and _is_wide_set(field.datatype):
+            return py.Call(py.Var('int'), py.Args([value]))
+
+        elif cls._is_integer_coded(field, options):
+            return value
+
+        elif isinstance(field.datatype, dt.TIME):
+            return py.Call(py.Getattr(py.CLS, py.Var(f'parse_{field.name}')), py.Args([value]))
 
-            for field in model.fields:
-                if isinstance(field.datatype, dt.DATETIME):
-                    imports.append(py.DATETIME.import_info)
+        return _python_json_decode(field.datatype, value)
 
-                if field.datatype is dt.DATE:
-                    imports.append(py.DATE.import_info)
+    @classmethod
+    def _bitmask_attributes(cls, field: Field) -> list[py.Statement]:
+        return [
+            # '' is the empty set, so that `encode` doesn't need a branch.
+            py.Assign(py.Var(f'{field.name.upper()}_BITS'), py.Dict([
+                (py.Str(''), py.Int(0)),
+                *((py.Str(value), py.Int(1 << index)) for index, value in enumerate(field.datatype.values))
+            ])),
+            py.Assign(py.Var(f'{field.name.upper()}_MEMBERS'), py.Tuple([
+                py.Tuple([py.Int(1 << index), py.Str(value)])
+                for index, value in enumerate(field.datatype.values)
+            ]))
+        ]
 
-                field_args.append(
-                    py.Typed(py.Var(field.name), _get_python_type(field.datatype))
+    @classmethod
+    def _bitmask_methods(cls, field: Field) -> list[py.Statement]:
+        bits = py.Var(f'{field.name.upper()}_BITS')
+        members = py.Var(f'{field.name.upper()}_MEMBERS')
+        mask = py.Var('mask')
+        member = py.Var('member')
+        bit = py.Var('bit')
+        text = py.Var('text')
+
+        return [
+            py.Decorator(
+                base=py.CLASSMETHOD,
+                over=py.Def(
+                    name=f'encode_{field.name}',
+                    args=py.Args([py.CLS, py.Typed(text, py.Var('str'))]),
+                    returns=py.Var('int'),
+                    block=py.Block([
+                        py.Assign(mask, py.Int(0)),
+                        py.For(member, py.Call(py.Getattr(text, py.Var('split')), py.Args([py.Str(',')])), py.Block([
+                            py.AugAssign(mask, '|', py.Getitem(py.Getattr(py.CLS, bits), member))
+                        ])),
+                        py.Return(mask)
+                    ])
                 )
-                field_attr.append(
-                    py.Assign(py.Getattr(py.SELF, py.Var(field.name)), py.Var(field.name))
+            ),
+            py.Decorator(
+                base=py.CLASSMETHOD,
+                over=py.Def(
+                    name=f'decode_{field.name}',
+                    args=py.Args([py.CLS, py.Typed(mask, py.Var('int'))]),
+                    returns=py.Var('str'),
+                    block=py.Block([
+                        py.Return(py.Call(py.Getattr(py.Str(','), py.Var('join')), py.Args([py.ListComp(
+                            elt=member,
+                            target=py.Args([bit, member]),
+                            iter=py.Getattr(py.CLS, members),
+                            test=py.BinOp(mask, '&', bit)
+                        )])))
+                    ])
                 )
+            )
+        ]
 
-            __init__method = py.Def(
-                name='__init__',
-                args=py.Args([py.SELF, *field_args]),
-                block=py.Block(field_attr)
+    @classmethod
+    def _time_text_methods(cls, field: Field, epoch: bool) -> list[py.Statement]:
+        """Conversions between the values of a TIME `field`, epoch integers or `timedelta`, and its
+        '[-]HH:MM:SS[.ffffff]' database texts."""
+        value = py.Var('value')
+        text = py.Var('text')
+        hours = py.Var('hours')
+        minutes = py.Var('minutes')
+        seconds = py.Var('seconds')
+        microseconds = py.Var('microseconds')
+
+        def call(obj: py.Expression, name: str, args: list) -> py.Call:
+            return py.Call(py.Getattr(obj, py.Var(name)), py.Args(args))
+
+        def to_int(expression: py.Expression) -> py.Call:
+            return py.Call(py.Var('int'), py.Args([expression]))
+
+        parsed = py.Call(py.TIMEDELTA, py.Args([
+            py.Keyword('hours', to_int(hours)),
+            py.Keyword('minutes', to_int(minutes)),
+            py.Keyword('seconds', py.Call(py.Var('float'), py.Args([seconds])))
+        ]))
+
+        if field.datatype.fsp:
+            split = py.Assign(
+                py.Args([seconds, microseconds]),
+                py.Call(py.Var('divmod'), py.Args([py.Call(py.Var('abs'), py.Args([value])), py.Int(1000000)]))
             )
-            model_class = py.Class(
-                name=model.name,
-                block=py.Block([
-                    __init__method
-                ])
+        else:
+            split = py.Assign(seconds, py.Call(py.Var('abs'), py.Args([value])))
+
+        formatted = py.BinOp(py.Str('%s%02d:%02d:%02d'), '%', py.Tuple([
+            py.IfExp(py.Str('-'), py.BinOp(value, '<', py.Int(0)), py.Str('')),
+            py.BinOp(seconds, '//', py.Int(3600)),
+            py.BinOp(py.BinOp(seconds, '//', py.Int(60)), '%', py.Int(60)),
+            py.BinOp(seconds, '%', py.Int(60))
+        ]))
+
+        if epoch:
+            python_type = py.Var('int')
+            # the epoch integer of the parsed `timedelta`, negated as a whole for negative texts.
+            parsed = call(py.CLS, f'encode_{field.name}', [parsed])
+            zero = py.Int(0)
+            format_statements = []
+        else:
+            python_type = py.TIMEDELTA
+            zero = py.Call(py.TIMEDELTA, py.Args([]))
+            format_statements = [py.Assign(value, py.BinOp(value, '//', _epoch_unit(field.datatype)))]
+
+        if field.datatype.fsp:
+            format_statements += [
+                split,
+                py.Assign(text, formatted),
+                py.Return(py.IfExp(
+                    py.BinOp(text, '+', py.BinOp(py.Str('.%06d'), '%', microseconds)),
+                    microseconds,
+                    text
+                ))
+            ]
+        else:
+            format_statements += [split, py.Return(formatted)]
+
+        return [
+            py.Decorator(
+                base=py.CLASSMETHOD,
+                over=py.Def(
+                    name=f'parse_{field.name}',
+                    args=py.Args([py.CLS, py.Typed(text, py.Var('str'))]),
+                    returns=python_type,
+                    block=py.Block([
+                        py.Assign(
+                            py.Args([hours, minutes, seconds]),
+                            call(call(text, 'lstrip', [py.Str('-')]), 'split', [py.Str(':')])
+                        ),
+                        py.Assign(value, parsed),
+                        py.Return(py.IfExp(
+                            py.BinOp(zero, '-', value),
+                            call(text, 'startswith', [py.Str('-')]),
+                            value
+                        ))
+                    ])
+                )
+            ),
+            py.Decorator(
+                base=py.CLASSMETHOD,
+                over=py.Def(
+                    name=f'format_{field.name}',
+                    args=py.Args([py.CLS, py.Typed(value, python_type)]),
+                    returns=py.Var('str'),
+                    block=py.Block(format_statements)
+                )
             )
-            classes.append(model_class)
+        ]
 
-        return py.Module([
-            *imports,
-            *classes
-        ])
+    @classmethod
+    def _epoch_methods(cls, field: Field) -> list[py.Statement]:
+        value = py.Var('value')
+        unit = _epoch_unit(field.datatype)
 
+        if isinstance(field.datatype, dt.TIME):
+            suffix, python_type = 'timedelta', py.TIMEDELTA
 
-class PythonSerializer(Serializer):
-    @singledispatchmethod
-    def serialize(self, o) -> str:
-        raise NotImplementedError
+            def to_python(owner: py.Var, number: py.Expression) -> py.Expression:
+                return py.BinOp(number, '*', unit)
 
-    @serialize.register
-    def _(self, o: Model) -> str:
-        return str(Server.model_class(o))
+            encoded = py.BinOp(value, '//', unit)
+        else:
+            suffix, python_type = 'datetime', py.DATETIME
 
+            def to_python(owner: py.Var, number: py.Expression) -> py.Expression:
+                return py.BinOp(py.Getattr(owner, py.Var('EPOCH')), '+', py.BinOp(number, '*', unit))
 
-class JavascriptSerializer(Serializer):
-    @singledispatchmethod
-    def serialize(self, o) -> str:
-        raise NotImplementedError
+            encoded = py.BinOp(py.Paren(py.BinOp(value, '-', py.Getattr(py.CLS, py.Var('EPOCH')))), '//', unit)
 
-    @serialize.register
-    def _(self, o: Model) -> str:
-        code = js.Class(
-            name=o.name,
-            block=js.Block([
-                js.Method(
-                    name='constructor',
-                    args=js.Args([
-                        py.Var(field.name)
-                        for field in o.fields
-                    ]),
-                    block=js.Block([
-                        js.Assign(js.Getattr(js.THIS, js.Var(field.name)), js.Var(field.name))
-                        for field in o.fields
-                    ])
+        return [
+            py.Decorator(
+                base=py.PROPERTY,
+                over=py.Def(
+                    name=f'{field.name}_{suffix}',
+                    args=py.Args([py.SELF]),
+                    returns=python_type,
+                    block=py.Block([py.Return(to_python(py.SELF, py.Getattr(py.SELF, py.Var(field.name))))])
                 )
-            ])
-        )
-        return str(code)
+            ),
+            py.Decorator(
+                base=py.CLASSMETHOD,
+                over=py.Def(
+                    name=f'encode_{field.name}',
+                    args=py.Args([py.CLS, py.Typed(value, python_type)]),
+                    returns=py.Var('int'),
+                    block=py.Block([py.Return(encoded)])
+                )
+            ),
+            py.Decorator(
+                base=py.CLASSMETHOD,
+                over=py.Def(
+                    name=f'decode_{field.name}',
+                    args=py.Args([py.CLS, py.Typed(value, py.Var('int'))]),
+                    returns=python_type,
+                    block=py.Block([py.Return(to_python(py.CLS, value))])
+                )
+            ),
+            *(cls._time_text_methods(field, epoch=True) if isinstance(field.datatype, dt.TIME) else [])
+        ]
 
+    @classmethod
+    def _scaled_attributes(cls, field: Field) -> list[py.Statement]:
+        return [
+            py.Assign(py.Var(f'{field.name.upper()}_SCALE'), py.Int(10 ** field.datatype.d)),
+            # exclusive bound of the scaled integers, from the total number of digits.
+            py.Assign(py.Var(f'{field.name.upper()}_LIMIT'), py.Int(10 ** field.datatype.size))
+        ]
 
-class Database:
     @classmethod
-    def model_command(cls, model: Model) -> sql.CreateTable:
-        assert Case.is_pascal_case(model.name)
-        name = Case.join_snake(Case.split_pascal(model.name))
+    def _scaled_methods(cls, field: Field) -> list[py.Statement]:
+        scale = py.Getattr(py.CLS, py.Var(f'{field.name.upper()}_SCALE'))
+        check = py.Getattr(py.CLS, py.Var(f'check_{field.name}'))
+        value = py.Var('value')
+        factor = py.Var('factor')
+
+        def class_method(name: str, args: list, statements: list, returns: py.Object) -> py.Decorator:
+            return py.Decorator(
+                base=py.CLASSMETHOD,
+                over=py.Def(name=name, args=py.Args([py.CLS, *args]), block=py.Block(statements), returns=returns)
+            )
 
-        return sql.CreateTable(
-            name=name,
-            if_not_exists=True,
-            columns=[
-                sql.ColumnDefinition(
-                    name=field.name,
-                    datatype=_get_sql_type(field.datatype)
+        def rounded(number: py.Expression) -> py.Call:
+            return py.Call(check, py.Args([py.Call(py.Var('round'), py.Args([number]))]))
+
+        d = field.datatype.d
+
+        if field.datatype.size <= 28:
+            encode = [py.Return(rounded(py.BinOp(value, '*', scale)))]
+            decoded = py.Call(py.Getattr(py.Call(py.DECIMAL, py.Args([value])), py.Var('scaleb')), py.Args([py.Int(-d)]))
+        else:
+            # Decimal arithmetic would be rounded to the 28 digits of the default context.
+            numerator = py.Var('numerator')
+            denominator = py.Var('denominator')
+            encode = [
+                py.Assign(
+                    py.Args([numerator, denominator]),
+                    py.Call(py.Getattr(value, py.Var('as_integer_ratio')), py.Args([]))
+                ),
+                py.Return(py.Call(check, py.Args([py.BinOp(
+                    py.Paren(py.BinOp(py.BinOp(py.BinOp(py.Int(2), '*', numerator), '*', scale), '+', denominator)),
+                    '//',
+                    py.Paren(py.BinOp(py.Int(2), '*', denominator))
+                )])))
+            ]
+            decoded = py.Call(py.DECIMAL, py.Args([
+                py.BinOp(py.Call(py.Var('str'), py.Args([value])), '+', py.Str(f'e-{d}'))
+            ]))
+
+        return [
+            class_method(f'check_{field.name}', [py.Typed(value, py.Var('int'))], [
+                py.If(
+                    py.BinOp(
+                        py.Call(py.Var('abs'), py.Args([value])),
+                        '>=',
+                        py.Getattr(py.CLS, py.Var(f'{field.name.upper()}_LIMIT'))
+                    ),
+                    py.Block([py.Raise(py.Call(py.Var('OverflowError'), py.Args([py.Str(
+                        f'{field.name} out of DECIMAL({field.datatype.size}, {field.datatype.d}) range'
+                    )])))])
+                ),
+                py.Return(value)
+            ], py.Var('int')),
+            # exact for int and Decimal values, floats being rounded to the nearest scaled integer.
+            class_method(f'encode_{field.name}', [value], encode, py.Var('int')),
+            class_method(f'decode_{field.name}', [py.Typed(value, py.Var('int'))], [py.Return(decoded)], py.DECIMAL),
+            class_method(f'multiply_{field.name}', [py.Typed(value, py.Var('int')), factor], [
+                py.Return(rounded(py.BinOp(value, '*', factor)))
+            ], py.Var('int')),
+            py.Decorator(
+                base=py.PROPERTY,
+                over=py.Def(
+                    name=f'{field.name}_decimal',
+                    args=py.Args([py.SELF]),
+                    returns=py.DECIMAL,
+                    block=py.Block([py.Return(py.Call(
+                        py.Getattr(py.SELF, py.Var(f'decode_{field.name}')),
+                        py.Args([py.Getattr(py.SELF, py.Var(field.name))])
+                    ))])
                 )
-                for field in model.fields
-            ],
-            cfg_expand=True
-        )
+            )
+        ]
 
     @classmethod
-    def model_commands(cls, models: list[Model]) -> sql.Commands:
-        return sql.Commands([
-            cls.model_command(model)
-            for model in models
-        ])
+    def _mode_attributes(cls, model: Model, options: PythonOptions) -> list[py.Statement]:
+        """Class level tables required by the representation options."""
+        statements: list[py.Statement] = []
 
+        for field in model.fields:
+            if cls._is_bitmask(field, options):
+                statements.extend(cls._bitmask_attributes(field))
 
-class SQLSerializer(Serializer):
-    @singledispatchmethod
-    def serialize(self, o) -> str:
-        raise NotImplementedError
+            elif cls._is_scaled(field, options):
+                statements.extend(cls._scaled_attributes(field))
 
-    @serialize.register
-    def _(self, o: Model) -> str:
-        return str(Database.model_command(o))
+        if any(cls._is_epoch(field, options) and not isinstance(field.datatype, dt.TIME) for field in model.fields):
+            statements.append(py.Assign(py.Var('EPOCH'), py.Call(py.DATETIME, py.Args([py.Int(1970), py.Int(1), py.Int(1)]))))
+
+        return statements
+
+    @classmethod
+    def _mode_methods(cls, model: Model, options: PythonOptions) -> list[py.Statement]:
+        """Helper methods required by the representation options."""
+        statements: list[py.Statement] = []
+
+        for field in model.fields:
+            if cls._is_bitmask(field, options):
+                statements.extend(cls._bitmask_methods(field))
+
+            elif cls._is_epoch(field, options):
+                statements.extend(cls._epoch_methods(field))
+
+            elif cls._is_scaled(field, options):
+                statements.extend(cls._scaled_methods(field))
+
+            elif isinstance(field.datatype, dt.TIME):
+                statements.extend(cls._time_text_methods(field, epoch=False))
+
+        return statements
+
+    @classmethod
+    def _annotations(cls, model: Model, options: PythonOptions) -> list[py.Statement]:
+        return [
+            py.Typed(py.Var(field.name), cls._python_type(field, options))
+            for field in model.fields
+        ]
+
+    @classmethod
+    def _init_method(cls, model: Model, options: PythonOptions) -> py.Def:
+        field_attr: list[py.Statement] = []
+
+        if options.track_changes and model.fields:
+            # bypass `__setattr__` so that a freshly built instance is clean, through a local whose mangled name
+            # can't be the one of a field parameter.
+            field_attr.append(py.Assign(py.Var('__dict'), py.Getattr(py.SELF, py.Var('__dict__'))))
+            field_attr.extend(
+                py.Assign(py.Getitem(py.Var('__dict'), py.Str(field.name)), py.Var(field.name))
+                for field in model.fields
+            )
+        else:
+            field_attr.extend(
+                py.Assign(py.Getattr(py.SELF, py.Var(field.name)), py.Var(field.name))
+                for field in model.fields
+            )
+
+        return py.Def(
+            name='__init__',
+            args=py.Args([py.SELF, *cls._annotations(model, options)]),
+            block=py.Block(field_attr or [py.PASS])
+        )
+
+    @classmethod
+    def _tracking_attributes(cls, model: Model) -> list[py.Statement]:
+        return [
+            py.Assign(py.Var('FIELD_BITS'), py.Dict([
+                (py.Str(field.name), py.Int(1 << index))
+                for index, field in enumerate(model.fields)
+            ])),
+            py.Assign(py.Var('_dirty'), py.Int(0))
+        ]
+
+    @classmethod
+    def _tracking_methods(cls, model: Model, options: PythonOptions) -> list[py.Statement]:
+        dirty = py.Getattr(py.SELF, py.Var('_dirty'))
+        bit = py.Var('bit')
+        key = py.Var('key')
+        value = py.Var('value')
+        mask = py.Var('mask')
+        values = py.Var('values')
+        set_dirty = py.Getattr(py.OBJECT, py.Var('__setattr__'))
+
+        return [
+            py.Def(
+                name='__setattr__',
+                args=py.Args([py.SELF, key, value]),
+                block=py.Block([
+                    py.Call(set_dirty, py.Args([py.SELF, key, value])),
+                    py.Assign(bit, py.Call(
+                        py.Getattr(py.Getattr(py.SELF, py.Var('FIELD_BITS')), py.Var('get')),
+                        py.Args([key])
+                    )),
+                    py.If(bit, py.Block([
+                        py.Call(set_dirty, py.Args([py.SELF, py.Str('_dirty'), py.BinOp(dirty, '|', bit)]))
+                    ]))
+                ])
+            ),
+            py.Def(
+                name='dirty_fields',
+                args=py.Args([py.SELF]),
+                returns=py.Var('list'),
+                block=py.Block([
+                    py.Return(py.ListComp(
+                        elt=key,
+                        target=py.Args([key, bit]),
+                        iter=py.Call(
+                            py.Getattr(py.Getattr(py.SELF, py.Var('FIELD_BITS')), py.Var('items')),
+                            py.Args([])
+                        ),
+                        test=py.BinOp(dirty, '&', bit)
+                    ))
+                ])
+            ),
+            py.Def(
+                name='mark_clean',
+                args=py.Args([py.SELF]),
+                returns=py.Var('None'),
+                block=py.Block([
+                    py.Call(set_dirty, py.Args([py.SELF, py.Str('_dirty'), py.Int(0)]))
+                ])
+            ),
+            # database form of the fields of `mask`, in field order, as written by `to_tuple`.
+            py.Def(
+                name='raw_values',
+                args=py.Args([py.SELF, py.Typed(mask, py.Var('int'))]),
+                returns=py.Var('tuple'),
+                block=py.Block([
+                    py.Assign(values, py.Call(py.Var('list'), py.Args([]))),
+                    *(
+                        py.If(py.BinOp(mask, '&', py.Int(1 << index)), py.Block([
+                            py.Call(py.Getattr(values, py.Var('append')), py.Args([
+                                cls._encode(model, field, py.Getattr(py.SELF, py.Var(field.name)), options)
+                            ]))
+                        ]))
+                        for index, field in enumerate(model.fields)
+                    ),
+                    py.Return(py.Call(py.Var('tuple'), py.Args([values])))
+                ])
+            )
+        ]
+
+    @classmethod
+    def _converter_methods(cls, model: Model, options: PythonOptions) -> list[py.Statement]:
+        row = py.Var('row')
+        data = py.Var('data')
+
+        if options.physical_order:
+            order = Database.column_order(model)
+        else:
+            order = list(range(len(model.fields)))
+
+        positions = {index: position for position, index in enumerate(order)}
+        from_row = py.Call(py.CLS, py.Args([
+            cls._decode(model, field, py.Getitem(row, py.Int(positions[index])), options)
+            for index, field in enumerate(model.fields)
+        ]))
+        from_dict = py.Call(py.CLS, py.Args([
+            cls._decode(model, field, py.Getitem(data, py.Str(field.name)), options)
+            for field in model.fields
+        ]))
+        values = [
+            cls._encode(model, field, py.Getattr(py.SELF, py.Var(field.name)), options)
+            for field in model.fields
+        ]
+
+        return [
+            py.Decorator(
+                base=py.CLASSMETHOD,
+                over=py.Def(
+                    name='from_row',
+                    args=py.Args([py.CLS, py.Typed(row, py.Var('tuple'))]),
+                    returns=py.Str(model.name),
+                    block=py.Block([py.Return(from_row)])
+                )
+            ),
+            py.Decorator(
+                base=py.CLASSMETHOD,
+                over=py.Def(
+                    name='from_rows',
+                    args=py.Args([py.CLS, py.Var('rows')]),
+                    returns=py.Var('list'),
+                    block=py.Block([py.Return(py.ListComp(from_row, row, py.Var('rows')))])
+                )
+            ),
+            py.Decorator(
+                base=py.CLASSMETHOD,
+                over=py.Def(
+                    name='from_dict',
+                    args=py.Args([py.CLS, py.Typed(data, py.Var('dict'))]),
+                    returns=py.Str(model.name),
+                    block=py.Block([py.Return(from_dict)])
+                )
+            ),
+            py.Decorator(
+                base=py.CLASSMETHOD,
+                over=py.Def(
+                    name='from_dicts',
+                    args=py.Args([py.CLS, py.Var('items')]),
+                    returns=py.Var('list'),
+                    block=py.Block([py.Return(py.ListComp(from_dict, data, py.Var('items')))])
+                )
+            ),
+            py.Def(
+                name='to_tuple',
+                args=py.Args([py.SELF]),
+                returns=py.Var('tuple'),
+                block=py.Block([py.Return(py.Tuple([values[index] for index in order]))])
+            ),
+            py.Def(
+                name='to_dict',
+                args=py.Args([py.SELF]),
+                returns=py.Var('dict'),
+                block=py.Block([py.Return(py.Dict([
+                    (py.Str(field.name), value)
+                    for field, value in zip(model.fields, values)
+                ]))])
+            )
+        ]
+
+    @classmethod
+    def _json_methods(cls, model: Model, options: PythonOptions) -> list[py.Statement]:
+        data = py.Var('data')
+        parts = _json_template(
+            model,
+            lambda field: cls._json_parts(field, py.Getattr(py.SELF, py.Var(field.name)), options)
+        )
+
+        return [
+            py.Def(
+                name='to_json',
+                args=py.Args([py.SELF]),
+                returns=py.Var('str'),
+                block=py.Block([py.Return(py.Call(
+                    py.Getattr(py.Str(''), py.Var('join')),
+                    py.Args([py.Tuple([py.Str(part) if isinstance(part, str) else part for part in parts])])
+                ))])
+            ),
+            py.Decorator(
+                base=py.CLASSMETHOD,
+                over=py.Def(
+                    name='from_json',
+                    args=py.Args([py.CLS, py.Typed(py.Var('text'), py.Var('str'))]),
+                    returns=py.Str(model.name),
+                    block=py.Block([
+                        py.Assign(data, py.Call(py.JSON_LOADS, py.Args([py.Var('text')]))),
+                        py.Return(py.Call(py.CLS, py.Args([
+                            cls._json_decode(field, py.Getitem(data, py.Str(field.name)), options)
+                            for field in model.fields
+                        ])))
+                    ])
+                )
+            )
+        ]
+
+    @classmethod
+    def _typecode(cls, field: Field, options: PythonOptions) -> Optional[str]:
+        """`array.array` typecode able to hold the values of `field`, None if a list is required."""
+        datatype = field.datatype
+
+        if cls._is_bitmask(field, options):
+            return _unsigned_typecode(len(datatype.values))
+
+        elif cls._is_enum_code(field, options):
+            return _unsigned_typecode(len(datatype.values).bit_length())
+
+        elif cls._is_epoch(field, options):
+            return 'q'
+
+        elif cls._is_scaled(field, options):
+            # beyond 18 digits the integers don't fit in 64 bits.
+            return 'q' if datatype.size <= 18 else None
+
+        elif datatype is dt.BOOLEAN:
+            return 'B'
+
+        elif isinstance(datatype, dt.BIT):
+            return _unsigned_typecode(datatype.size)
+
+        elif isinstance(datatype, dt.TINYINT):
+            return 'b'
+
+        elif isinstance(datatype, dt.SMALLINT):
+            return 'h'
+
+        elif isinstance(datatype, (dt.MEDIUMINT, dt.INTEGER)):
+            return 'i'
+
+        elif isinstance(datatype, dt.BIGINT):
+            return 'q'
+
+        elif isinstance(datatype, dt.FLOAT):
+            return 'f'
+
+        elif isinstance(datatype, (dt.DOUBLE, dt.DECIMAL)):
+            return 'd'
+
+        else:
+            return None
+
+    @classmethod
+    def _table_classes(cls, model: Model, options: PythonOptions) -> list[py.Statement]:
+        table = py.Var(f'{model.name}Table')
+        view = py.Var(f'{model.name}RowView')
+        columns = py.Var('columns')
+        index = py.Var('index')
+        rows = py.Var('rows')
+        row = py.Var('row')
+        column = py.Var('column')
+        numpy = py.Var('numpy')
+
+        def cell(obj: py.Object, field: Field) -> py.Getitem:
+            return py.Getitem(obj, py.Str(field.name))
+
+        def read(field: Field, value: py.Object) -> py.Object:
+            # BOOLEAN columns are stored as 'B' bytes.
+            if field.datatype is dt.BOOLEAN:
+                return py.Call(py.Var('bool'), py.Args([value]))
+            return value
+
+        def method(name: str, args: list, statements: list, returns: Optional[py.Object] = None) -> py.Def:
+            return py.Def(name=name, args=py.Args([py.SELF, *args]), block=py.Block(statements), returns=returns)
+
+        def new_column(field: Field) -> py.Call:
+            typecode = cls._typecode(field, options)
+            if typecode:
+                return py.Call(py.ARRAY, py.Args([py.Str(typecode)]))
+            else:
+                return py.Call(py.Var('list'), py.Args([]))
+
+        read_columns = py.Assign(columns, py.Getattr(py.SELF, columns))
+
+        def aggregate_methods(field: Field) -> list[py.Def]:
+            """Exact aggregates of a scaled DECIMAL column, see `PythonOptions.decimal_scaled`."""
+            read_column = py.Assign(column, cell(py.Getattr(py.SELF, columns), field))
+            total = py.Call(py.Var('sum'), py.Args([column]))
+
+            if cls._typecode(field, options):
+                # numpy int64 sums are exact as long as they can't overflow.
+                limit = py.Getattr(py.Var(model.name), py.Var(f'{field.name.upper()}_LIMIT'))
+                overflow = py.BinOp(
+                    py.BinOp(py.Call(py.Var('len'), py.Args([column])), '*', limit),
+                    '>=',
+                    py.BinOp(py.Int(1), '<<', py.Int(63))
+                )
+                sum_statements = [
+                    read_column,
+                    py.If(overflow, py.Block([py.Return(total)])),
+                    py.Import(numpy),
+                    py.Return(py.Call(py.Var('int'), py.Args([py.Call(
+                        py.Getattr(py.Call(py.Getattr(numpy, py.Var('frombuffer')), py.Args([
+                            column,
+                            py.Keyword('dtype', py.Getattr(column, py.Var('typecode')))
+                        ])), py.Var('sum')),
+                        py.Args([])
+                    )])))
+                ]
+            else:
+                sum_statements = [read_column, py.Return(total)]
+
+            return [
+                method(f'sum_{field.name}', [], sum_statements, returns=py.Var('int')),
+                method(f'mean_{field.name}', [], [
+                    py.Return(py.BinOp(
+                        py.Call(py.Getattr(py.Var(model.name), py.Var(f'decode_{field.name}')), py.Args([
+                            py.Call(py.Getattr(py.SELF, py.Var(f'sum_{field.name}')), py.Args([]))
+                        ])),
+                        '/',
+                        py.Call(py.Var('len'), py.Args([py.SELF]))
+                    ))
+                ], returns=py.DECIMAL)
+            ]
+
+        # numpy types of the epoch integer columns, see `PythonOptions.time_epoch`.
+        numpy_types = {
+            field.name: ('timedelta64' if isinstance(field.datatype, dt.TIME) else 'datetime64') +
+                        ('[us]' if field.datatype.fsp else '[s]')
+            for field in model.fields
+            if cls._is_epoch(field, options)
+        }
+        numpy_view = py.Var('view')
+        numpy_statements = [
+            # zero-copy view : the column can't grow while the view is alive.
+            py.Assign(numpy_view, py.Call(py.Getattr(numpy, py.Var('frombuffer')), py.Args([
+                column,
+                py.Keyword('dtype', py.Getattr(column, py.Var('typecode')))
+            ])))
+        ]
+
+        if numpy_types:
+            numpy_types_attr = py.Getattr(py.SELF, py.Var('NUMPY_TYPES'))
+            numpy_statements.append(py.If(py.BinOp(py.Var('name'), 'in', numpy_types_attr), py.Block([
+                py.Return(py.Call(py.Getattr(numpy_view, py.Var('view')), py.Args([
+                    py.Getitem(numpy_types_attr, py.Var('name'))
+                ])))
+            ])))
+
+        table_class = py.Class(
+            name=table.name,
+            block=py.Block([
+                *(
+                    [py.Assign(py.Var('NUMPY_TYPES'), py.Dict([
+                        (py.Str(name), py.Str(numpy_type)) for name, numpy_type in numpy_types.items()
+                    ]))]
+                    if numpy_types else []
+                ),
+                method('__init__', [], [
+                    py.Assign(py.Getattr(py.SELF, columns), py.Dict([
+                        (py.Str(field.name), new_column(field))
+                        for field in model.fields
+                    ]))
+                ]),
+                method('__len__', [], [
+                    py.Return(
+                        py.Call(py.Var('len'), py.Args([cell(py.Getattr(py.SELF, columns), model.fields[0])]))
+                        if model.fields else py.Int(0)
+                    )
+                ], returns=py.Var('int')),
+                method('append', [py.Typed(row, py.Str(model.name))], [
+                    read_columns,
+                    *(
+                        py.Call(py.Getattr(cell(columns, field), py.Var('append')), py.Args([
+                            py.Getattr(row, py.Var(field.name))
+                        ]))
+                        for field in model.fields
+                    )
+                ], returns=py.Var('None')),
+                method('extend', [rows], [
+                    py.Assign(rows, py.Call(py.Var('list'), py.Args([rows]))),
+                    read_columns,
+                    *(
+                        py.Call(py.Getattr(cell(columns, field), py.Var('extend')), py.Args([
+                            py.ListComp(py.Getattr(row, py.Var(field.name)), row, rows)
+                        ]))
+                        for field in model.fields
+                    )
+                ], returns=py.Var('None')),
+                method('get', [py.Typed(index, py.Var('int'))], [
+                    read_columns,
+                    py.Return(py.Call(py.Var(model.name), py.Args([
+                        read(field, py.Getitem(cell(columns, field), index))
+                        for field in model.fields
+                    ])))
+                ], returns=py.Str(model.name)),
+                method('__getitem__', [index], [
+                    py.If(py.Call(py.Var('isinstance'), py.Args([index, py.Var('slice')])), py.Block([
+                        read_columns,
+                        py.Assign(py.Var('table'), py.Call(py.Getattr(table, py.Var('__new__')), py.Args([table]))),
+                        py.Assign(py.Getattr(py.Var('table'), columns), py.Dict([
+                            (py.Str(field.name), py.Getitem(cell(columns, field), index))
+                            for field in model.fields
+                        ])),
+                        py.Return(py.Var('table'))
+                    ])),
+                    py.Return(py.Call(view, py.Args([
+                        py.SELF,
+                        py.Getitem(py.Call(py.Var('range'), py.Args([py.Call(py.Var('len'), py.Args([py.SELF]))])), index)
+                    ])))
+                ]),
+                method('as_numpy', [py.Typed(py.Var('name'), py.Var('str'))], [
+                    py.Import(numpy),
+                    py.Assign(column, py.Getitem(py.Getattr(py.SELF, columns), py.Var('name'))),
+                    py.If(py.Call(py.Var('isinstance'), py.Args([column, py.Var('list')])), py.Block([
+                        py.Return(py.Call(py.Getattr(numpy, py.Var('array')), py.Args([column])))
+                    ])),
+                    *numpy_statements,
+                    py.Return(numpy_view)
+                ]),
+                *(
+                    statement
+                    for field in model.fields
+                    if cls._is_scaled(field, options)
+                    for statement in aggregate_methods(field)
+                )
+            ])
+        )
+
+        table_attr = py.Getattr(py.SELF, py.Var('_table'))
+        index_attr = py.Getattr(py.SELF, py.Var('_index'))
+
+        view_class = py.Class(
+            name=view.name,
+            block=py.Block([
+                py.Assign(py.Var('__slots__'), py.Tuple([py.Str('_table'), py.Str('_index')])),
+                method('__init__', [py.Typed(py.Var('table'), py.Str(table.name)), py.Typed(index, py.Var('int'))], [
+                    py.Assign(table_attr, py.Var('table')),
+                    py.Assign(index_attr, index)
+                ]),
+                *(
+                    py.Decorator(
+                        base=py.PROPERTY,
+                        over=method(field.name, [], [
+                            py.Return(read(field, py.Getitem(cell(py.Getattr(table_attr, columns), field), index_attr)))
+                        ], returns=cls._python_type(field, options))
+                    )
+                    for field in model.fields
+                )
+            ])
+        )
+
+        return [table_class, view_class]
+
+    @classmethod
+    def _dataclass(cls, model: Model, options: PythonOptions) -> py.Decorator:
+        statements: list[py.Statement] = []
+
+        if options.track_changes:
+            statements.extend(cls._tracking_attributes(model))
+
+        statements.extend(cls._mode_attributes(model, options))
+        statements.extend(cls._annotations(model, options))
+        statements.extend(cls._mode_methods(model, options))
+
+        if options.track_changes:
+            statements.append(py.Def(
+                name='__post_init__',
+                args=py.Args([py.SELF]),
+                block=py.Block([
+                    py.Call(py.Getattr(py.SELF, py.Var('mark_clean')), py.Args([]))
+                ])
+            ))
+            statements.extend(cls._tracking_methods(model, options))
+
+        if options.converters:
+            statements.extend(cls._converter_methods(model, options))
+
+        if options.json:
+            statements.extend(cls._json_methods(model, options))
+
+        if not statements:
+            statements.append(py.PASS)
+
+        return py.Decorator(
+            base=py.DATACLASS,
+            over=py.Class(
+                name=model.name,
+                block=py.Block(statements)
+            )
+        )
+
+    @classmethod
+    def _class(cls, model: Model, options: PythonOptions) -> py.Class:
+        statements: list[py.Statement] = []
+
+        if options.track_changes:
+            statements.extend(cls._tracking_attributes(model))
+
+        statements.extend(cls._mode_attributes(model, options))
+        statements.append(cls._init_method(model, options))
+        statements.extend(cls._mode_methods(model, options))
+
+        if options.track_changes:
+            statements.extend(cls._tracking_methods(model, options))
+
+        if options.converters:
+            statements.extend(cls._converter_methods(model, options))
+
+        if options.json:
+            statements.extend(cls._json_methods(model, options))
+
+        return py.Class(
+            name=model.name,
+            block=py.Block(statements)
+        )
+
+    @classmethod
+    def _enum_classes(cls, model: Model, options: PythonOptions) -> list[py.Statement]:
+        classes: list[py.Statement] = []
+
+        for field in model.fields:
+            if not cls._is_enum_code(field, options):
+                continue
+
+            values = ['', *field.datatype.values]
+            classes.append(py.Class(
+                name=_enum_class_name(model, field),
+                block=py.Block([
+                    py.Assign(py.Var('VALUES'), py.Tuple(list(map(py.Str, values)))),
+                    py.Assign(py.Var('CODES'), py.Dict([
+                        (py.Str(value), py.Int(code))
+                        for code, value in enumerate(values)
+                    ])),
+                    *(
+                        py.Assign(py.Var(name), py.Int(code))
+                        for name, code in _enum_constants(field.datatype.values)
+                    )
+                ])
+            ))
+
+        return classes
+
+    @classmethod
+    def _extra_classes(cls, model: Model, options: PythonOptions) -> list[py.Statement]:
+        if options.table:
+            return cls._table_classes(model, options)
+
+        return []
+
+    @classmethod
+    def model_dataclass(cls, model: Model, options: PythonOptions = PythonOptions()) -> py.Module:
+        return py.Module([
+            py.DATACLASS.import_info,
+            *cls._imports(model, options),
+            *cls._enum_classes(model, options),
+            cls._dataclass(model, options),
+            *cls._extra_classes(model, options)
+        ])
+
+    @classmethod
+    def _model_statements(cls, model: Model, options: PythonOptions) -> list[py.Statement]:
+        """Classes of `model`, without their imports."""
+        return [
+            *cls._enum_classes(model, options),
+            cls._class(model, options),
+            *cls._extra_classes(model, options)
+        ]
+
+    @classmethod
+    def model_class(cls, model: Model, options: PythonOptions = PythonOptions()) -> py.Module:
+        return py.Module([
+            *cls._imports(model, options),
+            *cls._model_statements(model, options)
+        ])
+
+    @classmethod
+    def model_classes(cls, models: list[Model], options: PythonOptions = PythonOptions()) -> py.Module:
+        imports: list[py.Statement] = []
+        classes: list[py.Statement] = []
+
+        for model in models:
+            imports.extend(cls._imports(model, options))
+            classes.extend(cls._model_statements(model, options))
+
+        return py.Module([
+            *imports,
+            *classes
+        ])
+
+    @classmethod
+    def _module_name(cls, model: Model) -> str:
+        name = Case.join_snake(Case.split_pascal(model.name))
+        return name + '_' if keyword.iskeyword(name) else name
+
+    @classmethod
+    def _package_init(cls, index: dict[str, str]) -> py.Module:
+        """`__init__` importing the module of a class on the first access to its name (PEP 562)."""
+        name = py.Var('name')
+        modules = py.Var('_MODULES')
+        value = py.Var('value')
+
+        return py.Module([
+            py.IMPORT_MODULE.import_info,
+            py.Assign(modules, py.Dict([(py.Str(key), py.Str('.' + module)) for key, module in index.items()])),
+            py.Assign(py.Var('__all__'), py.Tuple([py.Str(key) for key in index])),
+            py.Def(
+                name='__getattr__',
+                args=py.Args([name]),
+                block=py.Block([
+                    py.If(
+                        test=py.BinOp(name, 'not in', modules),
+                        block=py.Block([
+                            py.Raise(py.Call(py.Var('AttributeError'), py.Args([
+                                py.BinOp(
+                                    py.Str('module %r has no attribute %r'),
+                                    '%',
+                                    py.Tuple([py.Var('__name__'), name])
+                                )
+                            ])))
+                        ])
+                    ),
+                    py.Assign(value, py.Call(py.Var('getattr'), py.Args([
+                        py.Call(py.IMPORT_MODULE, py.Args([py.Getitem(modules, name), py.Var('__name__')])),
+                        name
+                    ]))),
+                    py.Assign(py.Getitem(py.Call(py.Var('globals'), py.Args([])), name), value),
+                    py.Return(value)
+                ])
+            ),
+            py.Def(
+                name='__dir__',
+                args=py.Args([]),
+                block=py.Block([
+                    # the loaded classes are both in the globals and in `__all__`.
+                    py.Return(py.Call(py.Var('sorted'), py.Args([
+                        py.BinOp(
+                            py.Call(py.Var('set'), py.Args([py.Call(py.Var('globals'), py.Args([]))])),
+                            '|',
+                            py.Call(py.Var('set'), py.Args([py.Var('__all__')]))
+                        )
+                    ])))
+                ])
+            )
+        ])
+
+    @classmethod
+    def model_package(cls, models: list[Model], options: PythonOptions = PythonOptions(),
+                      models_per_module: int = 1) -> py.Package:
+        """
+            Package of the `models` classes, `models_per_module` per module, behaving like `model_classes`.
+            Its `__init__` holds the index of the module of each class and imports a module only when one of its
+            classes is first accessed, so that using a few models doesn't execute the classes of all of them.
+        """
+        modules: dict[str, py.Module] = {}
+        index: dict[str, str] = {}
+
+        for start in range(0, len(models), models_per_module):
+            shard = models[start:start + models_per_module]
+            name = cls._module_name(shard[0]) if models_per_module == 1 else f'shard_{start // models_per_module}'
+            module = cls.model_classes(shard, options)
+            assert name not in modules, f"Module {name!r} is generated twice!"
+            modules[name] = module
+
+            for statement in module.statements:
+                while isinstance(statement, py.Decorator):
+                    statement = statement.over
+
+                if isinstance(statement, py.Class):
+                    assert statement.name not in index, f"Class {statement.name!r} is generated twice!"
+                    index[statement.name] = name
+
+        modules['__init__'] = cls._package_init(index)
+        return py.Package(modules)
+
+
+@dataclass
+class PythonSerializer(Serializer):
+    options: PythonOptions = PythonOptions()
+
+    @singledispatchmethod
+    def serialize(self, o) -> str:
+        raise NotImplementedError
+
+    @serialize.register
+    def _(self, o: Model) -> str:
+        return Templates.render(('model_class', self.options), o, lambda model: Server.model_class(model, self.options))
+
+    def serialize_many(self, objects: Iterable[Model], sink: TextIO) -> int:
+        """
+            Write the module of `Server.model_classes` to `sink` : the imports of all the models are deduplicated and
+            written first, then the classes of each model are written as soon as they are generated.
+        """
+        models = list(objects)
+        sink.write(str(py.Module([
+            statement
+            for model in models
+            for statement in Server._imports(model, self.options)
+        ])))
+
+        for model in models:
+            sink.write(Templates.render(('model_statements', self.options), model, self._model_statements))
+
+        return len(models)
+
+    def _model_statements(self, model: Model) -> py.Module:
+        return py.Module(Server._model_statements(model, self.options))
+
+
+@dataclass(frozen=True)
+class JavascriptOptions:
+    """
+        Options of the javascript code generated by `Client`.
+            json : add the specialized `toJson` and static `fromJson` methods.
+            columns : add a `<Model>Columns` struct-of-arrays collection and its `<Model>RowView`.
+            set_bitmask : store SET values as integer bitmasks (BigInt above 31 members), see `PythonOptions`.
+            enum_classes : store ENUM values as integer codes, with frozen `<Model><Field>` lookup tables.
+    """
+    json: bool = False
+    columns: bool = False
+    set_bitmask: bool = False
+    enum_classes: bool = False
+
+
+class Client:
+    @classmethod
+    def _is_bitmask(cls, field: Field, options: JavascriptOptions) -> bool:
+        return options.set_bitmask and isinstance(field.datatype, dt.SET)
+
+    @classmethod
+    def _is_big_bitmask(cls, field: Field, options: JavascriptOptions) -> bool:
+        # javascript bitwise operators work on 32 bits signed integers.
+        return cls._is_bitmask(field, options) and len(field.datatype.values) > 31
+
+    @classmethod
+    def _is_enum_code(cls, field: Field, options: JavascriptOptions) -> bool:
+        return options.enum_classes and isinstance(field.datatype, dt.ENUM)
+
+    @classmethod
+    def _json_parts(cls, field: Field, value: js.Expression, options: JavascriptOptions) -> list:
+        if cls._is_bitmask(field, options) and _is_wide_set(field.datatype):
+            return ['"', value, '"']
+
+        elif cls._is_bitmask(field, options) or cls._is_enum_code(field, options):
+            return [value]
+
+        return _javascript_json_parts(field.datatype, value)
+
+    @classmethod
+    def _json_decode(cls, field: Field, value: js.Expression, options: JavascriptOptions) -> js.Expression:
+        if cls._is_big_bitmask(field, options):
+            return js.Call(js.Var('BigInt'), js.Args([value]))
+
+        elif cls._is_bitmask(field, options) or cls._is_enum_code(field, options):
+            return value
+
+        return _javascript_json_decode(field.datatype, value)
+
+    @classmethod
+    def _bitmask_statements(cls, model: Model, field: Field, options: JavascriptOptions) -> list[js.Statement]:
+        bits = js.Getattr(js.Var(model.name), js.Var(f'{field.name.upper()}_BITS'))
+        members = js.Getattr(js.Var(model.name), js.Var(f'{field.name.upper()}_MEMBERS'))
+        number = js.BigNum if cls._is_big_bitmask(field, options) else js.Num
+        mask = js.Var('mask')
+        member = js.Var('member')
+        text = js.Var('text')
+        freeze = js.Getattr(js.OBJECT, js.Var('freeze'))
+
+        return [
+            # '' is the empty set, so that `encode` doesn't need a branch.
+            js.ClassField(bits.key.name, js.Call(freeze, js.Args([js.Obj([
+                ('', number(0)),
+                *((value, number(1 << index)) for index, value in enumerate(field.datatype.values))
+            ])])), static=True),
+            js.ClassField(members.key.name, js.Call(freeze, js.Args([js.Array([
+                js.Str(value)
+                for value in field.datatype.values
+            ])])), static=True),
+            js.Method(
+                name=f'encode_{field.name}',
+                args=js.Args([text]),
+                block=js.Block([js.Return(js.Call(
+                    js.Getattr(js.Call(js.Getattr(text, js.Var('split')), js.Args([js.Str(',')])), js.Var('reduce')),
+                    js.Args([js.Arrow(js.Args([mask, member]), js.BinOp(mask, '|', js.Getitem(bits, member))), number(0)])
+                ))]),
+                static=True
+            ),
+            js.Method(
+                name=f'decode_{field.name}',
+                args=js.Args([mask]),
+                block=js.Block([js.Return(js.Call(
+                    js.Getattr(js.Call(js.Getattr(members, js.Var('filter')), js.Args([
+                        js.Arrow(js.Args([member]), js.BinOp(mask, '&', js.Getitem(bits, member)))
+                    ])), js.Var('join')),
+                    js.Args([js.Str(',')])
+                ))]),
+                static=True
+            )
+        ]
+
+    @classmethod
+    def _mode_statements(cls, model: Model, options: JavascriptOptions) -> list[js.Statement]:
+        """Static tables and helpers required by the representation options."""
+        statements: list[js.Statement] = []
+
+        for field in model.fields:
+            if cls._is_bitmask(field, options):
+                statements.extend(cls._bitmask_statements(model, field, options))
+
+        return statements
+
+    @classmethod
+    def _constructor(cls, model: Model) -> js.Method:
+        return js.Method(
+            name='constructor',
+            args=js.Args([
+                js.Var(field.name)
+                for field in model.fields
+            ]),
+            block=js.Block([
+                js.Assign(js.Getattr(js.THIS, js.Var(field.name)), js.Var(field.name))
+                for field in model.fields
+            ])
+        )
+
+    @classmethod
+    def _json_methods(cls, model: Model, options: JavascriptOptions) -> list[js.Statement]:
+        data = js.Var('data')
+        parts = [
+            js.Str(part) if isinstance(part, str) else part
+            for part in _json_template(
+                model,
+                lambda field: cls._json_parts(field, js.Getattr(js.THIS, js.Var(field.name)), options)
+            )
+        ]
+
+        text = parts[0]
+        for part in parts[1:]:
+            text = js.BinOp(text, '+', part)
+
+        return [
+            js.Method(
+                name='toJson',
+                args=js.Args([]),
+                block=js.Block([js.Return(text)])
+            ),
+            js.Method(
+                name='fromJson',
+                args=js.Args([js.Var('text')]),
+                block=js.Block([
+                    js.Const(data, js.Call(js.Getattr(js.JSON, js.Var('parse')), js.Args([js.Var('text')]))),
+                    js.Return(js.New(js.Var(model.name), js.Args([
+                        cls._json_decode(field, js.Getattr(data, js.Var(field.name)), options)
+                        for field in model.fields
+                    ])))
+                ]),
+                static=True
+            )
+        ]
+
+    @classmethod
+    def _typed_array(cls, field: Field, options: JavascriptOptions) -> Optional[str]:
+        """Name of the TypedArray able to hold the values of `field`, None if a plain Array is required."""
+        datatype = field.datatype
+
+        if cls._is_big_bitmask(field, options):
+            return 'BigUint64Array'
+
+        elif cls._is_bitmask(field, options):
+            return _unsigned_typed_array(len(datatype.values))
+
+        elif cls._is_enum_code(field, options):
+            return _unsigned_typed_array(len(datatype.values).bit_length())
+
+        elif datatype is dt.BOOLEAN:
+            return 'Uint8Array'
+
+        elif isinstance(datatype, dt.BIT):
+            return _unsigned_typed_array(datatype.size)
+
+        elif isinstance(datatype, dt.TINYINT):
+            return 'Int8Array'
+
+        elif isinstance(datatype, dt.SMALLINT):
+            return 'Int16Array'
+
+        elif isinstance(datatype, (dt.MEDIUMINT, dt.INTEGER)):
+            return 'Int32Array'
+
+        elif isinstance(datatype, dt.BIGINT):
+            return 'BigInt64Array'
+
+        elif isinstance(datatype, dt.FLOAT):
+            return 'Float32Array'
+
+        elif isinstance(datatype, (dt.DOUBLE, dt.DECIMAL)):
+            return 'Float64Array'
+
+        else:
+            return None
+
+    @classmethod
+    def _column_value(cls, field: Field, options: JavascriptOptions, cell: js.Expression) -> js.Expression:
+        """Value of a `cell` of the column of `field`, of the type of the model class attribute."""
+        typed_array = cls._typed_array(field, options)
+
+        if field.datatype is dt.BOOLEAN:
+            return js.Call(js.Var('Boolean'), js.Args([cell]))
+
+        # only the wide SET bitmasks are BigInt in the model class.
+        elif typed_array and typed_array.startswith('Big') and not cls._is_big_bitmask(field, options):
+            return js.Call(js.Var('Number'), js.Args([cell]))
+
+        return cell
+
+    @classmethod
+    def _columns_class(cls, model: Model, options: JavascriptOptions) -> js.Class:
+        name = js.Var(f'{model.name}Columns')
+        length = js.Getattr(js.THIS, js.Var('length'))
+        capacity = js.Getattr(js.THIS, js.Var('capacity'))
+        columns = js.Getattr(js.THIS, js.Var('columns'))
+        arg_capacity = js.Var('capacity')
+        index = js.Var('index')
+        row = js.Var('row')
+        array = js.Var('array')
+        copy = js.Var('copy')
+
+        appends: list[js.Statement] = []
+        grows: list[js.Statement] = []
+
+        for field in model.fields:
+            typed_array = cls._typed_array(field, options)
+            column = js.Getattr(columns, js.Var(field.name))
+            value = js.Getattr(row, js.Var(field.name))
+
+            if typed_array and typed_array.startswith('Big'):
+                value = js.Call(js.Var('BigInt'), js.Args([value]))
+
+            appends.append(js.Assign(js.Getitem(column, index), value))
+
+            if typed_array:
+                grows.append(js.Assign(column, js.Call(js.Getattr(name, js.Var('grown')), js.Args([column, arg_capacity]))))
+            else:
+                grows.append(js.Assign(js.Getattr(column, js.Var('length')), arg_capacity))
+
+        return js.Class(
+            name=name.name,
+            block=js.Block([
+                js.Method(
+                    name='constructor',
+                    args=js.Args([js.Assign(arg_capacity, js.Num(1024))]),
+                    block=js.Block([
+                        js.Assign(length, js.Num(0)),
+                        js.Assign(capacity, arg_capacity),
+                        js.Assign(columns, js.Obj([
+                            (field.name, js.New(js.Var(cls._typed_array(field, options) or 'Array'), js.Args([arg_capacity])))
+                            for field in model.fields
+                        ]))
+                    ])
+                ),
+                js.Method(
+                    name='append',
+                    args=js.Args([row]),
+                    block=js.Block([
+                        js.If(js.BinOp(length, '===', capacity), js.Block([
+                            js.Call(js.Getattr(js.THIS, js.Var('grow')), js.Args([js.BinOp(capacity, '*', js.Num(2))]))
+                        ])),
+                        js.Const(index, length),
+                        *appends,
+                        js.Assign(length, js.BinOp(index, '+', js.Num(1)))
+                    ])
+                ),
+                js.Method(
+                    name='grow',
+                    args=js.Args([arg_capacity]),
+                    block=js.Block([
+                        *grows,
+                        js.Assign(capacity, arg_capacity)
+                    ])
+                ),
+                js.Method(
+                    name='get',
+                    args=js.Args([index]),
+                    block=js.Block([
+                        js.Return(js.New(js.Var(model.name), js.Args([
+                            cls._column_value(field, options, js.Getitem(js.Getattr(columns, js.Var(field.name)), index))
+                            for field in model.fields
+                        ])))
+                    ])
+                ),
+                js.Method(
+                    name='row',
+                    args=js.Args([index]),
+                    block=js.Block([
+                        js.Return(js.New(js.Var(f'{model.name}RowView'), js.Args([js.THIS, index])))
+                    ])
+                ),
+                js.Method(
+                    name='grown',
+                    args=js.Args([array, arg_capacity]),
+                    block=js.Block([
+                        js.Const(copy, js.New(js.Getattr(array, js.Var('constructor')), js.Args([arg_capacity]))),
+                        js.Call(js.Getattr(copy, js.Var('set')), js.Args([array])),
+                        js.Return(copy)
+                    ]),
+                    static=True
+                )
+            ])
+        )
+
+    @classmethod
+    def _row_view_class(cls, model: Model, options: JavascriptOptions) -> js.Class:
+        table = js.Getattr(js.THIS, js.Var('_table'))
+        index = js.Getattr(js.THIS, js.Var('_index'))
+        value = js.Var('value')
+
+        statements: list[js.Statement] = [
+            js.Method(
+                name='constructor',
+                args=js.Args([js.Var('table'), js.Var('index')]),
+                block=js.Block([
+                    js.Assign(table, js.Var('table')),
+                    js.Assign(index, js.Var('index'))
+                ])
+            )
+        ]
+
+        for field in model.fields:
+            cell = js.Getitem(js.Getattr(js.Getattr(table, js.Var('columns')), js.Var(field.name)), index)
+            typed_array = cls._typed_array(field, options)
+            statements.append(js.Method(
+                name=field.name,
+                args=js.Args([]),
+                block=js.Block([js.Return(cls._column_value(field, options, cell))]),
+                getter=True
+            ))
+            statements.append(js.Method(
+                name=field.name,
+                args=js.Args([value]),
+                block=js.Block([js.Assign(cell, (
+                    js.Call(js.Var('BigInt'), js.Args([value]))
+                    if typed_array and typed_array.startswith('Big') else value
+                ))]),
+                setter=True
+            ))
+
+        return js.Class(
+            name=f'{model.name}RowView',
+            block=js.Block(statements)
+        )
+
+    @classmethod
+    def _enum_classes(cls, model: Model, options: JavascriptOptions) -> list[js.Statement]:
+        freeze = js.Getattr(js.OBJECT, js.Var('freeze'))
+        classes: list[js.Statement] = []
+
+        for field in model.fields:
+            if not cls._is_enum_code(field, options):
+                continue
+
+            values = ['', *field.datatype.values]
+            classes.append(js.Class(
+                name=_enum_class_name(model, field),
+                block=js.Block([
+                    js.ClassField('VALUES', js.Call(freeze, js.Args([js.Array(list(map(js.Str, values)))])), static=True),
+                    # without prototype, so that inherited keys ('toString', ...) aren't valid codes.
+                    js.ClassField('CODES', js.Call(freeze, js.Args([js.Call(
+                        js.Getattr(js.OBJECT, js.Var('setPrototypeOf')),
+                        js.Args([js.Obj([(value, js.Num(code)) for code, value in enumerate(values)]), js.Var('null')])
+                    )])), static=True),
+                    *(
+                        js.ClassField(name, js.Num(code), static=True)
+                        for name, code in _enum_constants(field.datatype.values)
+                    )
+                ])
+            ))
+
+        return classes
+
+    @classmethod
+    def model_module(cls, model: Model, options: JavascriptOptions = JavascriptOptions()) -> js.Module:
+        statements: list[js.Statement] = [
+            *cls._enum_classes(model, options),
+            cls.model_class(model, options)
+        ]
+
+        if options.columns:
+            statements.append(cls._columns_class(model, options))
+            statements.append(cls._row_view_class(model, options))
+
+        return js.Module(statements)
+
+    @classmethod
+    def model_class(cls, model: Model, options: JavascriptOptions = JavascriptOptions()) -> js.Class:
+        statements: list[js.Statement] = [
+            *cls._mode_statements(model, options),
+            cls._constructor(model)
+        ]
+
+        if options.json:
+            statements.extend(cls._json_methods(model, options))
+
+        return js.Class(
+            name=model.name,
+            block=js.Block(statements)
+        )
+
+
+@dataclass
+class JavascriptSerializer(Serializer):
+    _SEPARATOR = "\n\n"
+
+    options: JavascriptOptions = JavascriptOptions()
+
+    @singledispatchmethod
+    def serialize(self, o) -> str:
+        raise NotImplementedError
+
+    @serialize.register
+    def _(self, o: Model) -> str:
+        return Templates.render(('model_module', self.options), o, lambda model: Client.model_module(model, self.options))
+
+
+class Database:
+    @classmethod
+    def table_name(cls, model: Model) -> str:
+        assert Case.is_pascal_case(model.name)
+        return Case.join_snake(Case.split_pascal(model.name))
+
+    @classmethod
+    def _layout_rank(cls, datatype) -> int:
+        if isinstance(datatype, dt.TimeDataType):
+            return 1
+
+        elif isinstance(datatype, (dt.CHAR, dt.BINARY)):
+            return 2
+
+        elif isinstance(datatype, (dt.VARCHAR, dt.VARBINARY)):
+            return 3
+
+        elif _is_blob(datatype) or (_is_text(datatype) and not isinstance(datatype, (dt.ENUM, dt.SET))):
+            return 4
+
+        # numerics, ENUM and SET being stored as fixed width integers.
+        return 0
+
+    @classmethod
+    def column_order(cls, model: Model) -> list[int]:
+        """
+            Field indexes of `model` in storage order : fixed width numerics (widest first), times, CHAR / BINARY,
+            VARCHAR / VARBINARY and finally TEXT / BLOB, the field order being kept within each class.
+        """
+        def key(index: int) -> tuple[int, int]:
+            datatype = model.fields[index].datatype
+            rank = cls._layout_rank(datatype)
+            return rank, -Storage.field_size(datatype).maximum if rank < 2 else 0
+
+        return sorted(range(len(model.fields)), key=key)
+
+    @classmethod
+    def model_command(cls, model: Model, cfg_reorder: bool = False) -> sql.CreateTable:
+        fields = [model.fields[index] for index in cls.column_order(model)] if cfg_reorder else model.fields
+
+        return sql.CreateTable(
+            name=cls.table_name(model),
+            if_not_exists=True,
+            columns=[
+                sql.ColumnDefinition(
+                    name=field.name,
+                    datatype=_get_sql_type(field.datatype)
+                )
+                for field in fields
+            ],
+            cfg_expand=True
+        )
+
+    @classmethod
+    def command_model(cls, command: sql.CreateTable, skipped: Optional[list[str]] = None) -> Model:
+        """
+            Reverse of `model_command`, the columns without datatype being skipped.
+            A ValueError naming the column is raised for the unsupported types (JSON, GEOMETRY, ...) and the invalid
+            arguments, unless `skipped` is given : such columns are then left out and their 'table.column' names
+            appended to it.
+        """
+        fields = []
+
+        for column in command.columns:
+            if not column.datatype:
+                continue
+
+            try:
+                fields.append(Field(column.name, _get_datatype(column.datatype)))
+            except ValueError as error:
+                if skipped is None:
+                    raise ValueError(f"Column {command.name}.{column.name} : {error}") from None
+                skipped.append(f"{command.name}.{column.name}")
+
+        return Model(
+            name=Case.join_pascal(command.name.lower().split('_')),
+            fields=fields
+        )
+
+    @classmethod
+    def load_models(cls, stream: TextIO, skipped: Optional[list[str]] = None) -> Iterator[Model]:
+        """
+            Models of the CREATE TABLE statements of the SQL dump `stream`, read in a single streaming pass.
+            The first column of unsupported type stops the iteration with a ValueError, unless `skipped` is given
+            (see `command_model`) to load the other columns.
+        """
+        return (cls.command_model(command, skipped) for command in sql_parser.parse(stream))
+
+    @classmethod
+    def model_commands(cls, models: list[Model], cfg_reorder: bool = False) -> sql.Commands:
+        return sql.Commands([
+            cls.model_command(model, cfg_reorder)
+            for model in models
+        ])
+
+    @classmethod
+    def update_command(cls, model: Model, columns: list[str], key: str) -> sql.Update:
+        return sql.Update(
+            name=cls.table_name(model),
+            columns=columns,
+            keys=[key]
+        )
+
+    @classmethod
+    def insert_command(cls, model: Model) -> sql.Insert:
+        return sql.Insert(
+            name=cls.table_name(model),
+            columns=[field.name for field in model.fields]
+        )
+
+    @classmethod
+    def update_batches(cls, model: Model, objects: Iterable, key: str) -> list[tuple[str, list[tuple]]]:
+        """
+            Group the changed `objects` (generated with `PythonOptions(track_changes=True)`) by set of dirty fields.
+            Return a list of (command, parameters) where each pair can be run by a single `executemany`, the parameters
+            being in the database form of `to_tuple` whatever the representation options.
+            The rows are matched by their current `key` value, a ValueError is raised if the key of an object was
+            modified since it was loaded.
+        """
+        bits = {field.name: 1 << index for index, field in enumerate(model.fields)}
+        assert key in bits, f"Key {key!r} not found in {model.name!r}!"
+        groups: dict[int, list] = {}
+
+        for obj in objects:
+            mask = obj._dirty
+            if mask & bits[key]:
+                raise ValueError(f"The key {key!r} of a {model.name!r} object was modified, its row can't be matched!")
+            if mask:
+                groups.setdefault(mask, []).append(obj)
+
+        batches = []
+
+        for mask, group in groups.items():
+            columns = [field.name for index, field in enumerate(model.fields) if mask >> index & 1]
+            command = cls.update_command(model, columns, key)
+            batches.append((str(command), [obj.raw_values(mask) + obj.raw_values(bits[key]) for obj in group]))
+
+        return batches
+
+
+class SQLSerializer(Serializer):
+    @singledispatchmethod
+    def serialize(self, o) -> str:
+        raise NotImplementedError
+
+    @serialize.register
+    def _(self, o: Model) -> str:
+        return Templates.render(('model_command', False), o, Database.model_command)
+
+
+_MISSING = object()
+
+# forms of the names in the generated code, see `Templates`.
+_NAME_FORMS: dict[str, Callable[[str], str]] = {
+    'name': lambda name: name,
+    'upper': str.upper,
+    'pascal': lambda name: Case.join_pascal(name.split('_')),
+    'snake': lambda name: Case.join_snake(Case.split_pascal(name))
+}
+_MODEL_SLOT = 'Qzmodel'
+_SLOT_FORMS = re.compile(r'(?P<name>Qzmodel)|(?P<snake>qzmodel)|'
+                         r'qzslot_(?P<field>[a-z]{3})|QZSLOT_(?P<upper>[A-Z]{3})|Qzslot(?P<pascal>[A-Z][a-z]{2})')
+_SLOT_LEFTOVER = re.compile(r'qz(?:model|slot)', re.IGNORECASE)
+
+
+def _field_slot(index: int) -> str:
+    return 'qzslot_' + ''.join(chr(97 + index // 26 ** power % 26) for power in (2, 1, 0))
+
+
+def _slot_index(letters: str) -> int:
+    return sum((ord(char) - 97) * 26 ** power for char, power in zip(letters.lower(), (2, 1, 0))) + 1
+
+
+class Templates:
+    """
+        Text of the code generated for a model, filled from a format template shared by the models of same datatypes.
+        The template of a shape is compiled the first time it is seen, from the code generated for a model whose names
+        are placeholders, and kept only if it reproduces the code of that first model. The later models of the shape
+        skip the tree construction and `tokens` : their names, and the forms derived from them (upper case, pascal
+        case, table name), are formatted in the template.
+        The generators must only use the names as opaque text : a generator branching on a name can't be templated.
+    """
+    enabled = True
+    limit = 1 << 12
+
+    # key -> (format template, [(form, name index), ...]), None when the key can't be templated.
+    _cache: dict[tuple, Optional[tuple[str, tuple[tuple[str, int], ...]]]] = {}
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._cache.clear()
+
+    @classmethod
+    def _compile(cls, model: Model, build: Callable[[Model], Code], expected: str):
+        fills: list[tuple[str, int]] = []
+
+        def slot(match: re.Match) -> str:
+            form = match.lastgroup
+            if form in ('name', 'snake'):
+                fills.append((form, 0))
+            else:
+                fills.append(('name' if form == 'field' else form, _slot_index(match[form])))
+            return '{}'
+
+        placeholders = Model(_MODEL_SLOT, [Field(_field_slot(index), field.datatype) for index, field in enumerate(model.fields)])
+
+        try:
+            text = str(build(placeholders))
+        except Exception:
+            return None
+
+        template = _SLOT_FORMS.sub(slot, text.replace('{', '{{').replace('}', '}}'))
+
+        # a name transformed in an unknown form.
+        if _SLOT_LEFTOVER.search(template):
+            return None
+
+        entry = template, tuple(fills)
+
+        if cls._fill(entry, model) != expected:
+            return None
+
+        return entry
+
+    @classmethod
+    def _fill(cls, entry, model: Model) -> str:
+        template, fills = entry
+        names = [model.name, *[field.name for field in model.fields]]
+        return template.format(*[_NAME_FORMS[form](names[index]) for form, index in fills])
+
+    @classmethod
+    def render(cls, key: tuple, model: Model, build: Callable[[Model], Code]) -> str:
+        """`str(build(model))`, `key` identifying the generator and its options."""
+        if not cls.enabled or 'qz' in model.name.lower() or any('qz' in field.name.lower() for field in model.fields):
+            return str(build(model))
+
+        key = (*key, tuple(Schema.datatype_info(field.datatype) for field in model.fields))
+        entry = cls._cache.get(key, _MISSING)
+
+        if entry is _MISSING:
+            text = str(build(model))
+
+            if len(cls._cache) >= cls.limit:
+                cls._cache.clear()
+
+            cls._cache[key] = cls._compile(model, build, text)
+            return text
+
+        if entry is None:
+            return str(build(model))
+
+        return cls._fill(entry, model)
+
+
+class _Writer(threading.Thread):
+    """Thread writing the texts queued by a `Compiler` to a stream, the queue being bounded to limit the memory."""
+
+    def __init__(self, stream: TextIO, size: int):
+        super().__init__(daemon=True)
+        self.stream = stream
+        self.queue: queue.Queue = queue.Queue(size)
+        self.error: Optional[BaseException] = None
+
+    def run(self) -> None:
+        while (text := self.queue.get()) is not None:
+            # keep draining after an error so that the compiler never blocks on a full queue.
+            if self.error is None:
+                try:
+                    self.stream.write(text)
+                except BaseException as error:
+                    self.error = error
+
+    def write(self, text: str) -> None:
+        self.queue.put(text)
+
+    def close(self) -> None:
+        self.queue.put(None)
+        self.join()
+
+        if self.error is not None:
+            raise self.error
+
+
+@dataclass(frozen=True)
+class Compiler:
+    """
+        Generate the Python, Javascript and SQL code of models in a single pass : each model is handed to every
+        requested target in turn, the datatype mappings being resolved once per datatype for the whole run.
+        Each target stream is written by its own thread, fed through a queue of at most `queue_size` texts.
+        The outputs are those of `Server.model_classes`, `Client.model_module` and `Database.model_commands`, except
+        that the Python imports of a model are written before its classes, when not already written.
+    """
+    python: PythonOptions = PythonOptions()
+    javascript: JavascriptOptions = JavascriptOptions()
+    cfg_reorder: bool = False
+    queue_size: int = 64
+
+    def compile(self, models: Iterable[Model], python: Optional[TextIO] = None, javascript: Optional[TextIO] = None,
+                sql: Optional[TextIO] = None) -> int:
+        """
+            Write the code of `models` to the streams of the requested targets. Return the number of models.
+            The streams are all written up to the first error, which is then raised.
+        """
+        writers = {
+            name: _Writer(stream, self.queue_size)
+            for name, stream in (('python', python), ('javascript', javascript), ('sql', sql))
+            if stream is not None
+        }
+        imports: list[py.Statement] = []
+        count = 0
+
+        for writer in writers.values():
+            writer.start()
+
+        failed = True
+
+        try:
+            with _shared_mappings():
+                for model in models:
+                    for target, writer in writers.items():
+                        for text in self._texts(target, model, imports, count == 0):
+                            writer.write(text)
+
+                    count += 1
+
+            failed = False
+
+        finally:
+            # every writer is closed and joined, an error of the compilation prevailing over the ones of the writers.
+            errors = []
+
+            for writer in writers.values():
+                try:
+                    writer.close()
+                except BaseException as error:
+                    errors.append(error)
+
+            if errors and not failed:
+                raise errors[0]
+
+        return count
+
+    def render(self, models: Iterable[Model], target: str, batch_size: int = 64) -> Iterator[str]:
+        """
+            Code of `models` for `target` ('python', 'javascript' or 'sql') by chunks of the code of `batch_size`
+            models, their concatenation being the output of `compile` for this target. The models are consumed and
+            rendered batch by batch, as the chunks are requested.
+        """
+        models = iter(models)
+        imports: list[py.Statement] = []
+        first = True
+
+        with _shared_mappings():
+            while batch := list(islice(models, batch_size)):
+                texts = []
+
+                for model in batch:
+                    texts.extend(self._texts(target, model, imports, first))
+                    first = False
+
+                yield "".join(texts)
+
+    def _texts(self, target: str, model: Model, imports: list[py.Statement], first: bool) -> Iterator[str]:
+        """Texts of `model` for `target`, `imports` being the python imports already written, updated."""
+        if target == 'python':
+            statements = [
+                statement
+                for statement in Server._imports(model, self.python)
+                if statement not in imports
+            ]
+            imports.extend(statements)
+
+            if statements:
+                yield str(py.Module(statements))
+
+            yield Templates.render(
+                ('model_statements', self.python),
+                model,
+                lambda item: py.Module(Server._model_statements(item, self.python))
+            )
+
+        elif target == 'javascript':
+            if not first:
+                yield JavascriptSerializer._SEPARATOR
+            yield Templates.render(
+                ('model_module', self.javascript),
+                model,
+                lambda item: Client.model_module(item, self.javascript)
+            )
+
+        elif target == 'sql':
+            if not first:
+                yield SQLSerializer._SEPARATOR
+            yield Templates.render(
+                ('model_command', self.cfg_reorder),
+                model,
+                lambda item: Database.model_command(item, self.cfg_reorder)
+            )
+
+        else:
+            raise Exception(f"Compiler target not found for {target!r}!")
 
 
 class Case:
@@ -0,0 +1,215 @@
+import csv
+import random
+import sqlite3
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import Callable, Iterator, Optional, TextIO
+
+from models import datatypes as dt
+from .core import Model
+from .serializers import Database, _format_time
+
+__all__ = [
+    'Synthetic'
+]
+
+_INTEGER_RANGES = {
+    dt.TINYINT: (-128, 127),
+    dt.SMALLINT: (-32768, 32767),
+    dt.MEDIUMINT: (-8388608, 8388607),
+    dt.INTEGER: (-2147483648, 2147483647),
+    dt.BIGINT: (-9223372036854775808, 9223372036854775807)
+}
+
+_TIMESTAMP_RANGE = (datetime(1970, 1, 1, 0, 0, 1), datetime(2038, 1, 19, 3, 14, 7))
+
+# +/- 838:59:59
+_TIME_LIMIT = 838 * 3600 + 59 * 60 + 59
+
+_LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+
+class Synthetic:
+    """
+        Seeded generator of random rows fitting the datatypes of a model, for load tests.
+        Values are in their raw database form, as read by the `from_row` converters : numbers, 0 / 1 for BOOLEAN,
+        ISO strings for the dates and times, ','-joined members for SET. DECIMAL values are rounded floats.
+        Columns are drawn with numpy when it's installed, else with the `random` module : the distributions are the
+        same but the values differ for a same seed.
+            start, end : range of the DATE, DATETIME and TIMESTAMP values.
+            text_limit : maximum length of the generated texts and blobs, whatever the maximum of the datatype.
+    """
+
+    def __init__(self, seed: int = 0, start: date = date(2000, 1, 1), end: date = date(2030, 1, 1),
+                 text_limit: int = 255):
+        self.start = start
+        self.end = end
+        self.text_limit = text_limit
+        # also used with numpy for the integers beyond 64 bits.
+        self._random = random.Random(seed)
+
+        try:
+            import numpy
+        except ImportError:
+            self._numpy = None
+        else:
+            self._numpy = numpy
+            self._generator = numpy.random.default_rng(seed)
+
+    def _integers(self, low: int, high: int, count: int) -> list[int]:
+        """`count` integers from `low` to `high` included."""
+        if self._numpy and -1 << 63 <= low and high < 1 << 64:
+            dtype = 'uint64' if high >= 1 << 63 else 'int64'
+            return self._generator.integers(low, high, count, dtype=dtype, endpoint=True).tolist()
+
+        randint = self._random.randint
+        return [randint(low, high) for _ in range(count)]
+
+    def _floats(self, low: float, high: float, count: int, digits: Optional[int] = None) -> list[float]:
+        if self._numpy:
+            values = self._generator.uniform(low, high, count)
+            if digits is not None:
+                values = self._numpy.round(values, digits)
+            return values.tolist()
+
+        uniform = self._random.uniform
+        if digits is not None:
+            return [round(uniform(low, high), digits) for _ in range(count)]
+        return [uniform(low, high) for _ in range(count)]
+
+    def _texts(self, low: int, high: int, count: int) -> list[str]:
+        """`count` lowercase texts of `low` to `high` characters, sliced out of a single random text."""
+        high = min(high, self.text_limit)
+        lengths = self._integers(min(low, high), high, count)
+        total = sum(lengths)
+
+        if self._numpy:
+            text = self._generator.integers(97, 123, total, dtype='uint8').tobytes().decode('ascii')
+        else:
+            text = ''.join(self._random.choices(_LETTERS, k=total))
+
+        return [text[end - length:end] for end, length in zip(accumulate(lengths), lengths)]
+
+    def _blobs(self, low: int, high: int, count: int) -> list[bytes]:
+        return [text.encode('ascii') for text in self._texts(low, high, count)]
+
+    def _datetimes(self, low: datetime, high: datetime, count: int, unit: str) -> list[str]:
+        """ISO strings of `count` dates (`unit` 'D') or datetimes (`unit` 's') between `low` and `high`."""
+        step = timedelta(days=1) if unit == 'D' else timedelta(seconds=1)
+        offsets_count = (high - low) // step
+
+        if self._numpy:
+            origin = self._numpy.datetime64(low, unit)
+            offsets = self._generator.integers(0, offsets_count, count, endpoint=True)
+            return (origin + offsets).astype(str).tolist()
+
+        if unit == 'D':
+            origin = low.toordinal()
+            return [date.fromordinal(origin + offset).isoformat() for offset in self._integers(0, offsets_count, count)]
+
+        return [(low + offset * step).isoformat() for offset in self._integers(0, offsets_count, count)]
+
+    def column(self, datatype: dt.DataType, count: int) -> list:
+        """`count` random values of `datatype`."""
+        start = datetime.combine(self.start, datetime.min.time())
+        end = datetime.combine(self.end, datetime.min.time())
+
+        if datatype is dt.BOOLEAN:
+            return self._integers(0, 1, count)
+
+        elif datatype is dt.YEAR:
+            return self._integers(1901, 2155, count)
+
+        elif datatype is dt.DATE:
+            return self._datetimes(start, end, count, 'D')
+
+        elif datatype in (dt.TINYTEXT, dt.MEDIUMTEXT, dt.LONGTEXT):
+            return self._texts(0, self.text_limit, count)
+
+        elif datatype in (dt.TINYBLOB, dt.MEDIUMBLOB, dt.LONGBLOB):
+            return self._blobs(0, self.text_limit, count)
+
+        elif isinstance(datatype, dt.BIT):
+            return self._integers(0, (1 << datatype.size) - 1, count)
+
+        elif type(datatype) in _INTEGER_RANGES:
+            return self._integers(*_INTEGER_RANGES[type(datatype)], count)
+
+        elif isinstance(datatype, (dt.FLOAT, dt.DOUBLE)):
+            # the size of FLOAT(p) is a precision in bits, the range being then the one of the types without size.
+            if datatype.size is not None and datatype.d is not None:
+                limit = 10 ** (datatype.size - datatype.d)
+            else:
+                limit = 10 ** 6
+            return self._floats(-limit, limit, count, datatype.d)
+
+        elif isinstance(datatype, dt.DECIMAL):
+            scale = 10 ** datatype.d
+            limit = 10 ** datatype.size - 1
+            return [value / scale for value in self._integers(-limit, limit, count)]
+
+        elif isinstance(datatype, dt.DATETIME):
+            return self._datetimes(start, end, count, 's')
+
+        elif isinstance(datatype, dt.TIMESTAMP):
+            return self._datetimes(max(start, _TIMESTAMP_RANGE[0]), min(end, _TIMESTAMP_RANGE[1]), count, 's')
+
+        elif isinstance(datatype, dt.TIME):
+            return list(map(_format_time, self._integers(-_TIME_LIMIT, _TIME_LIMIT, count)))
+
+        elif isinstance(datatype, dt.CHAR):
+            return self._texts(datatype.size, datatype.size, count)
+
+        elif isinstance(datatype, (dt.VARCHAR, dt.TEXT)):
+            return self._texts(0, datatype.size, count)
+
+        elif isinstance(datatype, dt.BINARY):
+            return self._blobs(datatype.size, datatype.size, count)
+
+        elif isinstance(datatype, (dt.VARBINARY, dt.BLOB)):
+            return self._blobs(0, datatype.size, count)
+
+        elif isinstance(datatype, dt.ENUM):
+            values = datatype.values
+            return [values[index] for index in self._integers(0, len(values) - 1, count)]
+
+        elif isinstance(datatype, dt.SET):
+            members = [(1 << index, value) for index, value in enumerate(datatype.values)]
+            return [
+                ','.join([value for bit, value in members if mask & bit])
+                for mask in self._integers(0, (1 << len(members)) - 1, count)
+            ]
+
+        else:
+            raise Exception(f"Synthetic values not found for {datatype.__class__.__name__!r}!")
+
+    def batches(self, model: Model, count: int, batch_size: int = 1 << 16) -> Iterator[list[list]]:
+        """`count` rows of `model` as batches of columns, of at most `batch_size` rows."""
+        for offset in range(0, count, batch_size):
+            size = min(batch_size, count - offset)
+            yield [self.column(field.datatype, size) for field in model.fields]
+
+    def rows(self, model: Model, count: int, batch_size: int = 1 << 16) -> Iterator[tuple]:
+        for columns in self.batches(model, count, batch_size):
+            yield from zip(*columns)
+
+    def objects(self, model: Model, factory: Callable[[tuple], object], count: int,
+                batch_size: int = 1 << 16) -> Iterator:
+        """Objects built by `factory` from the rows, e.g. the `from_row` of a class generated by `Server`."""
+        return map(factory, self.rows(model, count, batch_size))
+
+    def write_csv(self, model: Model, stream: TextIO, count: int, batch_size: int = 1 << 16) -> None:
+        """Write a header then `count` rows of `model`, `stream` being opened with newline=''."""
+        writer = csv.writer(stream)
+        writer.writerow([field.name for field in model.fields])
+
+        for columns in self.batches(model, count, batch_size):
+            writer.writerows(zip(*columns))
+
+    def write_sqlite(self, model: Model, connection: sqlite3.Connection, count: int,
+                     batch_size: int = 1 << 16) -> None:
+        """Insert `count` rows of `model` in its table, with one `executemany` per batch."""
+        command = str(Database.insert_command(model))
+
+        for columns in self.batches(model, count, batch_size):
+            connection.executemany(command, zip(*columns))
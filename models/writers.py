@@ -0,0 +1,125 @@
+import hashlib
+import itertools
+import os
+import stat
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Optional
+
+__all__ = [
+    'write_atomic',
+    'FileWriter'
+]
+
+# unique suffixes of the temporary files, with the process and thread ids.
+_COUNTER = itertools.count()
+_READ_SIZE = 1 << 16
+
+
+def _file_digest(path: str) -> bytes:
+    digest = hashlib.blake2b(digest_size=32)
+
+    with open(path, mode="rb") as file:
+        while chunk := file.read(_READ_SIZE):
+            digest.update(chunk)
+
+    return digest.digest()
+
+
+def write_atomic(dst: str, data: bytes, fsync: bool = False) -> bool:
+    """
+        Write `data` to the file `dst` unless it already holds it. Return whether the file was written.
+        The data is written to a temporary file of the same directory then renamed to `dst` : readers see either the
+        old or the new file, never a partial one, and a failed write leaves `dst` untouched. The permissions of an
+        existing `dst` are kept.
+            fsync : flush the file to the disk before renaming it, for the writes to survive a system crash.
+    """
+    try:
+        status = os.stat(dst)
+    except FileNotFoundError:
+        status = None
+
+    # compared by size then by hash, without reading the whole file at once.
+    if status is not None and status.st_size == len(data) and \
+            _file_digest(dst) == hashlib.blake2b(data, digest_size=32).digest():
+        return False
+
+    directory, name = os.path.split(os.path.abspath(dst))
+    tmp = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.{next(_COUNTER)}.tmp")
+
+    try:
+        # created with the permissions of a new file, unlike `tempfile` which restricts them to the owner.
+        with open(tmp, mode="xb") as file:
+            file.write(data)
+
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+
+        if status is not None:
+            os.chmod(tmp, stat.S_IMODE(status.st_mode))
+
+        os.replace(tmp, dst)
+
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+    return True
+
+
+class FileWriter:
+    """
+        Batch of atomic writes (see `write_atomic`) run by a pool of threads, the files being written concurrently
+        which hides the latency of the disks and network filesystems when generating many files.
+        The unchanged files are skipped, `written` counts the files actually written once `close` returned.
+            with FileWriter() as writer:
+                for name, module in modules.items():
+                    writer.write(name + ".py", module.render_bytes())
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, fsync: bool = False):
+        self.fsync = fsync
+        self.written = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or min(32, (os.cpu_count() or 1) * 4))
+        self._futures: list[Future] = []
+
+    def write(self, dst: str, data: bytes) -> Future:
+        """Schedule the write of `data` to `dst`, the future resolving to whether the file was written."""
+        future = self._executor.submit(write_atomic, dst, data, self.fsync)
+        self._futures.append(future)
+        return future
+
+    def write_many(self, items: Iterable[tuple[str, bytes]]) -> None:
+        for dst, data in items:
+            self.write(dst, data)
+
+    def close(self) -> int:
+        """Wait for the scheduled writes, raise the first error if any. Return the number of files written."""
+        self._executor.shutdown(wait=True)
+        futures, self._futures = self._futures, []
+        error = None
+
+        for future in futures:
+            if future.exception() is not None:
+                error = error or future.exception()
+            elif future.result():
+                self.written += 1
+
+        if error is not None:
+            raise error
+
+        return self.written
+
+    def __enter__(self) -> 'FileWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # the scheduled writes are completed even when the block failed, its error prevailing over theirs.
+        if exc_type is None:
+            self.close()
+        else:
+            self._executor.shutdown(wait=True)
@@ -0,0 +1,14 @@
+import pytest
+
+from models import PythonOptions, Server
+
+
+@pytest.fixture
+def generate():
+    """Compile the python class of a model and return the namespace of the generated module."""
+    def generate(model, options: PythonOptions = PythonOptions()) -> dict:
+        namespace = {}
+        exec(str(Server.model_class(model, options)), namespace)
+        return namespace
+
+    return generate
@@ -0,0 +1,153 @@
+import asyncio
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from models import Compiler, Field, JavascriptOptions, Model, PythonOptions, datatypes as dt
+from models.aio import generate
+
+COMPILER = Compiler(python=PythonOptions(converters=True, json=True), javascript=JavascriptOptions(json=True))
+MODELS = [
+    Model(f'Item{chr(65 + index // 26)}{chr(97 + index % 26)}', [
+        Field('id', dt.INTEGER(11)),
+        Field('name', dt.VARCHAR(8 + index)),
+        Field('created', dt.DATETIME(index % 7))
+    ])
+    for index in range(40)
+]
+
+
+class Models:
+    """Iterable of the models recording how many of them were consumed, and from which threads."""
+
+    def __init__(self, models):
+        self.models = models
+        self.consumed = 0
+        self.threads = set()
+
+    def __iter__(self):
+        for model in self.models:
+            self.consumed += 1
+            self.threads.add(threading.current_thread().name)
+            yield model
+
+
+async def _collect(models, target, **kwargs) -> list[str]:
+    return [chunk async for chunk in generate(models, target, COMPILER, **kwargs)]
+
+
+@pytest.mark.parametrize('target', ['python', 'javascript', 'sql'])
+@pytest.mark.parametrize('batch_size', [1, 7, 64])
+def test_ordered_chunks(target, batch_size):
+    chunks = asyncio.run(_collect(MODELS, target, batch_size=batch_size))
+    streams = {'python': io.StringIO(), 'javascript': io.StringIO(), 'sql': io.StringIO()}
+    COMPILER.compile(MODELS, **{target: streams[target]})
+
+    assert chunks == list(COMPILER.render(MODELS, target, batch_size))
+    assert len(chunks) == -(-len(MODELS) // batch_size)
+    assert "".join(chunks) == streams[target].getvalue()
+
+
+def test_rendered_in_the_executor():
+    models = Models(MODELS)
+    chunks = asyncio.run(_collect(models, 'sql', batch_size=8))
+
+    assert len(chunks) == 5
+    assert models.threads and all(name.startswith('models.generate') for name in models.threads)
+
+
+def test_given_executor_is_kept():
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix='custom') as executor:
+        models = Models(MODELS)
+        asyncio.run(_collect(models, 'python', batch_size=16, executor=executor))
+
+        assert all(name.startswith('custom') for name in models.threads)
+        assert executor.submit(sum, [1, 2]).result() == 3
+
+
+def test_batches_follow_the_consumer():
+    models = Models(MODELS)
+
+    async def main():
+        chunks = generate(models, 'sql', COMPILER, batch_size=4)
+        await chunks.__anext__()
+        # the next batch is only rendered when the next chunk is requested.
+        await asyncio.sleep(0.05)
+        consumed = models.consumed
+        await chunks.aclose()
+        return consumed
+
+    assert asyncio.run(main()) == 4
+    assert models.consumed == 4
+
+
+def test_cancellation():
+    models = Models(MODELS)
+    first = asyncio.Event()
+
+    async def consume():
+        async for _ in generate(models, 'javascript', COMPILER, batch_size=4):
+            first.set()
+            await asyncio.sleep(10)
+
+    async def main():
+        task = asyncio.create_task(consume())
+        await first.wait()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+    assert models.consumed == 4
+
+
+def test_cancellation_during_a_batch():
+    release = threading.Event()
+    closed = threading.Event()
+
+    def blocking_models():
+        try:
+            for index, model in enumerate(MODELS):
+                if index == 4:
+                    release.wait(5)
+                yield model
+        finally:
+            closed.set()
+
+    chunks = []
+
+    async def consume():
+        async for chunk in generate(blocking_models(), 'sql', COMPILER, batch_size=4):
+            chunks.append(chunk)
+
+    async def main():
+        task = asyncio.create_task(consume())
+        while not chunks:
+            await asyncio.sleep(0.01)
+        # the second batch is blocked in the executor.
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert not closed.is_set()
+        release.set()
+
+    asyncio.run(main())
+    # the batch completes in the background, then the generation is closed without yielding it.
+    assert closed.wait(5)
+    assert len(chunks) == 1
+
+
+def test_errors_are_raised():
+    async def main():
+        async for _ in generate([Model('lower_case', [])], 'sql', COMPILER):
+            pass
+
+    with pytest.raises(AssertionError):
+        asyncio.run(main())
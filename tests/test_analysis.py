@@ -0,0 +1,85 @@
+import pytest
+
+from models import Field, Model, Storage, StorageOptions, datatypes as dt
+
+# bytes of each datatype in the MySQL storage requirements tables, with the utf8mb4 charset of 4 bytes per character:
+#   https://dev.mysql.com/doc/refman/8.0/en/storage-requirements.html
+STORAGE_REQUIREMENTS = [
+    (dt.BOOLEAN, 1, 1),
+    (dt.TINYINT(4), 1, 1),
+    (dt.SMALLINT(6), 2, 2),
+    (dt.MEDIUMINT(9), 3, 3),
+    (dt.INTEGER(11), 4, 4),
+    (dt.BIGINT(20), 8, 8),
+    (dt.FLOAT(), 4, 4),
+    (dt.DOUBLE(), 8, 8),
+    (dt.BIT(1), 1, 1),
+    (dt.BIT(9), 2, 2),
+    (dt.BIT(64), 8, 8),
+    # 4 bytes per group of 9 digits, on each side of the point, and 0-4 bytes for the leftover digits.
+    (dt.DECIMAL(10, 2), 5, 5),
+    (dt.DECIMAL(18, 9), 8, 8),
+    (dt.DECIMAL(65, 30), 30, 30),
+    (dt.YEAR, 1, 1),
+    (dt.DATE, 3, 3),
+    (dt.TIME(0), 3, 3),
+    (dt.TIME(3), 5, 5),
+    (dt.TIME(6), 6, 6),
+    (dt.DATETIME(0), 5, 5),
+    (dt.DATETIME(2), 6, 6),
+    (dt.DATETIME(6), 8, 8),
+    (dt.TIMESTAMP(0), 4, 4),
+    (dt.TIMESTAMP(6), 7, 7),
+    (dt.CHAR(10), 10, 40),
+    (dt.BINARY(16), 16, 16),
+    (dt.VARCHAR(10), 1, 41),
+    (dt.VARCHAR(100), 2, 402),
+    (dt.VARBINARY(255), 1, 256),
+    (dt.VARBINARY(256), 2, 258),
+    (dt.TINYBLOB, 1, 256),
+    (dt.BLOB(65535), 2, 65537),
+    (dt.MEDIUMBLOB, 3, 16_777_218),
+    (dt.LONGTEXT, 4, 4_294_967_299),
+    (dt.ENUM(['a', 'b']), 1, 1),
+    (dt.ENUM([f'v{index}' for index in range(256)]), 2, 2),
+    (dt.SET(['a', 'b']), 1, 1),
+    (dt.SET([f'v{index}' for index in range(17)]), 3, 3),
+    (dt.SET([f'v{index}' for index in range(33)]), 8, 8)
+]
+
+
+@pytest.mark.parametrize('datatype, minimum, maximum', STORAGE_REQUIREMENTS, ids=lambda value: repr(value)[:32])
+def test_field_size(datatype, minimum, maximum):
+    size = Storage.field_size(datatype)
+
+    assert (size.minimum, size.maximum) == (minimum, maximum)
+    assert minimum <= size.average <= maximum
+
+
+@pytest.mark.parametrize('datatype, size', [
+    (dt.TINYTEXT, 9), (dt.TEXT(65535), 10), (dt.MEDIUMBLOB, 11), (dt.LONGBLOB, 12), (dt.INTEGER(11), 4)
+])
+def test_row_limit_size(datatype, size):
+    # BLOB and TEXT columns count 1 to 4 bytes plus an 8 bytes pointer against the row size limit.
+    assert Storage.row_limit_size(datatype) == size
+
+
+def test_analyze_warnings():
+    model = Model('Article', [
+        Field('id', dt.INTEGER(11)),
+        Field('title', dt.VARCHAR(800)),
+        Field('body', dt.TEXT(65535))
+    ])
+    wide = Model('Wide', [Field(f'c{chr(97 + index)}', dt.VARCHAR(5000)) for index in range(4)])
+
+    report = Storage.analyze(model, rows=1000, indexes=[['id'], ['title'], ['body']])
+    assert report.row_limit_bytes == 4 + 3202 + 10
+    assert report.storage_bytes == Storage.table_size(model, 1000)
+    assert report.warnings == [
+        "Article: index (title) key length of 3,200 bytes exceeds 3,072 bytes.",
+        "Article: index (body) needs a prefix length for 'body'."
+    ]
+    assert Storage.analyze(wide).warnings == [
+        "Wide: row size of 80,008 bytes exceeds the 65,535 bytes MySQL limit."
+    ]
+    assert Storage.analyze(model, options=StorageOptions(charset_bytes=1)).row_limit_bytes == 4 + 802 + 10
@@ -0,0 +1,98 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from models import Client, Field, JavascriptOptions, Model, PythonOptions, datatypes as dt
+
+PERMISSION = Model('Permission', [
+    Field('id', dt.BIGINT(20)),
+    Field('small', dt.SET(['read', 'write', 'admin'])),
+    Field('wide', dt.SET([f'flag{index}' for index in range(60)]))
+])
+
+needs_node = pytest.mark.skipif(shutil.which('node') is None, reason="node is required to run the javascript")
+
+
+@pytest.fixture
+def Permission(generate):
+    return generate(PERMISSION, PythonOptions(converters=True, json=True, set_bitmask=True))['Permission']
+
+
+def test_encode_decode(Permission):
+    assert Permission.encode_small('') == 0
+    assert Permission.encode_small('read,admin') == 0b101
+    assert Permission.decode_small(0b101) == 'read,admin'
+    assert Permission.decode_wide(Permission.encode_wide('flag0,flag59')) == 'flag0,flag59'
+
+
+def test_row_round_trip(Permission):
+    permission = Permission.from_row((1, 'write', 'flag1,flag58'))
+
+    assert permission.small == 0b10
+    assert permission.wide == 1 << 1 | 1 << 58
+    assert permission.to_tuple() == (1, 'write', 'flag1,flag58')
+
+
+def test_json_round_trip(Permission):
+    permission = Permission(1, 0b11, (1 << 59) | 1)
+    data = json.loads(permission.to_json())
+
+    # masks which can exceed Number.MAX_SAFE_INTEGER are strings.
+    assert data == {'id': 1, 'small': 3, 'wide': str((1 << 59) | 1)}
+    assert Permission.from_json(permission.to_json()).__dict__ == permission.__dict__
+
+
+def _run_javascript(model: Model, options: JavascriptOptions, script: str) -> str:
+    code = f"{Client.model_module(model, options)}\n{script}\n"
+    return subprocess.run(['node', '-e', code], capture_output=True, text=True, check=True).stdout
+
+
+@needs_node
+def test_javascript_json_is_exact(Permission):
+    text = Permission(2 ** 62, 0b110, (1 << 59) | (1 << 53) | 1).to_json()
+    output = _run_javascript(PERMISSION, JavascriptOptions(json=True, set_bitmask=True), f"""
+        const permission = Permission.fromJson({json.dumps(text)})
+        console.log(permission.wide === {(1 << 59) | (1 << 53) | 1}n)
+        console.log(permission.toJson())
+    """)
+
+    assert output.split('\n')[0] == 'true'
+    assert json.loads(output.split('\n')[1])['wide'] == json.loads(text)['wide']
+
+
+@needs_node
+def test_javascript_row_view_setter():
+    output = _run_javascript(PERMISSION, JavascriptOptions(columns=True, set_bitmask=True), """
+        const columns = new PermissionColumns(2)
+        columns.append(new Permission(1, 0, 0))
+        const row = columns.row(0)
+        row.id = 7
+        row.wide = 5
+        console.log(String(row.id), String(row.wide))
+    """)
+
+    assert output.strip() == '7 5'
+
+
+@needs_node
+def test_javascript_column_reads_match_the_model():
+    model = Model('Flag', [
+        Field('id', dt.BIGINT(20)),
+        Field('enabled', dt.BOOLEAN),
+        Field('bits', dt.BIT(40)),
+        Field('wide', dt.SET([f'flag{index}' for index in range(60)]))
+    ])
+    output = _run_javascript(model, JavascriptOptions(columns=True, set_bitmask=True), """
+        const columns = new FlagColumns(2)
+        columns.append(new Flag(7, true, 2 ** 33, 1n << 59n))
+        const flag = columns.get(0)
+        const row = columns.row(0)
+        for (const value of [flag, row]) {
+            console.log(typeof value.id, typeof value.enabled, typeof value.bits, typeof value.wide)
+        }
+        console.log(row.id === 7, row.enabled === true, row.bits === 2 ** 33, row.wide === 1n << 59n)
+    """)
+
+    assert output.strip().split('\n') == ['number boolean number bigint'] * 2 + ['true true true true']
@@ -0,0 +1,67 @@
+import io
+from decimal import Decimal
+
+import pytest
+
+from models import CsvCodec, CsvOptions, Field, Model, Synthetic, datatypes as dt
+
+RECORD = Model('Record', [
+    Field('id', dt.BIGINT(20)),
+    Field('active', dt.BOOLEAN),
+    Field('ratio', dt.DOUBLE()),
+    Field('price', dt.DECIMAL(10, 2)),
+    Field('name', dt.VARCHAR(255)),
+    Field('payload', dt.BLOB(1024)),
+    Field('day', dt.DATE),
+    Field('at', dt.DATETIME(6)),
+    Field('took', dt.TIME(0)),
+    Field('tags', dt.SET(['a', 'b']))
+])
+
+ROWS = [
+    (1, 1, 0.5, Decimal('12.34'), 'plain', b'\x00\xff', '2020-01-01', '2020-01-01 12:30:00.000001', '-01:02:03', 'a,b'),
+    (2, 0, -1e-300, Decimal('-0.01'), 'quote " comma , newline \n tab \t', b'', '1970-01-01', '1970-01-01 00:00:00',
+     '838:59:59', ''),
+    (3, None, None, None, 'back\\slash \\N é', None, None, None, None, None)
+]
+
+
+def _round_trip(options: CsvOptions, rows: list) -> list:
+    codec = CsvCodec(RECORD, options)
+    stream = io.StringIO(newline='')
+    assert codec.write(rows, stream, chunk_size=2) == len(rows)
+    stream.seek(0)
+    return list(codec.read(stream, chunk_size=2))
+
+
+@pytest.mark.parametrize('options', [
+    CsvOptions(),
+    CsvOptions(escape=False, null='NULL'),
+    CsvOptions(delimiter='\t', header=False)
+])
+def test_round_trip(options):
+    assert _round_trip(options, ROWS) == ROWS
+
+
+def test_null_text_without_escape():
+    # the sqlite3 shell can't tell the texts equal to the NULL marker from NULL.
+    row = (1, 1, 0.5, Decimal('1.00'), 'NULL', b'', '2020-01-01', '2020-01-01 00:00:00', '00:00:00', '')
+    assert _round_trip(CsvOptions(escape=False, null='NULL'), [row])[0][4] is None
+
+
+def test_synthetic_rows():
+    rows = list(Synthetic(seed=5).rows(RECORD, 300))
+    decoded = _round_trip(CsvOptions(), rows)
+
+    assert len(decoded) == len(rows)
+    for row, values in zip(rows, decoded):
+        assert values[:3] == row[:3]
+        assert values[3] == Decimal(str(row[3]))
+        assert values[4:] == row[4:]
+
+
+def test_header_mismatch():
+    stream = io.StringIO('id,other\n', newline='')
+
+    with pytest.raises(AssertionError):
+        list(CsvCodec(RECORD).read(stream))
@@ -0,0 +1,52 @@
+import io
+import threading
+
+import pytest
+
+from models import Compiler, Database, Field, Model, PythonOptions, datatypes as dt
+from models.serializers import _Writer
+
+MODELS = [
+    Model(name, [Field('id', dt.INTEGER(11)), Field('at', dt.DATETIME(0)), Field('name', dt.VARCHAR(8))])
+    for name in ('User', 'Order', 'Product', 'Invoice', 'Payment')
+]
+
+
+class FailingStream(io.StringIO):
+    def write(self, text: str) -> int:
+        raise OSError("disk full")
+
+
+def _writers() -> list:
+    return [thread for thread in threading.enumerate() if isinstance(thread, _Writer)]
+
+
+def test_outputs():
+    python, sql = io.StringIO(), io.StringIO()
+
+    assert Compiler(PythonOptions(converters=True)).compile(MODELS, python=python, sql=sql) == len(MODELS)
+    assert sql.getvalue() == str(Database.model_commands(MODELS))
+    namespace = {}
+    exec(python.getvalue(), namespace)
+    assert namespace['Payment'].from_row((1, '2020-01-01 00:00:00', 'x')).to_tuple() == (1, '2020-01-01 00:00:00', 'x')
+
+
+def test_writer_error_joins_all_writers():
+    sql = io.StringIO()
+
+    with pytest.raises(OSError, match="disk full"):
+        Compiler().compile(MODELS, python=FailingStream(), javascript=FailingStream(), sql=sql)
+
+    assert not _writers()
+    assert sql.getvalue() == str(Database.model_commands(MODELS))
+
+
+def test_compilation_error_prevails():
+    def models():
+        yield MODELS[0]
+        raise ValueError("broken model source")
+
+    with pytest.raises(ValueError, match="broken model source"):
+        Compiler().compile(models(), python=FailingStream(), sql=io.StringIO())
+
+    assert not _writers()
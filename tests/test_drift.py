@@ -0,0 +1,67 @@
+import sqlite3
+
+import pytest
+
+from models import Database, Drift, DriftReport, Field, Model, datatypes as dt
+
+USER = Model('User', [Field('id', dt.INTEGER(11)), Field('email', dt.VARCHAR(255)), Field('score', dt.DOUBLE(16, 4))])
+PURCHASE = Model('Purchase', [Field('id', dt.INTEGER(11)), Field('total', dt.DECIMAL(10, 2))])
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(':memory:')
+    connection.executescript(str(Database.model_commands([USER, PURCHASE])))
+    return connection
+
+
+def test_no_drift(connection):
+    report = Drift.check(connection, [USER, PURCHASE])
+
+    assert report == DriftReport()
+    assert report.ok
+    assert report.messages() == []
+
+
+def test_tables(connection):
+    connection.execute("CREATE TABLE audit (id INTEGER)")
+    connection.execute('DROP TABLE purchase')
+    report = Drift.check(connection, [USER, PURCHASE])
+
+    assert not report.ok
+    assert report.missing_tables == ['purchase']
+    assert report.extra_tables == ['audit']
+    assert report.messages() == ["missing table 'purchase'", "extra table 'audit'"]
+    assert Drift.check(connection, [USER], extra_tables=False).ok
+
+
+def test_columns(connection):
+    connection.executescript("""
+        DROP TABLE user;
+        CREATE TABLE user (id INTEGER(11), score VARCHAR(16), nickname TEXT);
+    """)
+    report = Drift.check(connection, [USER, PURCHASE])
+
+    assert report.missing_columns == {'user': ['email']}
+    assert report.extra_columns == {'user': ['nickname']}
+    assert report.mismatched_types == {'user': [('score', 'DOUBLE(16, 4)', 'VARCHAR(16)')]}
+    assert report.messages() == [
+        "missing column user.email",
+        "extra column user.nickname",
+        "column user.score is 'VARCHAR(16)' instead of 'DOUBLE(16, 4)'"
+    ]
+
+
+def test_introspect(connection):
+    connection.executescript("""
+        CREATE TABLE item (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL REFERENCES user (id), code TEXT UNIQUE);
+        CREATE INDEX item_user ON item (user_id);
+    """)
+    item = Drift.introspect(connection)['item']
+
+    assert [(column.name, column.not_null, column.primary_key) for column in item.columns.values()] == [
+        ('id', False, 1), ('user_id', True, 0), ('code', False, 0)
+    ]
+    assert item.indexes['item_user'] is False
+    assert any(unique for unique in item.indexes.values())
+    assert item.foreign_keys == [('user_id', 'user', 'id')]
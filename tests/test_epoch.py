@@ -0,0 +1,93 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from models import Database, Field, Model, PythonOptions, Synthetic, datatypes as dt
+
+EVENT = Model('Event', [
+    Field('id', dt.INTEGER(11)),
+    Field('at', dt.DATETIME(0)),
+    Field('precise', dt.DATETIME(6)),
+    Field('stamp', dt.TIMESTAMP(0)),
+    Field('took', dt.TIME(6)),
+    Field('duration', dt.TIME(0))
+])
+
+ROW = (1, '2020-01-01 12:30:00', '1969-12-31 23:59:59.250000', '2038-01-19 03:14:07', '-838:59:58.500000',
+       '-00:00:01')
+
+
+@pytest.fixture
+def namespace(generate):
+    return generate(EVENT, PythonOptions(converters=True, table=True, time_epoch=True))
+
+
+@pytest.fixture
+def Event(namespace):
+    return namespace['Event']
+
+
+def test_row_round_trip(Event):
+    event = Event.from_row(ROW)
+
+    assert event.at == (datetime(2020, 1, 1, 12, 30) - datetime(1970, 1, 1)) // timedelta(seconds=1)
+    assert event.precise == -750000
+    assert event.took == -(838 * 3600 + 59 * 60 + 58) * 1000000 - 500000
+    assert event.duration == -1
+    assert event.to_tuple() == ROW
+    assert Event.from_dict(event.to_dict()).__dict__ == event.__dict__
+
+
+def test_properties(Event):
+    event = Event.from_row(ROW)
+
+    assert event.at_datetime == datetime(2020, 1, 1, 12, 30)
+    assert event.precise_datetime == datetime(1969, 12, 31, 23, 59, 59, 250000)
+    assert event.duration_timedelta == timedelta(seconds=-1)
+    assert Event.encode_at(event.at_datetime) == event.at
+
+
+@pytest.mark.parametrize('text', ['00:00:00', '12:34:56', '-00:00:01', '838:59:59', '-838:59:59'])
+def test_time_texts(Event, text):
+    assert Event.format_duration(Event.parse_duration(text)) == text
+    assert Event.format_took(Event.parse_took(text + '.000001')) == text + '.000001'
+
+
+def test_table_append(namespace, Event):
+    table = namespace['EventTable']()
+    table.append(Event.from_row(ROW))
+
+    assert table.get(0).to_tuple() == ROW
+    assert table.as_numpy('at')[0] == datetime(2020, 1, 1, 12, 30)
+
+
+def test_synthetic_rows(Event):
+    for event in Synthetic(seed=1).objects(EVENT, Event.from_row, 200):
+        assert Event.from_row(event.to_tuple()).__dict__ == event.__dict__
+
+
+def test_sqlite_round_trip(Event):
+    connection = sqlite3.connect(':memory:')
+    connection.execute(str(Database.model_command(EVENT)))
+    connection.execute(str(Database.insert_command(EVENT)), Event.from_row(ROW).to_tuple())
+
+    assert Event.from_row(connection.execute('SELECT * FROM event').fetchone()).to_tuple() == ROW
+
+
+def test_default_mode_timedelta(generate):
+    Event = generate(EVENT, PythonOptions(converters=True, json=True))['Event']
+    event = Event.from_row(ROW)
+
+    assert event.took == -timedelta(hours=838, minutes=59, seconds=58, microseconds=500000)
+    assert event.duration == timedelta(seconds=-1)
+    assert event.to_tuple() == ROW
+    assert Event.from_json(event.to_json()).__dict__ == event.__dict__
+
+
+@pytest.mark.parametrize('text', ['00:00:00', '12:34:56', '-00:00:01', '838:59:59', '-838:59:59'])
+def test_default_mode_time_texts(generate, text):
+    Event = generate(EVENT, PythonOptions(converters=True))['Event']
+
+    assert Event.format_duration(Event.parse_duration(text)) == text
+    assert Event.format_took(Event.parse_took(text + '.000001')) == text + '.000001'
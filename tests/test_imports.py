@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.strip()
+
+
+@pytest.mark.parametrize('path', [
+    'models.core', 'models.serializers', 'models.langs', 'models.writers', 'models.aio',
+    'models.datatypes.numeric_data_types'
+])
+def test_submodule_attributes(path):
+    assert _run(f"import models, types; print(isinstance({path}, types.ModuleType))") == 'True'
+
+
+def test_lazy_imports():
+    assert _run(
+        "import sys; from models import Model, datatypes as dt; dt.VARCHAR; "
+        "print(sorted(name for name in ('models.serializers', 'models.langs') if name in sys.modules))"
+    ) == '[]'
+
+
+def test_unknown_attribute():
+    import models
+
+    with pytest.raises(AttributeError):
+        models.missing
+
+
+def test_exports():
+    import models
+    from models import datatypes
+
+    for module in (models, datatypes):
+        assert len(dir(module)) == len(set(dir(module)))
+        assert all(getattr(module, name) is not None for name in module.__all__)
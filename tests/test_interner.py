@@ -0,0 +1,87 @@
+import io
+
+import pytest
+
+from models import (Client, Compiler, Database, Field, JavascriptOptions, Model, PythonOptions, Server, Templates,
+                    datatypes as dt)
+from models.langs import base, javascript as js, python as py
+from models.langs.base import Interner
+
+# models sharing most of their datatypes and field names, so that many subtrees are equal.
+MODELS = [
+    Model(name, [
+        Field('id', dt.INTEGER(11)),
+        Field('name', dt.VARCHAR(64)),
+        Field('ratio', dt.DOUBLE()),
+        Field('created', dt.DATETIME(0)),
+        Field('status', dt.ENUM(['draft', 'active'])),
+        Field('tags', dt.SET(['new', 'sale'])),
+        Field(f'{name.lower()}_note', dt.TEXT(1000))
+    ])
+    for name in ('User', 'Order', 'Invoice', 'Product')
+]
+PYTHON = PythonOptions(converters=True, json=True, table=True, track_changes=True, enum_classes=True)
+JAVASCRIPT = JavascriptOptions(json=True, columns=True, set_bitmask=True)
+
+
+@pytest.fixture(autouse=True)
+def untemplated(monkeypatch):
+    # the templates would skip the construction of the trees.
+    monkeypatch.setattr(Templates, 'enabled', False)
+
+
+def _codes() -> list[bytes]:
+    return [
+        Server.model_classes(MODELS, PYTHON).render_bytes(),
+        *(Client.model_module(model, JAVASCRIPT).render_bytes() for model in MODELS),
+        Database.model_commands(MODELS).render_bytes()
+    ]
+
+
+def _compiled() -> tuple[str, str, str]:
+    streams = io.StringIO(), io.StringIO(), io.StringIO()
+    Compiler(python=PYTHON, javascript=JAVASCRIPT).compile(MODELS, *streams)
+    return tuple(stream.getvalue() for stream in streams)
+
+
+def test_same_bytes():
+    expected = _codes()
+
+    with Interner() as interner:
+        assert _codes() == expected
+        # and again from the memoized tokens.
+        assert _codes() == expected
+
+    assert interner.nodes and interner.tokens
+    assert _codes() == expected
+
+
+def test_same_compiled_code():
+    expected = _compiled()
+
+    with Interner():
+        assert _compiled() == expected
+
+
+def test_shared_nodes():
+    with Interner():
+        first = py.Call(py.Var('f'), py.Args([py.Str('a')]))
+        assert py.Call(py.Var('f'), py.Args([py.Str('a')])) is first
+        # equal values rendered differently aren't merged.
+        assert js.Num(1) is not js.Num(1.0)
+        assert str(js.Num(1)) != str(js.Num(1.0))
+
+    assert py.Call(py.Var('f'), py.Args([py.Str('a')])) is not first
+
+
+def test_nested_interners():
+    with Interner() as outer:
+        with Interner() as inner:
+            node = py.Var('x')
+
+        assert outer.nodes == {} and node in inner.nodes.values()
+        assert py.Var('x') is not node
+
+    # the hooks are removed with the last interner.
+    assert '__call__' not in vars(base._CodeMeta)
+    assert base._ACTIVE == 0
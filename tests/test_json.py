@@ -0,0 +1,63 @@
+import base64
+import json
+import shutil
+import subprocess
+from datetime import date, datetime
+
+import pytest
+
+from models import Client, Field, JavascriptOptions, Model, PythonOptions, datatypes as dt
+
+MEASURE = Model('Measure', [
+    Field('id', dt.BIGINT(20)),
+    Field('sensor', dt.VARCHAR(64)),
+    Field('active', dt.BOOLEAN),
+    Field('value', dt.DOUBLE(16, 4)),
+    Field('day', dt.DATE),
+    Field('taken', dt.DATETIME(6)),
+    Field('payload', dt.BLOB(1024)),
+    Field('note', dt.TEXT(1000))
+])
+
+
+@pytest.fixture
+def Measure(generate):
+    return generate(MEASURE, PythonOptions(json=True))['Measure']
+
+
+@pytest.mark.parametrize('sensor, note', [
+    ('plain', ''),
+    ('quote " and \\ backslash', 'line\nbreak\ttab'),
+    ('unicode é ☃ 𝄞', '\x00\x1f control')
+])
+def test_json_round_trip(Measure, sensor, note):
+    measure = Measure(2 ** 62, sensor, True, -1.25e-7, date(2020, 2, 29), datetime(2020, 1, 1, 12, 30, 0, 500),
+                      b'\x00\xff binary', note)
+    text = measure.to_json()
+
+    assert json.loads(text)['sensor'] == sensor
+    assert Measure.from_json(text).__dict__ == measure.__dict__
+
+
+def test_json_matches_stdlib(Measure):
+    measure = Measure(1, 's', False, 0.1, date(2000, 1, 1), datetime(2000, 1, 1), b'', 'n')
+
+    assert json.loads(measure.to_json()) == {
+        'id': 1, 'sensor': 's', 'active': False, 'value': 0.1, 'day': '2000-01-01', 'taken': '2000-01-01T00:00:00',
+        'payload': '', 'note': 'n'
+    }
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason="node is required to run the javascript")
+@pytest.mark.parametrize('size', [0, 1, 8191, 8192, 8193, 1 << 20])
+def test_javascript_large_blob(tmp_path, size):
+    model = Model('File', [Field('data', dt.LONGBLOB)])
+    payload = bytes(range(256)) * (size // 256) + bytes(size % 256)
+    script = f"""{Client.model_module(model, JavascriptOptions(json=True))}
+        const data = Uint8Array.from(Buffer.from({json.dumps(base64.b64encode(payload).decode())}, 'base64'))
+        process.stdout.write(new File(data).toJson())
+    """
+    (tmp_path / 'script.js').write_text(script)
+    output = subprocess.run(['node', str(tmp_path / 'script.js')], capture_output=True, text=True, check=True).stdout
+
+    assert base64.b64decode(json.loads(output)['data']) == payload
@@ -0,0 +1,94 @@
+import importlib
+import sys
+
+import pytest
+
+from models import Field, Model, PythonOptions, Server, datatypes as dt
+
+MODELS = [
+    Model(name, [Field('id', dt.INTEGER(11)), Field('name', dt.VARCHAR(32))])
+    for name in ('User', 'Order', 'Product')
+]
+
+
+@pytest.fixture
+def load_package(tmp_path, monkeypatch):
+    """Import the package saved under `name` in a temporary directory, a fresh import each time."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def load_package(package, name: str = 'generated'):
+        package.save_to(str(tmp_path / name))
+        for module in [module for module in sys.modules if module == name or module.startswith(name + '.')]:
+            monkeypatch.delitem(sys.modules, module)
+        importlib.invalidate_caches()
+        return importlib.import_module(name)
+
+    return load_package
+
+
+def test_lazy_classes(load_package):
+    package = load_package(Server.model_package(MODELS, PythonOptions(converters=True)))
+
+    assert 'generated.order' not in sys.modules
+    assert package.Order.from_row((1, 'first')).name == 'first'
+    assert 'generated.order' in sys.modules
+    assert 'generated.user' not in sys.modules
+
+
+def test_dir(load_package):
+    package = load_package(Server.model_package(MODELS, models_per_module=2))
+    package.User
+
+    names = dir(package)
+    assert len(names) == len(set(names))
+    assert {'User', 'Order', 'Product'} <= set(names)
+
+
+def test_unknown_class(load_package):
+    package = load_package(Server.model_package(MODELS))
+
+    with pytest.raises(AttributeError):
+        package.Missing
+
+
+def test_save_to_removes_stale_modules(tmp_path, load_package):
+    load_package(Server.model_package(MODELS))
+    (tmp_path / 'generated' / 'notes.txt').write_text('kept')
+    (tmp_path / 'generated' / 'helpers.py').write_text('# not generated, kept\n')
+
+    package = load_package(Server.model_package(MODELS[:2]))
+
+    assert sorted(path.name for path in (tmp_path / 'generated').iterdir() if path.is_file()) == [
+        '__init__.py', 'helpers.py', 'notes.txt', 'order.py', 'user.py'
+    ]
+    with pytest.raises(AttributeError):
+        package.Product
+    with pytest.raises(ImportError):
+        importlib.import_module('generated.product')
+
+
+def test_save_to_skips_unchanged_modules(tmp_path):
+    package = Server.model_package(MODELS)
+
+    assert package.save_to(str(tmp_path)) == len(MODELS) + 1
+    assert package.save_to(str(tmp_path)) == 0
+    assert Server.model_package(MODELS, PythonOptions(json=True)).save_to(str(tmp_path)) == len(MODELS)
+
+
+@pytest.mark.parametrize('init', [
+    '',
+    'not python (',
+    "_MODULES = {'User': '.user', 'Escape': '../outside', 'Absolute': 'os'}\n",
+    '_MODULES = dict(user=".user")\n'
+])
+def test_save_to_removes_indexed_modules_only(tmp_path, init):
+    (tmp_path / '__init__.py').write_text(init)
+    for name in ('user', 'product', 'os'):
+        (tmp_path / f'{name}.py').write_text('')
+    (tmp_path.parent / 'outside.py').write_text('')
+
+    Server.model_package(MODELS[1:2]).save_to(str(tmp_path))
+
+    assert (tmp_path / 'product.py').exists() and (tmp_path / 'os.py').exists()
+    assert (tmp_path.parent / 'outside.py').exists()
+    assert (tmp_path / 'user.py').exists() == ("'.user'" not in init)
@@ -0,0 +1,58 @@
+import pytest
+
+from models import Database, Field, Model, PythonOptions, Server, datatypes as dt
+from models.langs import base
+
+# non ASCII names and values, whose encoded sizes differ from their lengths.
+MODEL = Model('Café', [
+    Field('id', dt.INTEGER(11)),
+    Field('crème', dt.VARCHAR(32)),
+    Field('état', dt.ENUM(['brûlé', 'glacé', '日本']))
+])
+CODES = {
+    'python': lambda: Server.model_class(MODEL, PythonOptions(converters=True, json=True, table=True)),
+    'sql': lambda: Database.model_command(Model('Cafe', MODEL.fields))
+}
+
+
+@pytest.fixture(params=[1, 3, 1 << 12], ids=lambda size: f'chunk{size}')
+def chunk_tokens(request, monkeypatch):
+    monkeypatch.setattr(base, '_CHUNK_TOKENS', request.param)
+    return request.param
+
+
+@pytest.mark.parametrize('target', CODES.keys())
+def test_render_bytes(chunk_tokens, target):
+    code = CODES[target]()
+
+    assert code.render_bytes() == str(code).encode()
+
+
+@pytest.mark.parametrize('target', CODES.keys())
+def test_write_into_bytearray(chunk_tokens, target):
+    code = CODES[target]()
+    expected = str(code).encode()
+    buffer = bytearray(b'head')
+
+    assert code.write_into(buffer, 4) == len(expected)
+    assert buffer == b'head' + expected
+    # overwritten from the middle, the bytearray growing as needed.
+    assert code.write_into(buffer, 2) == len(expected)
+    assert buffer[:2] == b'he' and buffer[2:2 + len(expected)] == expected
+
+
+def test_write_into_memoryview(chunk_tokens):
+    code = CODES['python']()
+    expected = str(code).encode()
+    buffer = bytearray(len(expected) + 8)
+
+    assert code.write_into(memoryview(buffer), 8) == len(expected)
+    assert buffer == bytes(8) + expected
+
+    with pytest.raises(AssertionError, match="doesn't fit"):
+        code.write_into(memoryview(buffer), 9)
+
+
+def test_write_into_offset():
+    with pytest.raises(AssertionError, match="out of the buffer"):
+        CODES['sql']().write_into(bytearray(4), 5)
@@ -0,0 +1,92 @@
+import io
+
+import pytest
+
+from models import Field, Model, Schema, datatypes as dt
+
+MODELS = [
+    Model('User', [
+        Field('id', dt.INTEGER(11)),
+        Field('name', dt.VARCHAR(64)),
+        Field('active', dt.BOOLEAN),
+        Field('role', dt.ENUM(['guest', 'member', 'admin']))
+    ]),
+    Model('Order', [
+        Field('id', dt.BIGINT(20)),
+        Field('total', dt.DECIMAL(10, 2)),
+        Field('note', dt.TEXT(65535)),
+        Field('placed', dt.DATETIME(6)),
+        Field('tags', dt.SET(['gift', 'express']))
+    ]),
+    Model('Empty', [])
+]
+
+
+class CountingReader(io.StringIO):
+    """Stream recording the number of characters read."""
+    consumed = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.consumed += len(chunk)
+        return chunk
+
+
+def dumped_json() -> str:
+    stream = io.StringIO()
+    Schema.dump_json(MODELS, stream)
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 1 << 16])
+def test_json_round_trip(chunk_size):
+    assert list(Schema.iter_json(io.StringIO(dumped_json()), chunk_size)) == MODELS
+
+
+def test_json_is_streamed():
+    text = dumped_json()
+    stream = CountingReader(text)
+    models = Schema.iter_json(stream, chunk_size=16)
+
+    assert next(models) == MODELS[0]
+    assert stream.consumed < len(text)
+    assert list(models) == MODELS[1:]
+    assert stream.consumed == len(text)
+
+
+@pytest.mark.parametrize('text', ['[]', ' [ \n ] ', '[\n' + ',\n'.join(['{"name":"A","fields":[]}'] * 3) + '\n]'])
+def test_json_separators(text):
+    assert list(Schema.iter_json(io.StringIO(text), chunk_size=2)) == [Model('A', [])] * text.count('"A"')
+
+
+@pytest.mark.parametrize('text', ['', '[', dumped_json()[:-10]])
+def test_json_truncated(text):
+    with pytest.raises(Exception):
+        list(Schema.iter_json(io.StringIO(text), chunk_size=8))
+
+
+def test_interned_datatypes():
+    loaded = list(Schema.iter_json(io.StringIO(dumped_json())))
+
+    assert loaded[0].fields[0].datatype is Schema.datatype('INTEGER', [11])
+    assert loaded[1].fields[2].datatype is Schema.datatype('TEXT', (65535,))
+    assert loaded[0].fields[2].datatype is dt.BOOLEAN
+
+
+def test_yaml_round_trip():
+    pytest.importorskip('yaml')
+    stream = io.StringIO()
+    Schema.dump_yaml(iter(MODELS), stream)
+
+    assert list(Schema.iter_yaml(io.StringIO(stream.getvalue()))) == MODELS
+
+
+def test_yaml_list_documents():
+    yaml = pytest.importorskip('yaml')
+    text = yaml.safe_dump_all([[Schema.model_dict(model) for model in MODELS[:2]], None, Schema.model_dict(MODELS[2])])
+
+    assert list(Schema.iter_yaml(io.StringIO(text))) == MODELS
+
+
+def test_pack_round_trip():
+    assert Schema.unpack(Schema.pack(MODELS)) == MODELS
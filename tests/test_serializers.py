@@ -0,0 +1,95 @@
+import io
+from functools import singledispatchmethod
+
+import pytest
+
+from models import (Database, Field, JavascriptOptions, JavascriptSerializer, Model, PythonOptions, PythonSerializer,
+                    SQLSerializer, Serializer, Server, datatypes as dt)
+
+MODELS = [
+    Model('User', [Field('id', dt.INTEGER(11)), Field('name', dt.VARCHAR(64)), Field('joined', dt.DATETIME(0))]),
+    Model('Tag', [Field('id', dt.INTEGER(11)), Field('label', dt.VARCHAR(32))]),
+    Model('Visit', [Field('id', dt.BIGINT(20)), Field('at', dt.DATETIME(6)), Field('day', dt.DATE)])
+]
+
+
+class RecordingSink(io.StringIO):
+    """Sink keeping each of the written texts."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+        return super().write(text)
+
+
+class Tagged(Serializer):
+    def __init__(self):
+        self.resolved = []
+
+    @singledispatchmethod
+    def serialize(self, o) -> str:
+        raise NotImplementedError
+
+    @serialize.register
+    def _(self, o: int) -> str:
+        return f'int:{o}'
+
+    @serialize.register
+    def _(self, o: str) -> str:
+        return f'str:{o}'
+
+    def _implementation(self, cls):
+        self.resolved.append(cls)
+        return super()._implementation(cls)
+
+
+@pytest.mark.parametrize('serializer', [SQLSerializer(), JavascriptSerializer(JavascriptOptions(json=True))],
+                         ids=['sql', 'javascript'])
+def test_joined_serializations(serializer):
+    sink = io.StringIO()
+
+    assert serializer.serialize_many(iter(MODELS), sink) == len(MODELS)
+    assert sink.getvalue() == serializer._SEPARATOR.join(map(serializer.serialize, MODELS))
+
+
+def test_sql_commands():
+    sink = io.StringIO()
+    SQLSerializer().serialize_many(MODELS, sink)
+
+    assert sink.getvalue() == str(Database.model_commands(MODELS))
+
+
+@pytest.mark.parametrize('options', [PythonOptions(), PythonOptions(converters=True, json=True, table=True)],
+                         ids=['default', 'converters'])
+def test_python_module(options):
+    sink = RecordingSink()
+
+    assert PythonSerializer(options).serialize_many(iter(MODELS), sink) == len(MODELS)
+    assert sink.getvalue() == str(Server.model_classes(MODELS, options))
+    # the imports, then each model as soon as it is generated.
+    assert len(sink.writes) == 1 + len(MODELS)
+
+    namespace = {}
+    exec(sink.getvalue(), namespace)
+    assert all(model.name in namespace for model in MODELS)
+
+
+def test_resolved_once_per_type():
+    serializer = Tagged()
+    sink = io.StringIO()
+
+    assert serializer.serialize_many([1, 'a', 2, 'b', 3], sink) == 5
+    assert sink.getvalue() == 'int:1\nstr:a\nint:2\nstr:b\nint:3'
+    assert serializer.resolved == [int, str]
+
+
+@pytest.mark.parametrize('serializer', [SQLSerializer(), JavascriptSerializer(), PythonSerializer(), Tagged()],
+                         ids=['sql', 'javascript', 'python', 'tagged'])
+def test_no_objects(serializer):
+    sink = io.StringIO()
+
+    assert serializer.serialize_many([], sink) == 0
+    assert sink.getvalue() == ''
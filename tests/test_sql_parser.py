@@ -0,0 +1,152 @@
+import io
+
+import pytest
+
+from models import Database, Field, Model, datatypes as dt
+from models.langs import sql, sql_parser
+
+ALL_TYPES = Model('AllTypes', [
+    Field('flag', dt.BOOLEAN),
+    Field('bits', dt.BIT(12)),
+    Field('tiny', dt.TINYINT(4)),
+    Field('small', dt.SMALLINT(6)),
+    Field('medium', dt.MEDIUMINT(9)),
+    Field('integer', dt.INTEGER(11)),
+    Field('big', dt.BIGINT(20)),
+    Field('single', dt.FLOAT(7, 3)),
+    Field('double', dt.DOUBLE(16, 4)),
+    Field('price', dt.DECIMAL(10, 2)),
+    Field('day', dt.DATE),
+    Field('year', dt.YEAR),
+    Field('at', dt.DATETIME(6)),
+    Field('stamp', dt.TIMESTAMP(0)),
+    Field('took', dt.TIME(3)),
+    Field('code', dt.CHAR(2)),
+    Field('name', dt.VARCHAR(64)),
+    Field('digest', dt.BINARY(32)),
+    Field('token', dt.VARBINARY(255)),
+    Field('blob', dt.BLOB(1024)),
+    Field('tiny_blob', dt.TINYBLOB),
+    Field('long_blob', dt.LONGBLOB),
+    Field('text', dt.TEXT(1000)),
+    Field('medium_text', dt.MEDIUMTEXT),
+    Field('status', dt.ENUM(['draft', "it's", 'a,b'])),
+    Field('tags', dt.SET(['new', 'sale']))
+])
+
+
+def _load(dump: str, skipped=None) -> list[Model]:
+    return list(Database.load_models(io.StringIO(dump), skipped))
+
+
+@pytest.mark.parametrize('reorder', [False, True])
+def test_round_trip(reorder):
+    dump = str(Database.model_commands([ALL_TYPES], cfg_reorder=reorder))
+    model, = _load(dump)
+
+    assert model.name == ALL_TYPES.name
+    assert sorted(map(repr, model.fields)) == sorted(map(repr, ALL_TYPES.fields))
+
+
+def test_mysqldump():
+    model, = _load("""
+        -- MySQL dump
+        /*!40101 SET NAMES utf8mb4 */;
+        DROP TABLE IF EXISTS `user_account`;
+        CREATE TABLE `user_account` (
+          `id` int NOT NULL AUTO_INCREMENT COMMENT 'the ''key''',
+          `email` varchar(255) COLLATE utf8mb4_bin NOT NULL,
+          `score` double precision DEFAULT '0',
+          `created` datetime DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+          PRIMARY KEY (`id`),
+          UNIQUE KEY `email` (`email`)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+        INSERT INTO `user_account` VALUES (1,'a@b.c',0,'2020-01-01 00:00:00');
+    """)
+
+    assert model == Model('UserAccount', [
+        Field('id', dt.INTEGER(11)),
+        Field('email', dt.VARCHAR(255)),
+        Field('score', dt.DOUBLE()),
+        Field('created', dt.DATETIME(0))
+    ])
+
+
+def test_unsigned():
+    model, = _load("""
+        CREATE TABLE counters (
+          a TINYINT UNSIGNED, b SMALLINT(5) UNSIGNED, c MEDIUMINT UNSIGNED ZEROFILL, d INT(10) UNSIGNED NOT NULL,
+          e BIGINT UNSIGNED, f INT SIGNED, g DECIMAL(10, 2) UNSIGNED, h INT ZEROFILL
+        );
+    """)
+
+    assert [field.datatype for field in model.fields] == [
+        dt.SMALLINT(6), dt.MEDIUMINT(9), dt.INTEGER(11), dt.BIGINT(20), dt.DECIMAL(20, 0), dt.INTEGER(11),
+        dt.DECIMAL(10, 2), dt.BIGINT(20)
+    ]
+
+
+def test_type_name_unsigned():
+    statement, = sql_parser.parse(io.StringIO("CREATE TABLE t (a INT(10) UNSIGNED);"))
+
+    assert statement.columns[0].datatype == sql.TypeName('INT', ['10'], unsigned=True)
+    assert str(statement.columns[0].datatype) == 'INT(10) UNSIGNED'
+
+
+def test_default_arguments():
+    model, = _load("CREATE TABLE t (a VARCHAR, b VARBINARY, c BINARY, d CHAR, e FLOAT, f DOUBLE, g DECIMAL, h BIT);")
+
+    assert [field.datatype for field in model.fields] == [
+        dt.VARCHAR(255), dt.VARBINARY(255), dt.BINARY(1), dt.CHAR(1), dt.FLOAT(), dt.DOUBLE(), dt.DECIMAL(10, 0),
+        dt.BIT(1)
+    ]
+
+
+def test_float_precision():
+    model, = _load("CREATE TABLE t (a FLOAT(24), b FLOAT(7, 3));")
+
+    assert [field.datatype for field in model.fields] == [dt.FLOAT(24), dt.FLOAT(7, 3)]
+
+
+@pytest.mark.parametrize('column, message', [
+    ('doc JSON', "t.doc : Mapping sql.TypeName -> DataType not found for 'JSON'"),
+    ('name VARCHAR(10, 2)', "t.name : Invalid arguments ['10', '2'] for 'VARCHAR'"),
+    ('name VARCHAR(MAX)', "t.name : Invalid arguments ['MAX'] for 'VARCHAR'"),
+    ('code CHAR(300)', "t.code : Invalid arguments ['300'] for 'CHAR'")
+])
+def test_unsupported_column(column, message):
+    with pytest.raises(ValueError, match=message.replace('[', r'\[').replace('(', r'\(')):
+        _load(f"CREATE TABLE t (id INT, {column});")
+
+
+def test_skipped_columns():
+    skipped = []
+    models = _load("""
+        CREATE TABLE a (id INT, doc JSON, shape GEOMETRY, name VARCHAR(8));
+        CREATE TABLE b (id INT);
+    """, skipped)
+
+    assert models == [
+        Model('A', [Field('id', dt.INTEGER(11)), Field('name', dt.VARCHAR(8))]),
+        Model('B', [Field('id', dt.INTEGER(11))])
+    ]
+    assert skipped == ['a.doc', 'a.shape']
+
+
+ESCAPES_DUMP = r"""
+CREATE TABLE `we``ird` (
+  `id` int NOT NULL COMMENT 'the ''key''', -- trailing 'comment'
+  `note` varchar(32) DEFAULT 'it''s \'x\'' /* a 'block' */,
+  "quoted""name" text DEFAULT 'a\\' NOT NULL
+);
+"""
+
+
+def test_chunk_sizes():
+    tokens = list(sql_parser.tokenize(io.StringIO(ESCAPES_DUMP)))
+    statements = list(sql_parser.parse(io.StringIO(ESCAPES_DUMP)))
+
+    assert ('string', r"'it''s \'x\''", None) in tokens
+    for chunk_size in range(1, len(ESCAPES_DUMP) + 1):
+        assert list(sql_parser.tokenize(io.StringIO(ESCAPES_DUMP), chunk_size)) == tokens, chunk_size
+        assert list(sql_parser.parse(io.StringIO(ESCAPES_DUMP), chunk_size)) == statements, chunk_size
@@ -0,0 +1,43 @@
+import pytest
+
+from models import Field, Model, Synthetic, datatypes as dt
+
+
+@pytest.fixture(params=['numpy', 'random'])
+def synthetic(request):
+    synthetic = Synthetic(seed=7)
+    if request.param == 'random':
+        synthetic._numpy = None
+    elif synthetic._numpy is None:
+        pytest.skip("numpy is not installed")
+    return synthetic
+
+
+@pytest.mark.parametrize('datatype, limit, digits', [
+    (dt.FLOAT(), 10 ** 6, None),
+    (dt.FLOAT(24), 10 ** 6, None),
+    (dt.DOUBLE(d=2), 10 ** 6, 2),
+    (dt.FLOAT(7, 3), 10 ** 4, 3),
+    (dt.DOUBLE(16, 4), 10 ** 12, 4),
+    (dt.DOUBLE(3, 3), 1, 3)
+])
+def test_floats(synthetic, datatype, limit, digits):
+    values = synthetic.column(datatype, 500)
+
+    assert len(values) == 500
+    assert all(isinstance(value, float) and -limit <= value <= limit for value in values)
+    if digits is not None:
+        assert all(round(value, digits) == value for value in values)
+
+
+def test_seeded():
+    model = Model('Sample', [
+        Field('id', dt.BIGINT(20)),
+        Field('ratio', dt.FLOAT(24)),
+        Field('name', dt.VARCHAR(16)),
+        Field('at', dt.DATETIME(0)),
+        Field('tags', dt.SET(['a', 'b', 'c']))
+    ])
+
+    assert list(Synthetic(seed=3).rows(model, 50)) == list(Synthetic(seed=3).rows(model, 50))
+    assert list(Synthetic(seed=3).rows(model, 50)) != list(Synthetic(seed=4).rows(model, 50))
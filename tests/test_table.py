@@ -0,0 +1,18 @@
+from models import Field, Model, PythonOptions, datatypes as dt
+
+SETTING = Model('Setting', [
+    Field('id', dt.INTEGER(11)),
+    Field('enabled', dt.BOOLEAN),
+    Field('ratio', dt.DOUBLE())
+])
+
+
+def test_boolean_reads(generate):
+    namespace = generate(SETTING, PythonOptions(table=True))
+    Setting = namespace['Setting']
+    table = namespace['SettingTable']()
+    table.extend([Setting(1, True, 0.5), Setting(2, False, 1.5)])
+
+    assert [type(table.get(index).enabled) for index in range(2)] == [bool, bool]
+    assert [table[index].enabled for index in range(2)] == [True, False]
+    assert table.get(0).__dict__ == Setting(1, True, 0.5).__dict__
@@ -0,0 +1,74 @@
+import pytest
+
+from models import (Field, JavascriptOptions, JavascriptSerializer, Model, PythonOptions, PythonSerializer,
+                    SQLSerializer, Templates, datatypes as dt)
+
+# the same datatypes under different names, so that the models after the first one are filled in its template.
+DATATYPES = [
+    dt.INTEGER(11), dt.VARCHAR(64), dt.BOOLEAN, dt.DECIMAL(10, 2), dt.DATETIME(6), dt.DATE,
+    dt.ENUM(['draft', 'active']), dt.SET(['new', 'sale']), dt.BLOB(1024)
+]
+NAMES = [
+    ('User', ['id', 'name', 'active', 'balance', 'joined', 'birthday', 'status', 'tags', 'avatar']),
+    ('LineItem', ['line_id', 'sku', 'gift', 'price', 'added_at', 'due', 'state', 'labels', 'picture']),
+    ('Z', ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i']),
+    ('HttpRequest', ['request_id', 'url', 'secure', 'cost', 'sent_at', 'day', 'method', 'flags', 'body'])
+]
+MODELS = [Model(name, [Field(field, datatype) for field, datatype in zip(fields, DATATYPES)]) for name, fields in NAMES]
+
+SERIALIZERS = {
+    'python': PythonSerializer(),
+    'python-converters': PythonSerializer(PythonOptions(converters=True, json=True, table=True, track_changes=True)),
+    'python-modes': PythonSerializer(PythonOptions(
+        converters=True, json=True, table=True, set_bitmask=True, enum_classes=True, time_epoch=True,
+        decimal_scaled=True
+    )),
+    'javascript': JavascriptSerializer(JavascriptOptions(json=True, columns=True)),
+    'javascript-modes': JavascriptSerializer(JavascriptOptions(json=True, columns=True, set_bitmask=True,
+                                                               enum_classes=True)),
+    'sql': SQLSerializer()
+}
+
+
+@pytest.fixture
+def templates(monkeypatch):
+    monkeypatch.setattr(Templates, 'enabled', True)
+    monkeypatch.setattr(Templates, '_cache', {})
+    return Templates
+
+
+def _untemplated(serializer, model: Model) -> str:
+    Templates.enabled = False
+    try:
+        return serializer.serialize(model)
+    finally:
+        Templates.enabled = True
+
+
+@pytest.mark.parametrize('serializer', SERIALIZERS.values(), ids=SERIALIZERS.keys())
+def test_same_text(templates, serializer):
+    for model in MODELS:
+        assert serializer.serialize(model) == _untemplated(serializer, model), model.name
+
+    # a single template for the shape, compiled from the first model.
+    assert len(templates._cache) == 1
+    assert None not in templates._cache.values()
+
+
+def test_placeholder_names_bypass(templates):
+    serializer = SERIALIZERS['python-converters']
+    model = Model('Quiz', [Field('qzslot_abc', dt.INTEGER(11))])
+
+    assert serializer.serialize(model) == _untemplated(serializer, model)
+    assert templates._cache == {}
+
+
+def test_limit(templates, monkeypatch):
+    monkeypatch.setattr(Templates, 'limit', 2)
+    serializer = SERIALIZERS['sql']
+
+    for size in (1, 2, 3):
+        model = Model('User', [Field('id', dt.INTEGER(11)), Field('name', dt.VARCHAR(size))])
+        assert serializer.serialize(model) == _untemplated(serializer, model)
+
+    assert len(templates._cache) == 1
@@ -0,0 +1,113 @@
+import sqlite3
+from decimal import Decimal
+
+import pytest
+
+from models import Database, Field, Model, PythonOptions, datatypes as dt
+
+USER = Model('User', [
+    Field('id', dt.INTEGER(11)),
+    Field('name', dt.VARCHAR(32)),
+    Field('age', dt.INTEGER(11))
+])
+
+
+@pytest.fixture
+def User(generate):
+    return generate(USER, PythonOptions(track_changes=True, converters=True))['User']
+
+
+def test_dirty_fields(User):
+    user = User(1, 'ada', 36)
+    assert user.dirty_fields() == []
+
+    user.age = 37
+    assert user.dirty_fields() == ['age']
+
+    user.mark_clean()
+    assert user.dirty_fields() == []
+
+
+def test_update_batches(User):
+    connection = sqlite3.connect(':memory:')
+    connection.execute(str(Database.model_command(USER)))
+    users = [User(1, 'ada', 36), User(2, 'alan', 41), User(3, 'grace', 85)]
+    connection.executemany(str(Database.insert_command(USER)), [user.to_tuple() for user in users])
+
+    users[0].age = 37
+    users[1].age = 42
+    users[2].name = 'amazing grace'
+    batches = Database.update_batches(USER, users, 'id')
+
+    assert len(batches) == 2
+    for command, parameters in batches:
+        connection.executemany(command, parameters)
+
+    assert connection.execute('SELECT * FROM user ORDER BY id').fetchall() == [
+        (1, 'ada', 37), (2, 'alan', 42), (3, 'amazing grace', 85)
+    ]
+
+
+def test_update_batches_modified_key(User):
+    user = User(1, 'ada', 36)
+    user.id = 2
+
+    with pytest.raises(ValueError, match="'id'"):
+        Database.update_batches(USER, [user], 'id')
+
+
+PRODUCT_FIELDS = [
+    (Field('id', dt.INTEGER(11)), 1, 1),
+    (Field('price', dt.DECIMAL(10, 2)), 99.99, 12.34),
+    (Field('status', dt.ENUM(['draft', 'active', 'archived'])), 'draft', 'archived'),
+    (Field('tags', dt.SET(['new', 'sale', 'featured'])), 'new', 'sale,featured'),
+    (Field('updated', dt.DATETIME(0)), '2020-01-01 00:00:00', '2021-06-15 08:30:00'),
+    (Field('released', dt.DATE), '2020-01-01', '2021-06-15'),
+    # a timedelta, or the integer seconds in epoch mode.
+    (Field('cooldown', dt.TIME(0)), '00:10:00', '-01:02:03')
+]
+
+STORAGE_OPTIONS = {
+    'default': PythonOptions(),
+    'decimal_scaled': PythonOptions(decimal_scaled=True),
+    'enum_classes': PythonOptions(enum_classes=True),
+    'set_bitmask': PythonOptions(set_bitmask=True),
+    'time_epoch': PythonOptions(time_epoch=True),
+    'all': PythonOptions(decimal_scaled=True, enum_classes=True, set_bitmask=True, time_epoch=True)
+}
+
+
+@pytest.mark.parametrize('options', STORAGE_OPTIONS.values(), ids=STORAGE_OPTIONS.keys())
+def test_update_batches_storage_round_trip(generate, monkeypatch, options):
+    model = Model('Product', [field for field, _, _ in PRODUCT_FIELDS])
+    options = PythonOptions(**{**options.__dict__, 'track_changes': True, 'converters': True})
+    Product = generate(model, options)['Product']
+
+    # the MySQL drivers bind the Decimal values of the scaled DECIMAL fields, sqlite needs an adapter.
+    monkeypatch.setitem(sqlite3.adapters, (Decimal, sqlite3.PrepareProtocol), float)
+    # without declared types, so that sqlite keeps the parameters as they are.
+    connection = sqlite3.connect(':memory:')
+    connection.execute(f"CREATE TABLE product ({', '.join(field.name for field in model.fields)})")
+    connection.execute(str(Database.insert_command(model)), tuple(old for _, old, _ in PRODUCT_FIELDS))
+
+    product = Product.from_row(connection.execute('SELECT * FROM product').fetchone())
+    changed = Product.from_row(tuple(new for _, _, new in PRODUCT_FIELDS))
+    for field in model.fields[1:]:
+        setattr(product, field.name, getattr(changed, field.name))
+
+    for command, parameters in Database.update_batches(model, [product], 'id'):
+        connection.executemany(command, parameters)
+
+    assert connection.execute('SELECT * FROM product').fetchone() == tuple(new for _, _, new in PRODUCT_FIELDS)
+
+
+def test_field_names_of_the_generated_locals(generate):
+    model = Model('Bag', [Field(name, dt.VARCHAR(8)) for name in ('id', 'values', 'mask', 'key', 'value', 'bit')])
+    Bag = generate(model, PythonOptions(track_changes=True, converters=True))['Bag']
+    bag = Bag('1', 'abc', 'm', 'k', 'v', 'b')
+
+    assert bag.to_tuple() == ('1', 'abc', 'm', 'k', 'v', 'b')
+    assert bag.dirty_fields() == []
+
+    bag.values = 'def'
+    assert Database.update_batches(model, [bag], 'id')[0][1] == [('def', '1')]
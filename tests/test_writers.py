@@ -0,0 +1,78 @@
+import os
+import stat
+
+import pytest
+
+from models import FileWriter, write_atomic
+from models import writers
+
+
+def test_write_atomic(tmp_path):
+    path = str(tmp_path / 'module.py')
+
+    assert write_atomic(path, b'a = 1\n')
+    assert not write_atomic(path, b'a = 1\n')
+    assert write_atomic(path, b'a = 2\n', fsync=True)
+
+    with open(path, 'rb') as file:
+        assert file.read() == b'a = 2\n'
+    assert os.listdir(tmp_path) == ['module.py']
+
+
+def test_write_atomic_same_size(tmp_path):
+    path = str(tmp_path / 'module.py')
+    write_atomic(path, b'a = 1\n')
+
+    assert write_atomic(path, b'b = 1\n')
+
+
+def test_write_atomic_keeps_mode(tmp_path):
+    path = str(tmp_path / 'script.py')
+    write_atomic(path, b'old\n')
+    os.chmod(path, 0o751)
+
+    write_atomic(path, b'new\n')
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o751
+
+
+def test_write_atomic_failure(tmp_path, monkeypatch):
+    path = str(tmp_path / 'module.py')
+    write_atomic(path, b'old\n')
+
+    def replace(src, dst):
+        raise OSError("rename failed")
+
+    monkeypatch.setattr(writers.os, 'replace', replace)
+
+    with pytest.raises(OSError, match="rename failed"):
+        write_atomic(path, b'new\n')
+
+    with open(path, 'rb') as file:
+        assert file.read() == b'old\n'
+    assert os.listdir(tmp_path) == ['module.py']
+
+
+def test_file_writer(tmp_path):
+    files = {str(tmp_path / f'module_{index}.py'): f'value = {index}\n'.encode() for index in range(20)}
+    write_atomic(next(iter(files)), files[next(iter(files))])
+
+    with FileWriter(max_workers=4) as writer:
+        writer.write_many(files.items())
+
+    assert writer.written == len(files) - 1
+    for path, data in files.items():
+        with open(path, 'rb') as file:
+            assert file.read() == data
+
+
+def test_file_writer_error(tmp_path):
+    writer = FileWriter()
+    writer.write(str(tmp_path / 'ok.py'), b'')
+    writer.write(str(tmp_path / 'missing' / 'ko.py'), b'')
+
+    with pytest.raises(FileNotFoundError):
+        writer.close()
+
+    assert writer.written == 1
+    assert os.listdir(tmp_path) == ['ok.py']